@@ -0,0 +1 @@
+# Lets the tests import `lib` and `scripts` however pytest is started
@@ -0,0 +1,86 @@
+import tempfile
+from bisect import insort
+from typing import Iterable, Iterator, List, Tuple
+from lib.spill import RUN_SIZE, SpillCounter
+
+
+def sorted_counts(
+    rows: Iterable[Tuple[str, int]], run_size: int = RUN_SIZE
+) -> Iterator[Tuple[str, int]]:
+    """
+    Sort names and sum the counts of repeated names, in bounded memory.
+
+    Names are sorted by their lowercase form first, so names sharing a
+    case-insensitive prefix are consecutive. Up to `run_size` distinct names
+    are counted in memory at a time. When there are more, each batch is written
+    to a temporary file as a sorted run, and the runs are merged at the end
+    (see `lib/spill.py`).
+
+    Args:
+        rows (Iterable[Tuple[str, int]]): (name, count) pairs, in any order.
+        run_size (int, optional): Maximum number of distinct names held in
+            memory. Defaults to RUN_SIZE.
+
+    Yields:
+        Tuple[str, int]: Each distinct name and its total count, ordered by
+            lowercase name and then name.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        counter = SpillCounter(directory, run_size=run_size)
+        counter.update(rows)
+        yield from counter.sorted_counts()
+
+
+def top_suggestions(
+    counts: Iterable[Tuple[str, int]], max_prefix_length: int, limit: int
+) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Find the best completions of every prefix of a sorted list of names.
+
+    Because the names are sorted, the names sharing a prefix are consecutive,
+    so only the prefixes of the current name are open at any time and each is
+    emitted as soon as the names move past it. Memory use is bounded by
+    `max_prefix_length * limit`, however many names there are. Prefixes are
+    lowercase; a name is not suggested for a prefix equal to itself, matching
+    the autocomplete query.
+
+    Args:
+        counts (Iterable[Tuple[str, int]]): (name, count) pairs of distinct
+            names ordered by lowercase name, e.g. from `sorted_counts()`.
+        max_prefix_length (int): Length of the longest prefix indexed.
+        limit (int): Maximum number of suggestions per prefix.
+
+    Yields:
+        Tuple[str, List[str]]: A prefix and its suggestions, most frequent
+            first and then shortest first; prefixes with no suggestions are
+            skipped.
+    """
+    # Open prefixes, shortest first, with their best (-count, length, name) ranks
+    open_prefixes: List[Tuple[str, List[Tuple[int, int, str]]]] = []
+
+    def close(depth: int) -> Iterator[Tuple[str, List[str]]]:
+        while len(open_prefixes) > depth:
+            prefix, ranks = open_prefixes.pop()
+            if ranks:
+                yield prefix, [name for _, _, name in ranks]
+
+    for name, count in counts:
+        key = name.lower()
+        depth = 0
+        while depth < len(open_prefixes) and key.startswith(open_prefixes[depth][0]):
+            depth += 1
+        yield from close(depth)
+        for length in range(depth + 1, min(max_prefix_length, len(key)) + 1):
+            open_prefixes.append((key[:length], []))
+
+        # Every name competing for a prefix also competes for the shorter ones,
+        # so once the name misses a prefix's top ranks it misses all shorter ones
+        rank = (-count, len(name), name)
+        for prefix, ranks in reversed(open_prefixes):
+            if len(prefix) == len(key):
+                continue
+            if len(ranks) == limit and rank >= ranks[-1]:
+                break
+            insort(ranks, rank)
+            del ranks[limit:]
+    yield from close(0)
@@ -0,0 +1,90 @@
+import sqlite3
+from typing import Dict, Iterable, Sequence, Tuple
+
+# SQLite limits the number of parameters in a single statement
+MAX_VARIABLES = 900
+
+
+class ResultCache:
+    """
+    Persistent SQLite cache mapping raw recipe names to processing results.
+
+    Every entry belongs to a rule fingerprint. Opening the cache with a
+    different fingerprint than the one it was built with discards all entries,
+    so results computed under old rules are never returned. Each worker process
+    opens its own connection; the database runs in WAL mode so they can read
+    while another writes.
+    """
+
+    def __init__(self, path: str, fingerprint: str):
+        """
+        Open (or create) the cache and invalidate it if the rules changed.
+
+        Args:
+            path (str): Path of the SQLite database file.
+            fingerprint (str): Fingerprint of the rules the results depend on.
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self.connection = sqlite3.connect(path, timeout=60)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "name TEXT PRIMARY KEY, processed TEXT NOT NULL, reason TEXT NOT NULL)"
+            )
+            row = self.connection.execute(
+                "SELECT value FROM meta WHERE key = 'fingerprint'"
+            ).fetchone()
+            if row is None or row[0] != fingerprint:
+                self.connection.execute("DELETE FROM results")
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('fingerprint', ?)",
+                    (fingerprint,),
+                )
+
+    def get_many(self, names: Sequence[str]) -> Dict[str, Tuple[str, str]]:
+        """
+        Look up the cached results of several raw names.
+
+        Args:
+            names (Sequence[str]): Raw recipe names to look up.
+
+        Returns:
+            Dict[str, Tuple[str, str]]: (processed, reason) for each cached name.
+        """
+        found = {}
+        for i in range(0, len(names), MAX_VARIABLES):
+            batch = names[i : i + MAX_VARIABLES]
+            placeholders = ",".join("?" * len(batch))
+            rows = self.connection.execute(
+                f"SELECT name, processed, reason FROM results "
+                f"WHERE name IN ({placeholders})",
+                batch,
+            )
+            for name, processed, reason in rows:
+                found[name] = (processed, reason)
+        return found
+
+    def put_many(self, results: Iterable[Tuple[str, str, str]]) -> None:
+        """
+        Store the results of several raw names in a single transaction.
+
+        Args:
+            results (Iterable[Tuple[str, str, str]]): (name, processed, reason)
+                tuples to store.
+        """
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO results (name, processed, reason) "
+                "VALUES (?, ?, ?)",
+                results,
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
@@ -0,0 +1,111 @@
+import itertools
+import os
+from typing import Iterable, Iterator, Tuple
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# File extensions of the columnar formats, by --format choice
+COLUMNAR_EXTENSIONS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+# Columns of columnar output; extra columns may follow and are ignored on read
+NAME_COLUMN = "name"
+COUNT_COLUMN = "count"
+SCHEMA = pa.schema([(NAME_COLUMN, pa.string()), (COUNT_COLUMN, pa.int64())])
+
+# Number of rows per record batch (and Parquet row group) when writing and reading
+BATCH_SIZE = 65_536
+
+
+def is_columnar(file_path: str) -> bool:
+    """
+    Check whether a file is in one of the columnar formats, by its extension.
+
+    Args:
+        file_path (str): Path or name of the file.
+
+    Returns:
+        bool: True for Parquet and Arrow IPC files.
+    """
+    _, extension = os.path.splitext(file_path)
+    return extension.lower() in COLUMNAR_EXTENSIONS.values()
+
+
+def write_names(names: Iterable[Tuple[str, int]], file_path: str) -> int:
+    """
+    Write names and their occurrence counts to a Parquet or Arrow IPC file.
+
+    The format follows the extension. Rows are written a batch at a time as
+    the names are consumed, so the names can be streamed. Parquet files are
+    zstd-compressed, which makes them the smallest; Arrow IPC files are left
+    uncompressed, so readers can use their memory-mapped batches without
+    decoding them.
+
+    Args:
+        names (Iterable[Tuple[str, int]]): Each name and its occurrence count.
+        file_path (str): Path of the `.parquet` or `.arrow` file.
+
+    Returns:
+        int: Number of names written.
+    """
+    if file_path.lower().endswith(COLUMNAR_EXTENSIONS["parquet"]):
+        writer = pq.ParquetWriter(file_path, SCHEMA, compression="zstd")
+    else:
+        writer = pa.ipc.new_file(file_path, SCHEMA)
+
+    written = 0
+    rows = iter(names)
+    with writer:
+        while batch := list(itertools.islice(rows, BATCH_SIZE)):
+            batch_names, counts = zip(*batch)
+            writer.write_batch(
+                pa.record_batch(
+                    [pa.array(batch_names, pa.string()), pa.array(counts, pa.int64())],
+                    schema=SCHEMA,
+                )
+            )
+            written += len(batch)
+    return written
+
+
+def iter_batches(file_path: str) -> Iterator[pa.RecordBatch]:
+    """
+    Read the record batches of a Parquet or Arrow IPC file, memory-mapped.
+
+    Arrow IPC batches point straight into the mapped file, so reading them
+    copies nothing; Parquet files are mapped and decoded a row group at a time.
+
+    Args:
+        file_path (str): Path of the `.parquet` or `.arrow` file.
+
+    Yields:
+        pa.RecordBatch: The file's batches, in order.
+    """
+    if file_path.lower().endswith(COLUMNAR_EXTENSIONS["parquet"]):
+        parquet_file = pq.ParquetFile(file_path, memory_map=True)
+        yield from parquet_file.iter_batches(batch_size=BATCH_SIZE)
+        return
+    with pa.memory_map(file_path) as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i)
+
+
+def iter_names(file_path: str) -> Iterator[Tuple[str, int]]:
+    """
+    Stream names and occurrence counts from a Parquet or Arrow IPC file.
+
+    Each batch is converted to Python objects with one call per column.
+    Files without a count column count each name once.
+
+    Args:
+        file_path (str): Path of the `.parquet` or `.arrow` file.
+
+    Yields:
+        Tuple[str, int]: The next name and its occurrence count.
+    """
+    for batch in iter_batches(file_path):
+        names = batch.column(NAME_COLUMN).to_pylist()
+        if COUNT_COLUMN in batch.schema.names:
+            yield from zip(names, batch.column(COUNT_COLUMN).to_pylist())
+        else:
+            yield from zip(names, itertools.repeat(1))
@@ -4,6 +4,10 @@ from typing import Set
 # Matches any character that is not a lowercase letter, number, space, apostrophe, hyphen, or ampersand
 CLEAN_REGEX = re.compile(r"[^a-z0-9\s\'\-&]")
 
+# Matches any character that is not a letter (in any alphabet, including
+# accented letters), ASCII digit, space, apostrophe, hyphen, or ampersand
+UNICODE_CLEAN_REGEX = re.compile(r"[^\w\s\'\-&]|_|[^\D0-9]")
+
 
 # Matches one or more whitespace characters
 SPACE_REGEX = re.compile(r"\s+")
@@ -363,3 +367,443 @@ CULINARY_TERMS: Set[str] = {
     "flavorful",
     "aromatic",
 }
+
+# Promotional words in French recipe names
+FRENCH_FILTER_WORDS: Set[str] = {
+    "meilleur",
+    "meilleure",
+    "délicieux",
+    "délicieuse",
+    "facile",
+    "rapide",
+    "simple",
+    "super",
+    "génial",
+    "parfait",
+    "parfaite",
+    "incroyable",
+    "ultime",
+    "très",
+    "vraiment",
+    "mon",
+    "ma",
+    "mes",
+    "miam",
+    "recette",
+}
+
+# French culinary terms, matched like CULINARY_TERMS
+FRENCH_CULINARY_TERMS: Set[str] = {
+    # Dishes
+    "ratatouille",
+    "quiche",
+    "crêpe",
+    "crêpes",
+    "soupe",
+    "potage",
+    "velouté",
+    "gratin",
+    "tarte",
+    "tartine",
+    "omelette",
+    "salade",
+    "ragoût",
+    "cassoulet",
+    "confit",
+    "blanquette",
+    "bouillabaisse",
+    "pot-au-feu",
+    "croque-monsieur",
+    "coq au vin",
+    "bœuf bourguignon",
+    "choucroute",
+    "terrine",
+    "pâté",
+    "rillettes",
+    "purée",
+    "frites",
+    "galette",
+    "tian",
+    "tapenade",
+    "vinaigrette",
+    "sauce",
+    # Baking and desserts
+    "gâteau",
+    "pain",
+    "brioche",
+    "croissant",
+    "baguette",
+    "clafoutis",
+    "financier",
+    "madeleines",
+    "macarons",
+    "mousse",
+    "soufflé",
+    "flan",
+    "crème brûlée",
+    "tarte tatin",
+    "chocolat",
+    # Ingredients
+    "bœuf",
+    "boeuf",
+    "poulet",
+    "canard",
+    "porc",
+    "agneau",
+    "veau",
+    "jambon",
+    "saumon",
+    "thon",
+    "poisson",
+    "moules",
+    "crevettes",
+    "homard",
+    "fromage",
+    "beurre",
+    "crème",
+    "champignons",
+    "pommes de terre",
+    "pommes",
+    "poires",
+    "fraises",
+    "citron",
+    "ail",
+    "oignons",
+    "tomates",
+    "courgettes",
+    "aubergines",
+    "épinards",
+    "haricots",
+    "lentilles",
+    "riz",
+    "pâtes",
+    "légumes",
+    # Cooking methods
+    "rôti",
+    "grillé",
+    "farci",
+    "sauté",
+    "braisé",
+    "poêlée",
+    "mijoté",
+}
+
+# Promotional words in German recipe names
+GERMAN_FILTER_WORDS: Set[str] = {
+    "beste",
+    "bester",
+    "bestes",
+    "lecker",
+    "leckere",
+    "leckerer",
+    "einfach",
+    "einfache",
+    "schnell",
+    "schnelle",
+    "super",
+    "perfekt",
+    "toll",
+    "genial",
+    "mein",
+    "meine",
+    "sehr",
+    "wirklich",
+    "rezept",
+}
+
+# German culinary terms, matched like CULINARY_TERMS
+GERMAN_CULINARY_TERMS: Set[str] = {
+    # Dishes
+    "suppe",
+    "eintopf",
+    "braten",
+    "schnitzel",
+    "wurst",
+    "bratwurst",
+    "sauerkraut",
+    "kartoffelsalat",
+    "knödel",
+    "klöße",
+    "spätzle",
+    "maultaschen",
+    "rouladen",
+    "sauerbraten",
+    "gulasch",
+    "auflauf",
+    "salat",
+    "soße",
+    "pfannkuchen",
+    "schweinebraten",
+    # Baking and desserts
+    "kuchen",
+    "torte",
+    "strudel",
+    "apfelstrudel",
+    "brezel",
+    "brot",
+    "brötchen",
+    "lebkuchen",
+    "stollen",
+    "plätzchen",
+    "käsekuchen",
+    "schwarzwälder kirschtorte",
+    # Ingredients
+    "hähnchen",
+    "huhn",
+    "rindfleisch",
+    "schwein",
+    "lamm",
+    "fisch",
+    "lachs",
+    "forelle",
+    "hering",
+    "käse",
+    "quark",
+    "sahne",
+    "butter",
+    "schokolade",
+    "äpfel",
+    "apfel",
+    "birnen",
+    "kirschen",
+    "zwiebeln",
+    "spargel",
+    "kohl",
+    "rotkohl",
+    "grünkohl",
+    "linsen",
+    "bohnen",
+    "nudeln",
+    "reis",
+    "pilze",
+    "gemüse",
+    "kartoffeln",
+    "zimt",
+    "senf",
+    "speck",
+    "schinken",
+    # Cooking methods
+    "gebraten",
+    "gebacken",
+    "gefüllt",
+    "geschmort",
+    "überbacken",
+}
+
+# Promotional words in Italian recipe names
+ITALIAN_FILTER_WORDS: Set[str] = {
+    "migliore",
+    "delizioso",
+    "deliziosa",
+    "facile",
+    "veloce",
+    "semplice",
+    "super",
+    "perfetto",
+    "perfetta",
+    "fantastico",
+    "fantastica",
+    "mio",
+    "mia",
+    "molto",
+    "davvero",
+    "buonissimo",
+    "buonissima",
+    "ricetta",
+}
+
+# Italian culinary terms, matched like CULINARY_TERMS
+ITALIAN_CULINARY_TERMS: Set[str] = {
+    # Dishes
+    "pasta",
+    "pizza",
+    "risotto",
+    "lasagna",
+    "lasagne",
+    "spaghetti",
+    "penne",
+    "fettuccine",
+    "tagliatelle",
+    "ravioli",
+    "tortellini",
+    "gnocchi",
+    "polenta",
+    "minestrone",
+    "zuppa",
+    "brodo",
+    "focaccia",
+    "bruschetta",
+    "crostini",
+    "carbonara",
+    "bolognese",
+    "pesto",
+    "ragù",
+    "sugo",
+    "salsa",
+    "arrosto",
+    "brasato",
+    "ossobuco",
+    "saltimbocca",
+    "parmigiana",
+    "frittata",
+    "insalata",
+    "caprese",
+    # Baking and desserts
+    "tiramisù",
+    "panna cotta",
+    "cannoli",
+    "biscotti",
+    "torta",
+    "crostata",
+    "gelato",
+    "pane",
+    # Ingredients
+    "pollo",
+    "manzo",
+    "maiale",
+    "vitello",
+    "agnello",
+    "pesce",
+    "salmone",
+    "tonno",
+    "gamberi",
+    "cozze",
+    "vongole",
+    "funghi",
+    "pomodoro",
+    "pomodori",
+    "melanzane",
+    "zucchine",
+    "spinaci",
+    "fagioli",
+    "ceci",
+    "lenticchie",
+    "patate",
+    "formaggio",
+    "mozzarella",
+    "ricotta",
+    "parmigiano",
+    "pecorino",
+    "burro",
+    "aglio",
+    "cipolla",
+    "basilico",
+    "limone",
+    "cioccolato",
+    # Cooking methods
+    "al forno",
+    "alla griglia",
+    "fritto",
+    "fritti",
+    "ripieni",
+    "ripiene",
+    "in umido",
+}
+
+# Promotional words in Spanish recipe names
+SPANISH_FILTER_WORDS: Set[str] = {
+    "mejor",
+    "delicioso",
+    "deliciosa",
+    "fácil",
+    "rápido",
+    "rápida",
+    "sencillo",
+    "sencilla",
+    "super",
+    "perfecto",
+    "perfecta",
+    "increíble",
+    "mi",
+    "mis",
+    "muy",
+    "riquísimo",
+    "riquísima",
+    "receta",
+}
+
+# Spanish culinary terms, matched like CULINARY_TERMS
+SPANISH_CULINARY_TERMS: Set[str] = {
+    # Dishes
+    "paella",
+    "tortilla",
+    "gazpacho",
+    "salmorejo",
+    "sopa",
+    "caldo",
+    "cocido",
+    "guiso",
+    "estofado",
+    "fabada",
+    "croquetas",
+    "empanada",
+    "empanadas",
+    "tapas",
+    "patatas bravas",
+    "arroz",
+    "pisto",
+    "migas",
+    "albóndigas",
+    "tacos",
+    "enchiladas",
+    "quesadillas",
+    "tamales",
+    "mole",
+    "guacamole",
+    "salsa",
+    "ensalada",
+    # Baking and desserts
+    "churros",
+    "flan",
+    "arroz con leche",
+    "torrijas",
+    "pan",
+    "tarta",
+    "bizcocho",
+    "galletas",
+    "chocolate",
+    # Ingredients
+    "pollo",
+    "carne",
+    "cerdo",
+    "ternera",
+    "cordero",
+    "pescado",
+    "bacalao",
+    "atún",
+    "salmón",
+    "gambas",
+    "calamares",
+    "pulpo",
+    "mejillones",
+    "chorizo",
+    "jamón",
+    "queso",
+    "huevos",
+    "patatas",
+    "tomate",
+    "tomates",
+    "cebolla",
+    "ajo",
+    "pimientos",
+    "berenjenas",
+    "calabacín",
+    "espinacas",
+    "garbanzos",
+    "lentejas",
+    "judías",
+    "frijoles",
+    "leche",
+    "limón",
+    "naranja",
+    # Cooking methods
+    "asado",
+    "asada",
+    "frito",
+    "frita",
+    "al horno",
+    "a la plancha",
+    "relleno",
+    "rellenos",
+    "rellenas",
+}
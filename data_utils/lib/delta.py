@@ -0,0 +1,58 @@
+from typing import Iterable, Iterator, Optional, Tuple
+
+# Kinds of change between two snapshots of a table
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+
+def sort_key(name: str) -> Tuple[str, str]:
+    """
+    Get the key names are ordered by, matching `sorted_counts()`.
+
+    Args:
+        name (str): The name.
+
+    Returns:
+        Tuple[str, str]: The lowercase name, then the name.
+    """
+    return name.lower(), name
+
+
+def diff_sorted(
+    previous: Iterable[Tuple[str, int]], current: Iterable[Tuple[str, int]]
+) -> Iterator[Tuple[str, str, int]]:
+    """
+    Compare two snapshots of names and counts with a single sorted merge.
+
+    Both snapshots must hold distinct names ordered by `sort_key()`, e.g.
+    from `sorted_counts()`, so each name is compared once with the head of
+    the other snapshot instead of being looked up, and memory use does not
+    depend on the size of either snapshot.
+
+    Args:
+        previous (Iterable[Tuple[str, int]]): (name, count) pairs of the
+            snapshot the table currently holds.
+        current (Iterable[Tuple[str, int]]): (name, count) pairs of the new
+            snapshot.
+
+    Yields:
+        Tuple[str, str, int]: The kind of change (ADDED, REMOVED or CHANGED),
+            the name, and its count in the new snapshot (in the previous one
+            for removed names), in name order.
+    """
+    previous, current = iter(previous), iter(current)
+    old: Optional[Tuple[str, int]] = next(previous, None)
+    new: Optional[Tuple[str, int]] = next(current, None)
+    while old is not None or new is not None:
+        if new is None or (old is not None and sort_key(old[0]) < sort_key(new[0])):
+            yield REMOVED, old[0], old[1]
+            old = next(previous, None)
+        elif old is None or sort_key(new[0]) < sort_key(old[0]):
+            yield ADDED, new[0], new[1]
+            new = next(current, None)
+        else:
+            if old[1] != new[1]:
+                yield CHANGED, new[0], new[1]
+            old = next(previous, None)
+            new = next(current, None)
@@ -0,0 +1,161 @@
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Optional, Sequence
+import pyarrow as pa
+from lib.columnar import NAME_COLUMN
+
+# Number of input rows copied into each shared memory block
+BLOCK_ROWS = 200_000
+
+# Seconds of worker time each dispatched range should take once the cost per
+# name has been measured; long enough that the per-task IPC round trip is
+# negligible, short enough that workers finish the last ranges together
+TARGET_TASK_SECONDS = 0.2
+
+# Bounds of the number of names per dispatched range
+MIN_TASK_SIZE = 100
+MAX_TASK_SIZE = 50_000
+
+# Weight of the latest measurement in the moving average of the cost per name
+COST_SMOOTHING = 0.2
+
+# Number of blocks a worker keeps attached, so ranges of consecutive blocks
+# arriving in turn do not attach and detach a block every time
+ATTACHED_BLOCKS = 2
+
+# Shared blocks hold a single column of names, nulls for missing values
+SCHEMA = pa.schema([(NAME_COLUMN, pa.large_string())])
+
+
+def share_resource_tracker() -> None:
+    """
+    Start the resource tracker before any worker process is started.
+
+    Attaching to shared memory registers it with the resource tracker, which
+    unlinks whatever is still registered once its processes exit. Workers
+    forked before the tracker runs would each start their own, and unlink the
+    blocks (with a warning) when they exit; workers started afterwards share
+    the tracker, where the creating process unregisters each block when it
+    releases it.
+    """
+    resource_tracker.ensure_running()
+
+
+class SharedBlock:
+    """
+    A block of names in shared memory, which workers read ranges of.
+
+    The names are stored as a serialized Arrow record batch, i.e. string
+    offsets followed by the UTF-8 data, so tasks only carry the block's name
+    and a (start, end) range, and workers read the names without unpickling
+    or copying the block. The creating process owns the segment and frees it
+    with `release()`.
+    """
+
+    def __init__(self, names: Sequence[Optional[str]]):
+        """
+        Args:
+            names (Sequence[Optional[str]]): Names to share; None and NaN are
+                stored as nulls.
+        """
+        batch = pa.record_batch(
+            [pa.array(names, pa.large_string(), from_pandas=True)], schema=SCHEMA
+        )
+        data = batch.serialize()
+        self.rows = batch.num_rows
+        self.memory = shared_memory.SharedMemory(create=True, size=data.size)
+        self.memory.buf[: data.size] = memoryview(data).cast("B")
+        self.name = self.memory.name
+
+    def release(self) -> None:
+        """Free the shared memory once no range of the block is being processed."""
+        self.memory.close()
+        self.memory.unlink()
+
+
+class BlockReader:
+    """
+    Read ranges of shared blocks in a worker process.
+
+    Blocks are attached on first use and the last ATTACHED_BLOCKS stay
+    attached. A block that was released while still attached is only freed
+    once it is detached. Workers must share the resource tracker of the
+    process that creates the blocks (see `share_resource_tracker()`).
+    """
+
+    def __init__(self):
+        self.blocks: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def read(self, block: str, start: int, end: int) -> List[Optional[str]]:
+        """
+        Read a range of names from a shared block.
+
+        Args:
+            block (str): Name of the block's shared memory.
+            start (int): Index of the first name.
+            end (int): Index after the last name.
+
+        Returns:
+            List[Optional[str]]: The names, with None for missing values.
+        """
+        if block in self.blocks:
+            self.blocks.move_to_end(block)
+        else:
+            memory = shared_memory.SharedMemory(block)
+            batch = pa.ipc.read_record_batch(pa.py_buffer(memory.buf), SCHEMA)
+            self.blocks[block] = (memory, batch.column(0))
+            while len(self.blocks) > ATTACHED_BLOCKS:
+                self.detach(next(iter(self.blocks)))
+        column = self.blocks[block][1]
+        return column.slice(start, end - start).to_pylist()
+
+    def detach(self, block: str) -> None:
+        """
+        Detach a block, dropping the arrays that point into it first.
+
+        Args:
+            block (str): Name of the block's shared memory.
+        """
+        memory, column = self.blocks.pop(block)
+        del column
+        memory.close()
+
+
+class TaskSizer:
+    """
+    Size dispatched ranges so each takes about the same time to process.
+
+    Starts at a fixed size and adapts to a moving average of the measured
+    cost per name, which varies with the input (e.g. how many names repeat,
+    or reach the tagger).
+    """
+
+    def __init__(self, initial: int, target_seconds: float = TARGET_TASK_SECONDS):
+        """
+        Args:
+            initial (int): Number of names per range until a cost is measured,
+                and always if `target_seconds` is 0.
+            target_seconds (float, optional): Seconds of worker time per range.
+                Defaults to TARGET_TASK_SECONDS.
+        """
+        self.size = initial
+        self.target_seconds = target_seconds
+        self.cost: Optional[float] = None
+
+    def record(self, names: int, seconds: float) -> None:
+        """
+        Record how long a worker took to process a range.
+
+        Args:
+            names (int): Number of names in the range.
+            seconds (float): Seconds the worker spent processing them.
+        """
+        if not self.target_seconds or not names or seconds <= 0:
+            return
+        cost = seconds / names
+        if self.cost is None:
+            self.cost = cost
+        else:
+            self.cost += COST_SMOOTHING * (cost - self.cost)
+        size = int(self.target_seconds / self.cost)
+        self.size = max(MIN_TASK_SIZE, min(MAX_TASK_SIZE, size))
@@ -0,0 +1,171 @@
+import csv
+import hashlib
+import io
+import json
+import os
+import sys
+from typing import BinaryIO, Dict, Iterator, Tuple
+
+# Number of bytes read at a time when hashing files
+BLOCK_SIZE = 1024 * 1024
+
+
+class FileSlice(io.RawIOBase):
+    """
+    Read-only view of a binary file that ends at a fixed byte offset.
+
+    Reading starts at the file's current position, so rows appended while a
+    run is in progress are left for the next run.
+    """
+
+    def __init__(self, file: BinaryIO, end: int):
+        """
+        Args:
+            file (BinaryIO): File opened in binary mode, positioned at the start.
+            end (int): Byte offset at which reading stops.
+        """
+        self.file = file
+        self.end = end
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        remaining = self.end - self.file.tell()
+        if remaining <= 0:
+            return 0
+        data = self.file.read(min(len(buffer), remaining))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def complete_size(path: str, start: int = 0) -> int:
+    """
+    Get the size of a file up to the end of its last complete CSV record.
+
+    The records are parsed with the csv module, so a newline inside a quoted
+    field is not taken for the end of a record. A quoted field still open at
+    the end of the file may still be being written, so its record is left for
+    the next run. A last record without a trailing newline is complete.
+
+    Args:
+        path (str): Path of the file.
+        start (int, optional): Byte offset to scan from; must be at the start
+            of a record. Defaults to 0.
+
+    Returns:
+        int: Byte offset just after the last complete record, or `start` if
+            there is none.
+    """
+    size = start
+    position = start
+    exhausted = False
+
+    def lines(f: BinaryIO) -> Iterator[str]:
+        nonlocal position, exhausted
+        for line in f:
+            position += len(line)
+            # Latin-1 maps every byte to one character, and UTF-8 continuation
+            # bytes are never quotes or newlines
+            yield line.decode("latin-1")
+        exhausted = True
+
+    field_limit = csv.field_size_limit()
+    csv.field_size_limit(sys.maxsize)
+    try:
+        with open(path, "rb") as f:
+            f.seek(start)
+            # The reader only asks for another line to finish an open quoted
+            # field, so a record read after the last line is incomplete
+            for _ in csv.reader(lines(f)):
+                if exhausted:
+                    break
+                size = position
+    finally:
+        csv.field_size_limit(field_limit)
+    return size
+
+
+def can_resume_at(path: str, offset: int) -> bool:
+    """
+    Check whether the rows of a file past a byte offset can be read on their own.
+
+    They cannot if the file is shorter than the offset, or if a last record
+    without a trailing newline was continued since the offset was recorded.
+
+    Args:
+        path (str): Path of the file.
+        offset (int): Byte offset after the last record of the previous run.
+
+    Returns:
+        bool: True if reading can start at the offset.
+    """
+    if offset > os.path.getsize(path):
+        return False
+    if offset == 0:
+        return True
+    with open(path, "rb") as f:
+        f.seek(offset - 1)
+        last, following = f.read(1), f.read(1)
+    return last == b"\n" or following in (b"", b"\n", b"\r")
+
+
+def hash_prefixes(path: str, old_offset: int, new_offset: int) -> Tuple[str, str]:
+    """
+    Hash the first `old_offset` and `new_offset` bytes of a file in one pass.
+
+    Args:
+        path (str): Path of the file.
+        old_offset (int): Length of the prefix recorded by the previous run.
+        new_offset (int): Length of the prefix processed by this run; must not
+            be smaller than `old_offset`.
+
+    Returns:
+        Tuple[str, str]: SHA-256 hex digests of both prefixes.
+    """
+    digest = hashlib.sha256()
+    old_digest = None
+    position = 0
+    with open(path, "rb") as f:
+        while position < new_offset:
+            if old_digest is None and position == old_offset:
+                old_digest = digest.hexdigest()
+            limit = old_offset if position < old_offset else new_offset
+            block = f.read(min(BLOCK_SIZE, limit - position))
+            if not block:
+                break
+            digest.update(block)
+            position += len(block)
+    if old_digest is None:
+        old_digest = digest.hexdigest()
+    return old_digest, digest.hexdigest()
+
+
+def load_manifest(path: str) -> Dict:
+    """
+    Load the manifest of a previous incremental run.
+
+    Args:
+        path (str): Path of the manifest file.
+
+    Returns:
+        Dict: The manifest, or an empty manifest if the file does not exist.
+    """
+    if not os.path.exists(path):
+        return {"files": {}}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_manifest(path: str, manifest: Dict) -> None:
+    """
+    Save the manifest of an incremental run, replacing the file atomically.
+
+    Args:
+        path (str): Path of the manifest file.
+        manifest (Dict): The manifest to save.
+    """
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_path, path)
@@ -0,0 +1,100 @@
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Set
+from lib.constants import (
+    CULINARY_TERMS,
+    FILTER_WORDS,
+    FRENCH_CULINARY_TERMS,
+    FRENCH_FILTER_WORDS,
+    GERMAN_CULINARY_TERMS,
+    GERMAN_FILTER_WORDS,
+    ITALIAN_CULINARY_TERMS,
+    ITALIAN_FILTER_WORDS,
+    SPANISH_CULINARY_TERMS,
+    SPANISH_FILTER_WORDS,
+)
+
+
+@dataclass(frozen=True, eq=False)
+class Language:
+    """
+    A language recipe names are validated in and routed to.
+
+    Attributes:
+        name (str): Lowercase name, used in file names and on the command line.
+        table (str): Recipe name table of the language in the API schema.
+        allowed_single_chars (FrozenSet[str]): Single-character words allowed
+            in recipe names.
+        culinary_terms (Set[str]): A valid recipe name contains at least one.
+        filter_words (Set[str]): A valid recipe name contains none of them.
+        tag_proper_nouns (bool): Reject names with proper nouns or possessive
+            pronouns, found by the NLTK part-of-speech tagger, which only
+            supports English.
+        check_profanity (bool): Screen names with the profanity classifier,
+            which is only trained on English.
+        unicode_letters (bool): Keep letters outside ASCII when cleaning
+            names, after NFC normalization. English names are reduced to
+            ASCII, like the words of the NLTK words corpus.
+    """
+
+    name: str
+    table: str
+    allowed_single_chars: FrozenSet[str]
+    culinary_terms: Set[str] = field(repr=False)
+    filter_words: Set[str] = field(repr=False)
+    tag_proper_nouns: bool = False
+    check_profanity: bool = False
+    unicode_letters: bool = True
+
+    @property
+    def label(self) -> str:
+        """str: Capitalized name, used in removal reasons."""
+        return self.name.title()
+
+
+# Language of the NLTK words corpus, the tagger and the profanity classifier
+DEFAULT_LANGUAGE = "english"
+
+# Languages with a recipe name table in packages/api/migrations
+LANGUAGES: Dict[str, Language] = {
+    language.name: language
+    for language in [
+        Language(
+            "english",
+            "english_recipes",
+            frozenset({"a", "&", "n", "o"}),
+            CULINARY_TERMS,
+            FILTER_WORDS,
+            tag_proper_nouns=True,
+            check_profanity=True,
+            unicode_letters=False,
+        ),
+        Language(
+            "french",
+            "french_recipes",
+            frozenset({"à", "a", "y", "&"}),
+            FRENCH_CULINARY_TERMS,
+            FRENCH_FILTER_WORDS,
+        ),
+        Language(
+            "german",
+            "german_recipes",
+            frozenset({"&"}),
+            GERMAN_CULINARY_TERMS,
+            GERMAN_FILTER_WORDS,
+        ),
+        Language(
+            "italian",
+            "italian_recipes",
+            frozenset({"a", "e", "o", "&"}),
+            ITALIAN_CULINARY_TERMS,
+            ITALIAN_FILTER_WORDS,
+        ),
+        Language(
+            "spanish",
+            "spanish_recipes",
+            frozenset({"a", "y", "o", "e", "&"}),
+            SPANISH_CULINARY_TERMS,
+            SPANISH_FILTER_WORDS,
+        ),
+    ]
+}
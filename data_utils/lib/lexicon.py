@@ -0,0 +1,80 @@
+import os
+from typing import Iterable, Iterator, Sequence
+import numpy as np
+
+
+class Lexicon:
+    """
+    Read-only set of strings stored as a sorted, memory-mapped array.
+
+    Entries are UTF-8 encoded into a fixed-width numpy bytes array, sorted and
+    saved as a `.npy` file. Opening the file memory-maps it, so every process
+    that opens the same lexicon shares one copy of it through the page cache
+    instead of holding its own Python set. Membership is a binary search, and
+    `contains_many()` looks up a whole batch of strings in one vectorized call.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a lexicon file written by `Lexicon.build()`.
+
+        Args:
+            path (str): Path of the `.npy` lexicon file.
+        """
+        self.path = path
+        self.entries = np.load(path, mmap_mode="r")
+        self.width = self.entries.dtype.itemsize
+
+    @staticmethod
+    def build(words: Iterable[str], path: str) -> None:
+        """
+        Write a lexicon file, replacing any existing file atomically.
+
+        Args:
+            words (Iterable[str]): Entries of the lexicon; may contain spaces.
+            path (str): Path of the `.npy` lexicon file to write.
+        """
+        encoded = sorted({word.encode("utf-8") for word in words})
+        width = max((len(entry) for entry in encoded), default=1)
+        entries = np.array(encoded, dtype=f"S{width}")
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp.npy"
+        np.save(temp_path, entries)
+        os.replace(temp_path, path)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[str]:
+        for entry in self.entries:
+            yield entry.decode("utf-8")
+
+    def __contains__(self, word: str) -> bool:
+        data = word.encode("utf-8")
+        if len(data) > self.width or not len(self.entries):
+            return False
+        index = np.searchsorted(self.entries, data)
+        return index < len(self.entries) and self.entries[index] == data
+
+    def contains_many(self, words: Sequence[str]) -> np.ndarray:
+        """
+        Look up a batch of strings at once.
+
+        Args:
+            words (Sequence[str]): Strings to look up.
+
+        Returns:
+            np.ndarray: Boolean array, True where the string is in the lexicon.
+        """
+        if not len(words) or not len(self.entries):
+            return np.zeros(len(words), dtype=bool)
+        encoded = [word.encode("utf-8") for word in words]
+        # Longer strings would be truncated to the width, so they never match
+        fits = np.fromiter(
+            (len(data) <= self.width for data in encoded), dtype=bool, count=len(words)
+        )
+        queries = np.array(encoded, dtype=f"S{self.width}")
+        indexes = np.searchsorted(self.entries, queries)
+        np.minimum(indexes, len(self.entries) - 1, out=indexes)
+        return fits & (self.entries[indexes] == queries)
@@ -0,0 +1,123 @@
+from typing import Sequence
+import numpy as np
+
+# Number of MinHash functions, split into LSH bands of BAND_ROWS rows each.
+# Two names with Jaccard similarity s share at least one band with probability
+# 1 - (1 - s^BAND_ROWS)^BANDS: about 0.98 at s = 0.7 and 0.05 at s = 0.3.
+NUM_HASHES = 32
+BAND_ROWS = 4
+BANDS = NUM_HASHES // BAND_ROWS
+
+# Shingles are the 4-byte windows of the UTF-8 encoded name, packed into a uint32
+SHINGLE_SIZE = 4
+
+# Parameters of the hash functions, fixed so every worker computes the same ones
+_rng = np.random.default_rng(20240917)
+_MULTIPLIERS = _rng.integers(0, 2**63, NUM_HASHES, dtype=np.uint64) * 2 + 1
+_OFFSETS = _rng.integers(0, 2**63, NUM_HASHES, dtype=np.uint64)
+_BAND_MULTIPLIERS = _rng.integers(0, 2**63, BAND_ROWS, dtype=np.uint64) * 2 + 1
+
+
+def minhash_signatures(names: Sequence[str]) -> np.ndarray:
+    """
+    Compute the MinHash signatures of a batch of names.
+
+    Each name is padded with a space on both sides and split into overlapping
+    4-byte shingles, which are hashed with NUM_HASHES multiply-shift hash
+    functions; a signature holds the minimum of each function over the name's
+    shingles. The whole batch is hashed with a few vectorized operations, and
+    shingles shared by several names are only hashed once.
+
+    Args:
+        names (Sequence[str]): Names to sign; must not be empty.
+
+    Returns:
+        np.ndarray: uint32 array of shape (len(names), NUM_HASHES).
+    """
+    encoded = [f" {name} ".encode("utf-8") for name in names]
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint32)
+
+    # Pack every window of 4 bytes, then keep those within a single name
+    shingles = data[:-3] << 24 | data[1:-2] << 16 | data[2:-1] << 8 | data[3:]
+    owners = np.repeat(np.arange(len(encoded)), lengths)
+    shingles = shingles[owners[:-3] == owners[3:]]
+    starts = np.concatenate(([0], np.cumsum(lengths - SHINGLE_SIZE + 1)[:-1]))
+
+    unique, inverse = np.unique(shingles, return_inverse=True)
+    hashes = (unique.astype(np.uint64)[:, None] * _MULTIPLIERS + _OFFSETS) >> np.uint64(
+        32
+    )
+    return np.minimum.reduceat(hashes.astype(np.uint32)[inverse], starts, axis=0)
+
+
+def band_keys(signatures: np.ndarray) -> np.ndarray:
+    """
+    Hash each LSH band of the signatures into a single key.
+
+    Args:
+        signatures (np.ndarray): Signatures from `minhash_signatures()`.
+
+    Returns:
+        np.ndarray: uint64 array of shape (len(signatures), BANDS).
+    """
+    bands = signatures.reshape(len(signatures), BANDS, BAND_ROWS).astype(np.uint64)
+    return (bands * _BAND_MULTIPLIERS).sum(axis=2, dtype=np.uint64)
+
+
+def find_canonicals(
+    signatures: np.ndarray, ranks: np.ndarray, threshold: float
+) -> np.ndarray:
+    """
+    Map every name to the canonical form of its cluster of near duplicates.
+
+    Names that share a band key are candidates. Rather than comparing every
+    pair of candidates, each one is only compared with the best ranked name
+    in its bucket, so the work grows linearly with the number of names. The
+    best ranked names then claim the names that matched them, best first; a
+    name that was claimed cannot claim others, so every name is similar to its
+    canonical form itself and clusters never chain through intermediate names.
+
+    Args:
+        signatures (np.ndarray): Signatures from `minhash_signatures()`.
+        ranks (np.ndarray): Preference of each name as a canonical form; lower
+            is better, and no two names may have the same rank.
+        threshold (float): Minimum fraction of equal signature values (the
+            estimated Jaccard similarity of the shingle sets) for a match.
+
+    Returns:
+        np.ndarray: Index of the canonical form of each name, which is the
+            name's own index if it has no near duplicate.
+    """
+    keys = band_keys(signatures)
+    members, heads = [], []
+    for band in range(BANDS):
+        order = np.lexsort((ranks, keys[:, band]))
+        sorted_keys = keys[order, band]
+        first = np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+        band_heads = order[first][np.cumsum(first) - 1][~first]
+        band_members = order[~first]
+        similarity = (signatures[band_members] == signatures[band_heads]).mean(axis=1)
+        matched = similarity >= threshold
+        members.append(band_members[matched])
+        heads.append(band_heads[matched])
+
+    members = np.concatenate(members)
+    heads = np.concatenate(heads)
+    canonicals = np.arange(len(signatures))
+    claimed = np.zeros(len(signatures), dtype=bool)
+
+    # Let heads claim their members, best ranked head first
+    order = np.lexsort((ranks[members], ranks[heads]))
+    members, heads = members[order], heads[order]
+    boundaries = np.flatnonzero(np.diff(heads)) + 1
+    for head, group in zip(
+        heads[np.concatenate(([0], boundaries))] if len(heads) else [],
+        np.split(members, boundaries),
+    ):
+        if claimed[head]:
+            continue
+        group = group[~claimed[group]]
+        canonicals[group] = head
+        claimed[group] = True
+    return canonicals
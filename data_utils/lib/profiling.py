@@ -0,0 +1,161 @@
+import contextlib
+import cProfile
+import json
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from multiprocessing.util import Finalize
+from typing import Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class StageStats:
+    """
+    Per-stage call counts and cumulative time.
+
+    Like `RuleStats`, each worker collects its own stats, which are merged
+    with `update()` the same way removal reason counters are.
+    """
+
+    calls: Counter = field(default_factory=Counter)
+    seconds: Counter = field(default_factory=Counter)
+
+    def update(self, other: "StageStats") -> None:
+        """
+        Add the counts and timings of another StageStats to this one.
+
+        Args:
+            other (StageStats): Stats to merge in.
+        """
+        self.calls.update(other.calls)
+        self.seconds.update(other.seconds)
+
+    def add(self, stage: str, seconds: float, calls: int = 1) -> None:
+        """
+        Record time spent in a stage.
+
+        Args:
+            stage (str): Name of the stage.
+            seconds (float): Time spent.
+            calls (int, optional): Number of items processed. Defaults to 1.
+        """
+        self.seconds[stage] += seconds
+        self.calls[stage] += calls
+
+    def rows(self) -> Iterator[Tuple[str, int, float]]:
+        """
+        Iterate over the stats of every stage, in the order first recorded.
+
+        Yields:
+            Tuple[str, int, float]: Stage name, calls and seconds.
+        """
+        for stage, seconds in self.seconds.items():
+            yield stage, self.calls[stage], seconds
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """
+        Convert the stats to a JSON serializable dictionary.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Calls and seconds of each stage.
+        """
+        return {
+            stage: {"calls": calls, "seconds": seconds}
+            for stage, calls, seconds in self.rows()
+        }
+
+
+@contextlib.contextmanager
+def timed(stats: Optional[StageStats], stage: str, calls: int = 1) -> Iterator[None]:
+    """
+    Time the body of a `with` block as a stage, if profiling is enabled.
+
+    Args:
+        stats (Optional[StageStats]): Stats to record the stage in, or None
+            to do nothing.
+        stage (str): Name of the stage.
+        calls (int, optional): Number of items processed. Defaults to 1.
+    """
+    if stats is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.add(stage, time.perf_counter() - start, calls)
+
+
+def timed_iter(
+    items: Iterable[T], stats: Optional[StageStats], stage: str
+) -> Iterator[T]:
+    """
+    Time how long each item of an iterable takes to produce, as a stage.
+
+    Args:
+        items (Iterable[T]): Items to pass through, e.g. chunks being read.
+        stats (Optional[StageStats]): Stats to record the stage in, or None
+            to pass the items through untimed.
+        stage (str): Name of the stage.
+
+    Yields:
+        T: The items, unchanged.
+    """
+    if stats is None:
+        yield from items
+        return
+    iterator = iter(items)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            stats.add(stage, time.perf_counter() - start, 0)
+            return
+        stats.add(stage, time.perf_counter() - start)
+        yield item
+
+
+def start_process_profile(directory: str) -> str:
+    """
+    Profile the current process with cProfile until it exits.
+
+    The profile is written to `<directory>/<pid>.prof` by a multiprocessing
+    finalizer, which runs when a pool worker exits after the pool is closed
+    (but not when the pool is terminated).
+
+    Args:
+        directory (str): Directory to write the profile to.
+
+    Returns:
+        str: Path of the profile file.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{os.getpid()}.prof")
+    profiler = cProfile.Profile()
+
+    def dump() -> None:
+        profiler.disable()
+        profiler.dump_stats(path)
+
+    Finalize(None, dump, exitpriority=10)
+    profiler.enable()
+    return path
+
+
+def save_report(path: str, report: Dict) -> None:
+    """
+    Save a profiling report as JSON, replacing the file atomically.
+
+    Args:
+        path (str): Path of the report file.
+        report (Dict): The report to save.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(report, f, indent=2)
+    os.replace(temp_path, path)
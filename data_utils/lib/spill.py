@@ -0,0 +1,142 @@
+import heapq
+import os
+import pickle
+from collections import Counter
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Number of distinct names counted in memory before a sorted run is spilled to disk
+RUN_SIZE = 500_000
+
+# Number of names per block when writing and reading sorted runs
+BLOCK_SIZE = 10_000
+
+
+class SpillCounter:
+    """
+    Count names in bounded memory by spilling sorted runs to disk.
+
+    Up to `run_size` distinct names are counted in memory at a time. When
+    there are more, they are written to the directory as a sorted run of
+    pickled (lowercase name, name, count) blocks, and counting starts over.
+    `merge_runs()` combines the runs into one sorted stream.
+    """
+
+    def __init__(self, directory: str, prefix: str = "run", run_size: int = RUN_SIZE):
+        """
+        Args:
+            directory (str): Directory to write the runs to; created when the
+                first run is spilled.
+            prefix (str, optional): Prefix of the run file names, which must be
+                unique among the counters sharing the directory. Defaults to
+                "run".
+            run_size (int, optional): Maximum number of distinct names held in
+                memory. Defaults to RUN_SIZE.
+        """
+        self.directory = directory
+        self.prefix = prefix
+        self.run_size = run_size
+        self.counts = Counter()
+        self.paths: List[str] = []
+
+    def update(self, rows: Iterable[Tuple[str, int]]) -> None:
+        """
+        Count names, spilling a run whenever the in-memory counts are full.
+
+        Args:
+            rows (Iterable[Tuple[str, int]]): (name, count) pairs, in any order.
+        """
+        for name, count in rows:
+            self.counts[name] += count
+            if len(self.counts) >= self.run_size:
+                self.spill()
+
+    def spill(self) -> None:
+        """Write the in-memory counts to a new sorted run, if there are any."""
+        if not self.counts:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{self.prefix}_{len(self.paths):05d}.run")
+        with open(path, "wb") as f:
+            for block in sorted_blocks(self.counts):
+                pickle.dump(block, f, pickle.HIGHEST_PROTOCOL)
+        self.paths.append(path)
+        self.counts = Counter()
+
+    def sorted_counts(self) -> Iterator[Tuple[str, int]]:
+        """
+        Merge the spilled runs with the names still counted in memory.
+
+        Yields:
+            Tuple[str, int]: Each distinct name and its total count, ordered
+                by lowercase name and then name.
+        """
+        return merge_runs(self.paths, self.counts)
+
+
+def sorted_blocks(counts: Counter) -> Iterator[List[Tuple[str, str, int]]]:
+    """
+    Sort counted names into blocks of (lowercase name, name, count) tuples.
+
+    Args:
+        counts (Counter): Counts of distinct names.
+
+    Yields:
+        List[Tuple[str, str, int]]: Consecutive blocks of the sorted names.
+    """
+    items = sorted((name.lower(), name, count) for name, count in counts.items())
+    for i in range(0, len(items), BLOCK_SIZE):
+        yield items[i : i + BLOCK_SIZE]
+
+
+def read_run(f: BinaryIO) -> Iterator[Tuple[str, str, int]]:
+    """
+    Read back a sorted run written as pickled blocks.
+
+    Args:
+        f (BinaryIO): The run file, opened in binary mode.
+
+    Yields:
+        Tuple[str, str, int]: The run's (lowercase name, name, count) tuples.
+    """
+    while True:
+        try:
+            yield from pickle.load(f)
+        except EOFError:
+            return
+
+
+def merge_runs(
+    paths: Sequence[str], counts: Optional[Counter] = None
+) -> Iterator[Tuple[str, int]]:
+    """
+    Merge sorted runs with a k-way merge, summing the counts of repeated names.
+
+    Only one block of each run is in memory at a time, so memory use depends
+    on the number of runs rather than the number of names.
+
+    Args:
+        paths (Sequence[str]): Paths of runs written by `SpillCounter`.
+        counts (Optional[Counter], optional): Names counted in memory to merge
+            in as well. Defaults to None.
+
+    Yields:
+        Tuple[str, int]: Each distinct name and its total count, ordered by
+            lowercase name and then name.
+    """
+    files = [open(path, "rb") for path in paths]
+    try:
+        runs = [read_run(f) for f in files]
+        if counts:
+            runs.append(item for block in sorted_blocks(counts) for item in block)
+        current, total = None, 0
+        for _, name, count in heapq.merge(*runs):
+            if name != current:
+                if current is not None:
+                    yield current, total
+                current, total = name, 0
+            total += count
+        if current is not None:
+            yield current, total
+    finally:
+        for f in files:
+            f.close()
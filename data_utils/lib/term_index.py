@@ -0,0 +1,55 @@
+from typing import Dict, Iterable, Optional, Sequence
+
+# Key marking the end of a term in a trie node; it can never collide with a token
+_TERMINAL = None
+
+
+class TermIndex:
+    """
+    Token trie over a set of (possibly multi-word) terms.
+
+    Terms are split on single spaces into tokens and stored in a trie of nested
+    dicts, so a tokenized name can be searched for any term in a single pass
+    without building a string for every token span.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        """
+        Build the trie from a collection of lowercase terms.
+
+        Args:
+            terms (Iterable[str]): Terms to index, e.g. "soy sauce".
+        """
+        self._root: Dict[Optional[str], dict] = {}
+        for term in terms:
+            node = self._root
+            for token in term.split(" "):
+                node = node.setdefault(token, {})
+            node[_TERMINAL] = {}
+
+    def contains_any(self, tokens: Sequence[str]) -> bool:
+        """
+        Check whether any contiguous span of tokens forms an indexed term.
+
+        Matching is case-insensitive and stops at the first hit. This is
+        equivalent to testing `" ".join(tokens[i:j]).lower() in terms` for every
+        span, but only walks as deep as the longest term from each position.
+
+        Args:
+            tokens (Sequence[str]): Tokens of the name to search.
+
+        Returns:
+            bool: True if at least one term occurs in the tokens.
+        """
+        root = self._root
+        lowered = [token.lower() for token in tokens]
+        count = len(lowered)
+        for i in range(count):
+            node = root
+            for j in range(i, count):
+                node = node.get(lowered[j])
+                if node is None:
+                    break
+                if _TERMINAL in node:
+                    return True
+        return False
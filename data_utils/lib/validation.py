@@ -0,0 +1,211 @@
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import groupby
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    A single validation rule applied to a recipe name.
+
+    Attributes:
+        name (str): Short identifier used in the statistics report.
+        reason (str): Removal reason recorded when the rule rejects a name.
+        cost (float): Estimated cost of running the rule, in microseconds per name.
+        check (Callable[[Any], bool]): Returns True if the name passes the rule.
+        prepare (Optional[Callable[[List[Any]], None]]): Optional hook that
+            precomputes what `check` needs for a whole batch of names at once,
+            used by `RulePipeline.validate_batch()`.
+    """
+
+    name: str
+    reason: str
+    cost: float
+    check: Callable[[Any], bool]
+    prepare: Optional[Callable[[List[Any]], None]] = None
+
+
+@dataclass
+class RuleStats:
+    """
+    Per-rule call counts, rejection counts and cumulative time.
+
+    Each worker collects its own stats, which are merged with `update()` the
+    same way removal reason counters are.
+    """
+
+    calls: Counter = field(default_factory=Counter)
+    rejections: Counter = field(default_factory=Counter)
+    seconds: Counter = field(default_factory=Counter)
+
+    def update(self, other: "RuleStats") -> None:
+        """
+        Add the counts and timings of another RuleStats to this one.
+
+        Args:
+            other (RuleStats): Stats to merge in.
+        """
+        self.calls.update(other.calls)
+        self.rejections.update(other.rejections)
+        self.seconds.update(other.seconds)
+
+    def rows(self, rules: Sequence[Rule]) -> Iterator[Tuple[str, int, int, float]]:
+        """
+        Iterate over the stats of the given rules, in the order given.
+
+        Args:
+            rules (Sequence[Rule]): Rules to report, e.g. `RulePipeline.rules`.
+
+        Yields:
+            Tuple[str, int, int, float]: Rule name, calls, rejections and seconds.
+        """
+        for rule in rules:
+            name = rule.name
+            yield name, self.calls[name], self.rejections[name], self.seconds[name]
+
+
+def order_rules(rules: Sequence[Rule]) -> List[Rule]:
+    """
+    Order rules so the cheapest run first without changing removal reasons.
+
+    A name is rejected with the reason of the first rule it fails, in the order
+    the rules are given. Reordering rules that record different reasons would
+    therefore change the reason counts, so only consecutive rules sharing a
+    reason are sorted by cost (the sort is stable, so ties keep their order).
+
+    Args:
+        rules (Sequence[Rule]): Rules in order of reason precedence.
+
+    Returns:
+        List[Rule]: Rules in evaluation order.
+    """
+    ordered = []
+    for _, group in groupby(rules, key=lambda rule: rule.reason):
+        ordered.extend(sorted(group, key=lambda rule: rule.cost))
+    return ordered
+
+
+class RulePipeline:
+    """
+    An ordered cascade of validation rules that stops at the first rejection.
+    """
+
+    def __init__(self, rules: Sequence[Rule]):
+        """
+        Build the pipeline from rules given in order of reason precedence.
+
+        Args:
+            rules (Sequence[Rule]): Rules to run; see `order_rules()`.
+        """
+        self.rules = order_rules(rules)
+
+    def validate(self, candidate: Any, stats: Optional[RuleStats] = None) -> str:
+        """
+        Run the rules against a candidate until one rejects it.
+
+        Args:
+            candidate (Any): The value passed to each rule's check.
+            stats (Optional[RuleStats], optional): Stats to record calls,
+                rejections and timings in. Defaults to None.
+
+        Returns:
+            str: The removal reason of the rejecting rule, or "" if all passed.
+        """
+        if stats is None:
+            for rule in self.rules:
+                if not rule.check(candidate):
+                    return rule.reason
+            return ""
+
+        for rule in self.rules:
+            start = time.perf_counter()
+            passed = rule.check(candidate)
+            stats.seconds[rule.name] += time.perf_counter() - start
+            stats.calls[rule.name] += 1
+            if not passed:
+                stats.rejections[rule.name] += 1
+                return rule.reason
+        return ""
+
+    def validate_batch(
+        self, candidates: Sequence[Any], stats: Optional[RuleStats] = None
+    ) -> List[str]:
+        """
+        Run the rules against a batch of candidates, one rule at a time.
+
+        Each rule only sees the candidates that passed the rules before it, and
+        rules with a `prepare` hook get to process all of those at once. Every
+        candidate meets the rules in the same order as in `validate()`, so the
+        results are identical.
+
+        Args:
+            candidates (Sequence[Any]): The values passed to each rule's check.
+            stats (Optional[RuleStats], optional): Stats to record calls,
+                rejections and timings in. Defaults to None.
+
+        Returns:
+            List[str]: The removal reason for each candidate, or "" if it passed.
+        """
+        return [
+            rule.reason if rule else "" for rule in self.reject_batch(candidates, stats)
+        ]
+
+    def reject_batch(
+        self, candidates: Sequence[Any], stats: Optional[RuleStats] = None
+    ) -> List[Optional[Rule]]:
+        """
+        Run the rules against a batch of candidates, like `validate_batch()`.
+
+        Args:
+            candidates (Sequence[Any]): The values passed to each rule's check.
+            stats (Optional[RuleStats], optional): Stats to record calls,
+                rejections and timings in. Defaults to None.
+
+        Returns:
+            List[Optional[Rule]]: The rule that rejected each candidate, or
+                None if it passed.
+        """
+        rejected_by: List[Optional[Rule]] = [None] * len(candidates)
+        remaining = list(range(len(candidates)))
+        for rule in self.rules:
+            if not remaining:
+                break
+            start = time.perf_counter()
+            if rule.prepare is not None:
+                rule.prepare([candidates[i] for i in remaining])
+            survivors = []
+            for i in remaining:
+                if rule.check(candidates[i]):
+                    survivors.append(i)
+                else:
+                    rejected_by[i] = rule
+            if stats is not None:
+                stats.seconds[rule.name] += time.perf_counter() - start
+                stats.calls[rule.name] += len(remaining)
+                stats.rejections[rule.name] += len(remaining) - len(survivors)
+            remaining = survivors
+        return rejected_by
+
+    def record_repeats(
+        self, rule: Optional[Rule], stats: RuleStats, count: int = 1
+    ) -> None:
+        """
+        Count repeats of a candidate whose result was reused instead of validated.
+
+        The repeats are counted as calls of every rule the candidate went
+        through, and as rejections of the rule that rejected it, so the stats
+        count occurrences the way removal reasons do. No time is added.
+
+        Args:
+            rule (Optional[Rule]): The rule that rejected the candidate, or
+                None if it passed.
+            stats (RuleStats): Stats to record the calls and rejections in.
+            count (int, optional): Number of repeats. Defaults to 1.
+        """
+        for pipeline_rule in self.rules:
+            stats.calls[pipeline_rule.name] += count
+            if pipeline_rule is rule:
+                stats.rejections[rule.name] += count
+                return
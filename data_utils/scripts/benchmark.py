@@ -0,0 +1,1183 @@
+import argparse
+import contextlib
+import csv
+import io
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sqlite3
+import string
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+import numpy as np
+from lib.constants import CULINARY_TERMS, FILTER_WORDS
+from lib.lexicon import Lexicon
+from lib.near_duplicates import find_canonicals, minhash_signatures
+from lib.term_index import TermIndex
+
+# Number of entries in the NLTK words corpus, the size of the English lexicon
+LEXICON_SIZE = 236_736
+
+# Number of names scored one at a time by the profanity benchmark, and
+# processed one at a time by the suite
+PER_NAME_SAMPLE = 2_000
+
+# Project root, and where the suite writes its results by default
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "data", "benchmarks")
+
+# Input sizes the suite runs at by default
+SUITE_SIZES = [10_000, 100_000, 1_000_000]
+
+# Approximate shares of the kinds of rows in the raw recipe dumps; the rest
+# are plain names drawn from sample_token_lists()
+SYNTHETIC_MIX: Dict[str, float] = {
+    "nan": 0.02,
+    "digits": 0.04,
+    "proper_noun": 0.05,
+    "long": 0.06,
+    "punctuation": 0.10,
+}
+
+# Share of rows repeating an earlier row, popular names more often than others
+DUPLICATE_SHARE = 0.35
+
+# Possessives and proper nouns that recipe names often start with
+PROPER_NOUNS: List[str] = [
+    "Paula Deen's",
+    "Emeril's",
+    "Ina Garten's",
+    "Martha Stewart's",
+    "Bobby Flay's",
+    "Aunt Mary's",
+    "My",
+    "Our",
+]
+
+# Filler words mixed into synthetic names so that not every name matches a term
+FILLER_WORDS: List[str] = [
+    "the",
+    "with",
+    "and",
+    "style",
+    "homemade",
+    "mom's",
+    "old",
+    "fashioned",
+    "country",
+    "baked",
+    "golden",
+    "green",
+    "red",
+    "little",
+    "big",
+]
+
+
+def sample_token_lists(count: int, seed: int = 0) -> List[List[str]]:
+    """
+    Build a reproducible corpus of tokenized recipe-like names.
+
+    Names are one to five tokens long and mix filler words, filter words and
+    the tokens of culinary terms (including multi-word terms such as
+    "soy sauce"), so matches occur at every position and some names have none.
+
+    Args:
+        count (int): Number of names to generate.
+        seed (int, optional): Seed for the random generator. Defaults to 0.
+
+    Returns:
+        List[List[str]]: The tokens of each generated name.
+    """
+    rng = random.Random(seed)
+    term_tokens = sorted({token for term in CULINARY_TERMS for token in term.split()})
+    vocabulary = term_tokens + FILLER_WORDS * 8 + sorted(FILTER_WORDS)
+    multi_word_terms = sorted(term for term in CULINARY_TERMS if " " in term)
+
+    names = []
+    for _ in range(count):
+        tokens = [rng.choice(vocabulary) for _ in range(rng.randint(1, 5))]
+        if rng.random() < 0.2:
+            position = rng.randint(0, len(tokens))
+            tokens[position:position] = rng.choice(multi_word_terms).split()
+        if rng.random() < 0.3:
+            tokens = [token.title() for token in tokens]
+        names.append(tokens)
+    return names
+
+
+def sample_raw_names(count: int, seed: int = 0) -> List[str]:
+    """
+    Build a reproducible corpus of raw, uncleaned recipe names.
+
+    Names are drawn from `sample_token_lists()` and some are given digits,
+    punctuation or stray single characters, or are left empty, so that every
+    validation rule rejects part of the corpus.
+
+    Args:
+        count (int): Number of names to generate.
+        seed (int, optional): Seed for the random generator. Defaults to 0.
+
+    Returns:
+        List[str]: The generated names.
+    """
+    rng = random.Random(seed)
+    names = []
+    for tokens in sample_token_lists(count, seed):
+        name = " ".join(tokens)
+        roll = rng.random()
+        if roll < 0.02:
+            name = ""
+        elif roll < 0.06:
+            name = f"{rng.randint(2, 30)} minute {name}"
+        elif roll < 0.08:
+            name = f"{name} x"
+        elif roll < 0.2:
+            name = f"{name}!!"
+        names.append(name)
+    return names
+
+
+def sample_recipe_names(count: int, seed: int = 0) -> List[Optional[str]]:
+    """
+    Build a reproducible corpus of rows like those of the raw recipe dumps.
+
+    Mixes missing names, names with numbers, proper nouns and possessives,
+    names too long to keep and stray punctuation in the shares given by
+    SYNTHETIC_MIX. About DUPLICATE_SHARE of the rows repeat an earlier row,
+    with a skew towards the earliest ones, so a few names are very common.
+    Multi-word culinary terms come from `sample_token_lists()`.
+
+    Args:
+        count (int): Number of rows to generate.
+        seed (int, optional): Seed for the random generator. Defaults to 0.
+
+    Returns:
+        List[Optional[str]]: The generated names, None for a missing name.
+    """
+    rng = random.Random(seed)
+    terms = sorted(CULINARY_TERMS)
+    names: List[Optional[str]] = []
+    for tokens in sample_token_lists(count, seed):
+        if names and rng.random() < DUPLICATE_SHARE:
+            names.append(names[int(len(names) * rng.random() ** 3)])
+            continue
+
+        name = " ".join(tokens)
+        roll = rng.random()
+        for kind, share in SYNTHETIC_MIX.items():
+            if roll < share:
+                break
+            roll -= share
+        else:
+            kind = None
+
+        if kind == "nan":
+            name = None
+        elif kind == "digits":
+            name = f"{rng.randint(2, 30)} Minute {name}"
+        elif kind == "proper_noun":
+            name = f"{rng.choice(PROPER_NOUNS)} {name}"
+        elif kind == "long":
+            name = f"{name} with {', '.join(rng.sample(terms, 4))}"
+        elif kind == "punctuation":
+            name = rng.choice(["{}!!", "{} (Easy)", "Best-Ever {}", '"{}"']).format(
+                name
+            )
+        names.append(name)
+    return names
+
+
+def chunked(items: Sequence, size: int) -> List[Sequence]:
+    """
+    Split a sequence into consecutive chunks.
+
+    Args:
+        items (Sequence): Items to split.
+        size (int): Maximum number of items per chunk.
+
+    Returns:
+        List[Sequence]: The chunks, in order.
+    """
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def best_time(func: Callable, inputs: Sequence, repeat: int = 3) -> float:
+    """
+    Time a function over a list of inputs and keep the fastest run.
+
+    Args:
+        func (Callable): Function called once per input.
+        inputs (Sequence): Inputs to call the function with.
+        repeat (int, optional): Number of timed runs. Defaults to 3.
+
+    Returns:
+        float: Duration of the fastest run in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in inputs:
+            func(item)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def print_results(title: str, rows: Iterable[tuple], unit: str = "names") -> None:
+    """
+    Print benchmark results as a table of names (or other units) per second.
+
+    Args:
+        title (str): Heading of the table.
+        rows (Iterable[tuple]): (label, count, seconds) tuples.
+        unit (str, optional): What is being counted. Defaults to "names".
+    """
+    print("\n" + "=" * 50)
+    print(title)
+    print("=" * 50)
+    for label, count, seconds in rows:
+        print(f"{label:<28} - {count / seconds:>12,.0f} {unit}/s")
+    print("-" * 50 + "\n")
+
+
+def sample_words(count: int, seed: int = 0) -> List[str]:
+    """
+    Build a reproducible list of distinct random lowercase words.
+
+    Args:
+        count (int): Number of words to generate.
+        seed (int, optional): Seed for the random generator. Defaults to 0.
+
+    Returns:
+        List[str]: The generated words, three to fourteen letters long.
+    """
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        length = rng.randint(3, 14)
+        words.add("".join(rng.choices(string.ascii_lowercase, k=length)))
+    return sorted(words)
+
+
+def span_has_term(
+    tokens: Sequence[str], terms: AbstractSet[str] = CULINARY_TERMS
+) -> bool:
+    """
+    Check for terms by joining every token span, as before TermIndex.
+
+    Args:
+        tokens (Sequence[str]): Tokens of the name to search.
+        terms (AbstractSet[str], optional): Lowercase terms to look for.
+            Defaults to CULINARY_TERMS.
+
+    Returns:
+        bool: True if at least one term occurs in the tokens.
+    """
+    return any(
+        " ".join(tokens[i:j]).lower() in terms
+        for i in range(len(tokens))
+        for j in range(i + 1, len(tokens) + 1)
+    )
+
+
+def find_mismatches(
+    corpus: Sequence[Sequence[str]], terms: AbstractSet[str] = CULINARY_TERMS
+) -> List[Sequence[str]]:
+    """
+    Find the names TermIndex and the nested span lookup disagree on.
+
+    Args:
+        corpus (Sequence[Sequence[str]]): Tokens of each name.
+        terms (AbstractSet[str], optional): Lowercase terms to look for.
+            Defaults to CULINARY_TERMS.
+
+    Returns:
+        List[Sequence[str]]: Tokens of every name with differing results.
+    """
+    index = TermIndex(terms)
+    return [
+        tokens
+        for tokens in corpus
+        if index.contains_any(tokens) != span_has_term(tokens, terms)
+    ]
+
+
+def benchmark_culinary(args: argparse.Namespace) -> None:
+    """
+    Compare the culinary term trie against the nested span generator.
+
+    Both matchers are first run over the whole sample corpus and must agree on
+    every name before anything is timed (see `find_mismatches()`).
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+    """
+    corpus = sample_token_lists(args.rows, args.seed)
+    index = TermIndex(CULINARY_TERMS)
+
+    mismatches = find_mismatches(corpus)
+    if mismatches:
+        print(f"Error: {len(mismatches)} names differ, e.g. {mismatches[0]}")
+        exit(1)
+    matched = sum(index.contains_any(tokens) for tokens in corpus)
+    print(f"Equivalence check passed on {len(corpus)} names ({matched} matches)")
+
+    print_results(
+        "Culinary term lookup",
+        [
+            (
+                "Nested span generator",
+                len(corpus),
+                best_time(span_has_term, corpus),
+            ),
+            ("TermIndex", len(corpus), best_time(index.contains_any, corpus)),
+        ],
+    )
+
+
+def benchmark_chunk(args: argparse.Namespace) -> None:
+    """
+    Compare per-name processing against batched `process_chunk()`.
+
+    Runs single-process on chunks of `CHUNK_SIZE` names. Both paths must give
+    the same names and removal reasons before anything is timed.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+    """
+    from lib.languages import DEFAULT_LANGUAGE
+    from scripts.process import CHUNK_SIZE, process_chunk, process_name
+
+    chunks = chunked(sample_raw_names(args.rows, args.seed), CHUNK_SIZE)
+
+    def per_name(chunk: Sequence[str]) -> tuple:
+        name_counts = Counter()
+        removal_reasons = Counter()
+        for name in chunk:
+            processed, reason = process_name(name)
+            if processed:
+                name_counts[processed] += 1
+            else:
+                removal_reasons[reason] += 1
+        return name_counts, removal_reasons
+
+    for chunk in chunks:
+        result = process_chunk(chunk)[DEFAULT_LANGUAGE]
+        name_counts, removal_reasons = per_name(chunk)
+        if (list(name_counts.items()), removal_reasons) != (
+            list(result.name_counts.items()),
+            result.removal_reasons,
+        ):
+            print("Error: per-name and batched results differ")
+            exit(1)
+    print(f"Equivalence check passed on {args.rows} names")
+
+    print_results(
+        "Chunk processing",
+        [
+            ("process_name per name", args.rows, best_time(per_name, chunks, 1)),
+            ("process_chunk batched", args.rows, best_time(process_chunk, chunks, 1)),
+        ],
+    )
+
+
+def benchmark_lexicon(args: argparse.Namespace) -> None:
+    """
+    Compare a Python set against the memory-mapped Lexicon for word lookups.
+
+    Uses a synthetic word list the size of the NLTK words corpus; half of the
+    looked up words are in it. Besides lookup throughput, reports the memory
+    each worker needs to hold the set, which the shared lexicon file avoids.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+    """
+    vocabulary = sample_words(LEXICON_SIZE, args.seed)
+    absent = sample_words(LEXICON_SIZE + args.rows // 2, args.seed + 1)
+    rng = random.Random(args.seed)
+    queries = rng.sample(vocabulary, args.rows // 2) + rng.sample(
+        absent, args.rows // 2
+    )
+    rng.shuffle(queries)
+
+    word_set = set(vocabulary)
+    set_bytes = sys.getsizeof(word_set) + sum(sys.getsizeof(word) for word in word_set)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "lexicon.npy")
+        Lexicon.build(vocabulary, path)
+        lexicon = Lexicon(path)
+        file_bytes = os.path.getsize(path)
+
+        expected = [query in word_set for query in queries]
+        if list(lexicon.contains_many(queries)) != expected or expected != [
+            query in lexicon for query in queries
+        ]:
+            print("Error: set and lexicon lookups differ")
+            exit(1)
+
+        batches = chunked(queries, 1000)
+        print_results(
+            "Word lookup",
+            [
+                ("set", len(queries), best_time(word_set.__contains__, queries)),
+                ("Lexicon", len(queries), best_time(lexicon.__contains__, queries)),
+                (
+                    "Lexicon.contains_many",
+                    len(queries),
+                    best_time(lexicon.contains_many, batches),
+                ),
+            ],
+            unit="words",
+        )
+        print(f"set memory per worker:        {set_bytes / 2**20:>8.1f} MB")
+        print(f"Lexicon file, shared by all:  {file_bytes / 2**20:>8.1f} MB\n")
+
+
+def load_sql_file(path: str, database_path: str, table_name: str) -> float:
+    """
+    Load an SQL seed file into a fresh SQLite database, as a local D1 stand-in.
+
+    Args:
+        path (str): Path of the SQL file to load.
+        database_path (str): Path of the SQLite database to create.
+        table_name (str): Name of the table the seed file inserts into.
+
+    Returns:
+        float: Time taken to execute the file, in seconds.
+    """
+    connection = sqlite3.connect(database_path, isolation_level=None)
+    connection.execute(f"CREATE TABLE {table_name} (name text PRIMARY KEY NOT NULL)")
+    with open(path, "r") as f:
+        script = f.read()
+    start = time.perf_counter()
+    connection.executescript(script)
+    seconds = time.perf_counter() - start
+    connection.close()
+    return seconds
+
+
+def benchmark_seed(args: argparse.Namespace) -> None:
+    """
+    Compare single-row against batched INSERT statements in the seed file.
+
+    Each variant is written with `generate_sql_file()` and loaded into its own
+    on-disk SQLite database, where every statement outside an explicit
+    transaction commits on its own, as it does in D1. Every variant must load
+    all the names before its results are reported.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+    """
+    from scripts.generate import generate_sql_file
+
+    names = list(
+        dict.fromkeys(
+            " ".join(tokens).lower()
+            for tokens in sample_token_lists(args.rows, args.seed)
+        )
+    )
+    variants = [
+        ("1 row per statement", {}),
+        ("1 row, transactions", {"transaction_size": 1000}),
+        ("500 rows per statement", {"batch_size": 500}),
+        ("500 rows, OR IGNORE", {"batch_size": 500, "ignore_duplicates": True}),
+        (
+            "500 rows, transactions",
+            {"batch_size": 500, "transaction_size": 100},
+        ),
+    ]
+
+    print(f"{len(names)} distinct names\n")
+    print(f"{'Variant':<28} {'Statements':>10} {'Size (MB)':>10} {'Load (s)':>9}")
+    print("-" * 60)
+    with tempfile.TemporaryDirectory() as directory:
+        for i, (label, options) in enumerate(variants):
+            path = os.path.join(directory, f"seed_{i}.sql")
+            database_path = os.path.join(directory, f"seed_{i}.sqlite")
+            with contextlib.redirect_stdout(io.StringIO()):
+                statements, _ = generate_sql_file(names, path, "recipes", **options)
+            seconds = load_sql_file(path, database_path, "recipes")
+
+            connection = sqlite3.connect(database_path)
+            (loaded,) = connection.execute("SELECT COUNT(*) FROM recipes").fetchone()
+            connection.close()
+            if loaded != len(names):
+                print(f"Error: {label} loaded {loaded} of {len(names)} names")
+                exit(1)
+            size = os.path.getsize(path) / 2**20
+            print(f"{label:<28} {statements:>10} {size:>10.2f} {seconds:>9.2f}")
+    print("-" * 60 + "\n")
+
+
+def benchmark_near_duplicates(args: argparse.Namespace) -> None:
+    """
+    Time MinHash signing and LSH near duplicate detection, single-process.
+
+    Every synthetic name gets a variant with a plural "s" or a leading "the"
+    at a random position in the corpus, and the report includes how many
+    variants were merged into their original (recall). Names are ranked in
+    corpus order, so an original always ranks above its variant.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+    """
+    rng = random.Random(args.seed)
+    originals = list(
+        dict.fromkeys(
+            " ".join(tokens).lower()
+            for tokens in sample_token_lists(args.rows // 2, args.seed)
+        )
+    )
+    variants = [
+        f"the {name}" if rng.random() < 0.5 else f"{name}s" for name in originals
+    ]
+    names = list(dict.fromkeys(originals + variants))
+    index = {name: i for i, name in enumerate(names)}
+
+    chunks = chunked(names, 1000)
+    start = time.perf_counter()
+    signatures = np.concatenate([minhash_signatures(chunk) for chunk in chunks])
+    signing = time.perf_counter() - start
+    start = time.perf_counter()
+    canonicals = find_canonicals(signatures, np.arange(len(names)), 0.7)
+    grouping = time.perf_counter() - start
+
+    recalled = sum(
+        canonicals[index[variant]] == index[original]
+        for original, variant in zip(originals, variants)
+        if index[variant] > index[original]
+    )
+    merged = int((canonicals != np.arange(len(names))).sum())
+    print_results(
+        "Near duplicate detection",
+        [
+            ("minhash_signatures", len(names), signing),
+            ("find_canonicals", len(names), grouping),
+        ],
+    )
+    print(f"Names merged:         {merged} of {len(names)}")
+    print(f"Variants recalled:    {recalled} of {len(originals)}\n")
+
+
+def benchmark_formats(args: argparse.Namespace) -> None:
+    """
+    Compare the output formats of process.py as a hand-off to generate.py.
+
+    Each format is written with the `process.py` writer and read back with
+    `generate.py`'s `read_input_file()`. Every format must give back the
+    same names and counts before its results are reported.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+    """
+    import scripts.process as process
+    from scripts.generate import read_input_file
+
+    rng = random.Random(args.seed)
+    names = list(
+        dict.fromkeys(
+            " ".join(tokens).lower()
+            for tokens in sample_token_lists(args.rows, args.seed)
+        )
+    )
+    rows = [(name, rng.randint(1, 20)) for name in names]
+    writers = [
+        ("csv", process.save_to_csv),
+        ("json", process.save_to_json),
+        ("parquet", process.save_to_columnar),
+        ("arrow", process.save_to_columnar),
+    ]
+
+    print(f"{len(rows)} distinct names\n")
+    print(f"{'Format':<10} {'Size (MB)':>10} {'Write (s)':>10} {'Read (s)':>10}")
+    print("-" * 44)
+    with tempfile.TemporaryDirectory() as directory:
+        for output_format, save in writers:
+            path = os.path.join(directory, f"names.{output_format}")
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                save(iter(rows), path)
+                write_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            read = list(read_input_file(path))
+            read_seconds = time.perf_counter() - start
+            if read != rows:
+                print(f"Error: {output_format} did not read back the names written")
+                exit(1)
+            size = os.path.getsize(path) / 2**20
+            print(
+                f"{output_format:<10} {size:>10.2f} {write_seconds:>10.2f} {read_seconds:>10.2f}"
+            )
+    print("-" * 44 + "\n")
+
+
+def count_names(chunk: Sequence[Optional[str]]) -> int:
+    """
+    Count a chunk of names sent to a worker, standing in for processing it.
+
+    Args:
+        chunk (Sequence[Optional[str]]): The pickled names.
+
+    Returns:
+        int: Number of names.
+    """
+    return len(chunk)
+
+
+def count_range(task: Tuple[str, int, int]) -> int:
+    """
+    Count a range of a shared block read in a worker, standing in for processing it.
+
+    Args:
+        task (Tuple[str, int, int]): Name of the block, and start and end of
+            the range.
+
+    Returns:
+        int: Number of names.
+    """
+    from scripts.process import worker_blocks
+
+    return len(worker_blocks.read(*task))
+
+
+def benchmark_dispatch(args: argparse.Namespace) -> None:
+    """
+    Compare sending names to the worker pool pickled against as shared ranges.
+
+    The workers only count the names, so the timings are the cost of dispatch
+    alone: pickled chunks of `CHUNK_SIZE` names sent through `imap`, against
+    (start, end) ranges of names copied to shared memory blocks, at
+    `CHUNK_SIZE` and at the larger sizes chunks grow to when they are sized
+    by cost. Every path must count every name.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+    """
+    from lib.dispatch import BLOCK_ROWS, SharedBlock
+    from scripts.process import CHUNK_SIZE, create_pool
+
+    names = sample_recipe_names(args.rows, args.seed)
+    chunks = chunked(names, CHUNK_SIZE)
+
+    def shared_ranges(size: int) -> Callable[[Any], int]:
+        def dispatch(_) -> int:
+            blocks = [
+                SharedBlock(names[i : i + BLOCK_ROWS])
+                for i in range(0, len(names), BLOCK_ROWS)
+            ]
+            try:
+                tasks = [
+                    (block.name, start, min(start + size, block.rows))
+                    for block in blocks
+                    for start in range(0, block.rows, size)
+                ]
+                return sum(pool.imap_unordered(count_range, tasks))
+            finally:
+                for block in blocks:
+                    block.release()
+
+        return dispatch
+
+    def pickled(_) -> int:
+        return sum(pool.imap(count_names, chunks))
+
+    rows = [("pickled chunks", CHUNK_SIZE, pickled)] + [
+        ("shared ranges", size, shared_ranges(size))
+        for size in (CHUNK_SIZE, CHUNK_SIZE * 10)
+    ]
+    with create_pool() as pool:
+        for label, _, dispatch in rows:
+            if dispatch(None) != len(names):
+                print(f"Error: {label} did not count every name")
+                exit(1)
+        print(f"Count check passed on {len(names)} names")
+        print_results(
+            f"Dispatch to {multiprocessing.cpu_count()} workers",
+            [
+                (f"{label} of {size}", len(names), best_time(dispatch, [None]))
+                for label, size, dispatch in rows
+            ],
+        )
+
+
+def benchmark_profanity(args: argparse.Namespace) -> None:
+    """
+    Compare per-name profanity scoring against one classifier call per chunk.
+
+    Scoring one name at a time is slow, so the per-name path is only timed on
+    the first PER_NAME_SAMPLE names. Both paths must give the same scores.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+    """
+    from profanity_check import predict_prob
+    from scripts.process import CHUNK_SIZE
+
+    names = [
+        " ".join(tokens).lower() for tokens in sample_token_lists(args.rows, args.seed)
+    ]
+    chunks = chunked(names, CHUNK_SIZE)
+    sample = [[name] for name in names[:PER_NAME_SAMPLE]]
+
+    batched = np.concatenate([predict_prob(chunk) for chunk in chunks])
+    per_name = np.concatenate([predict_prob(name) for name in sample])
+    if not np.allclose(per_name, batched[: len(sample)]):
+        print("Error: per-name and batched scores differ")
+        exit(1)
+    print(f"Equivalence check passed on {len(sample)} names")
+
+    print_results(
+        "Profanity scoring",
+        [
+            ("predict_prob per name", len(sample), best_time(predict_prob, sample, 1)),
+            ("predict_prob per chunk", len(names), best_time(predict_prob, chunks, 1)),
+        ],
+    )
+
+
+def git_revision() -> Optional[str]:
+    """
+    Describe the checked out commit, to label benchmark results with.
+
+    Returns:
+        Optional[str]: Abbreviated commit hash, with "-dirty" if there are
+            local changes, or None outside a git checkout.
+    """
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def process_tree_peaks(pid: int, peaks: Dict[int, int]) -> None:
+    """
+    Record the peak RSS so far of a process and its descendants, from /proc.
+
+    The kernel's high-water mark (VmHWM) is reset when a process starts a new
+    program, unlike `ru_maxrss`, which a child inherits from the process that
+    forked it, so the suite's own memory does not leak into the measurement.
+
+    Args:
+        pid (int): Process to measure, with its children, grandchildren, etc.
+        peaks (Dict[int, int]): Peak RSS in kilobytes of each process seen so
+            far, updated in place.
+    """
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        peaks[current] = max(
+                            peaks.get(current, 0), int(line.split()[1])
+                        )
+                        break
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as f:
+                    pending.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+
+
+def run_script(
+    arguments: List[str], data_dir: Optional[str] = None
+) -> Tuple[float, Optional[int]]:
+    """
+    Run a data_utils script in a subprocess, as it is run from the command line.
+
+    Memory is sampled every 50 ms from /proc, so it is only measured on Linux.
+
+    Args:
+        arguments (List[str]): Module name of the script and its arguments.
+        data_dir (Optional[str], optional): Data directory the script reads
+            from and writes to, instead of the project's. Defaults to None.
+
+    Returns:
+        Tuple[float, Optional[int]]: Wall time in seconds, and the peak RSS in
+            kilobytes of the largest process among the script and its
+            workers, or None if it could not be measured.
+    """
+    from scripts.process import DATA_DIR_VARIABLE
+
+    env = dict(os.environ)
+    if data_dir:
+        env[DATA_DIR_VARIABLE] = data_dir
+    peaks: Dict[int, int] = {}
+    with tempfile.TemporaryFile() as log:
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", *arguments],
+            cwd=PROJECT_ROOT,
+            env=env,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+        while process.poll() is None:
+            process_tree_peaks(process.pid, peaks)
+            time.sleep(0.05)
+        seconds = time.perf_counter() - start
+        if process.returncode:
+            log.seek(0)
+            print(log.read().decode(errors="replace")[-2000:])
+            print(f"Error: '{' '.join(arguments)}' failed")
+            exit(1)
+    return seconds, max(peaks.values(), default=None)
+
+
+def suite_result(
+    benchmark: str,
+    rows: int,
+    names: int,
+    seconds: float,
+    workers: Optional[int] = None,
+    peak_rss_kb: Optional[int] = None,
+) -> Dict:
+    """
+    Build one entry of the suite's machine-readable results.
+
+    Args:
+        benchmark (str): What was timed.
+        rows (int): Size of the synthetic input.
+        names (int): Number of names the timed code went through.
+        seconds (float): Time taken.
+        workers (Optional[int], optional): Number of worker processes, for
+            command-line runs. Defaults to None.
+        peak_rss_kb (Optional[int], optional): Peak RSS of the largest process,
+            for command-line runs. Defaults to None.
+
+    Returns:
+        Dict: The result entry.
+    """
+    return {
+        "benchmark": benchmark,
+        "rows": rows,
+        "workers": workers,
+        "names": names,
+        "seconds": seconds,
+        "names_per_second": names / seconds if seconds else None,
+        "peak_rss_kb": peak_rss_kb,
+    }
+
+
+def compare_results(previous: Dict, current: Dict) -> None:
+    """
+    Print the throughput change of every result also found in earlier results.
+
+    Args:
+        previous (Dict): Results saved by an earlier run of the suite.
+        current (Dict): Results of this run.
+    """
+    before = {
+        (entry["benchmark"], entry["rows"], entry["workers"]): entry
+        for entry in previous["results"]
+    }
+    print(f"\nCompared with {previous.get('revision') or 'previous results'}:")
+    print("-" * 72)
+    print(f"{'Benchmark':<40} {'Before/s':>10} {'After/s':>10} {'Change':>8}")
+    for entry in current["results"]:
+        old = before.get((entry["benchmark"], entry["rows"], entry["workers"]))
+        if not old or not old["names_per_second"] or not entry["names_per_second"]:
+            continue
+        label = f"{entry['benchmark']} {entry['rows']:,}"
+        if entry["workers"]:
+            label += f" (workers: {entry['workers']})"
+        change = entry["names_per_second"] / old["names_per_second"] - 1
+        print(
+            f"{label:<40} {old['names_per_second']:>10,.0f} "
+            f"{entry['names_per_second']:>10,.0f} {change:>+8.1%}"
+        )
+    print("-" * 72 + "\n")
+
+
+def benchmark_suite(args: argparse.Namespace) -> None:
+    """
+    Time the pipeline functions and scripts at several input sizes.
+
+    For each size, a synthetic input from `sample_recipe_names()` goes through
+    `process_name()` and `is_valid_recipe_name()` (on the first
+    PER_NAME_SAMPLE names, since they are slow), `process_chunk()` and
+    `generate_sql_file()` in this process, and then through `process.py`
+    with each worker count and `generate.py` as separate command-line runs,
+    which also report peak memory. The results are written as JSON, labeled
+    with the git revision, so that runs of different commits can be compared.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+    """
+    import scripts.process as process
+    from scripts.generate import generate_sql_file
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.sizes:
+            names = sample_recipe_names(rows, args.seed)
+            sample = names[:PER_NAME_SAMPLE]
+            cleaned = [process.clean_name(name) for name in sample if name]
+
+            process.worker_memo.clear()
+            start = time.perf_counter()
+            result = process.ChunkResult()
+            for chunk in chunked(names, process.CHUNK_SIZE):
+                result.update(process.process_chunk(chunk)[process.DEFAULT_LANGUAGE])
+            chunk_seconds = time.perf_counter() - start
+
+            kept = list(result.name_counts.items())
+            seed_path = os.path.join(directory, "seed.sql")
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                generate_sql_file(kept, seed_path, "recipes")
+                seed_seconds = time.perf_counter() - start
+
+            function_results = [
+                suite_result(
+                    "process_name",
+                    rows,
+                    len(sample),
+                    best_time(process.process_name, sample, 1),
+                ),
+                suite_result(
+                    "is_valid_recipe_name",
+                    rows,
+                    len(cleaned),
+                    best_time(process.is_valid_recipe_name, cleaned, 1),
+                ),
+                suite_result("process_chunk", rows, rows, chunk_seconds),
+                suite_result("generate_sql_file", rows, len(kept), seed_seconds),
+            ]
+            print_results(
+                f"Functions, {rows:,} rows ({len(kept):,} names kept)",
+                [
+                    (entry["benchmark"], entry["names"], entry["seconds"])
+                    for entry in function_results
+                ],
+            )
+            results.extend(function_results)
+
+            # The scripts run against a data directory of their own, so they
+            # never touch the project's data
+            stem = f"benchmark_{rows}"
+            data_dir = os.path.join(directory, "data")
+            input_path = os.path.join(data_dir, "raw", f"{stem}.csv")
+            os.makedirs(os.path.dirname(input_path), exist_ok=True)
+            with open(input_path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["name"])
+                writer.writerows([name or ""] for name in names)
+
+            print(
+                f"{'Script':<28} {'Workers':>7} {'Time (s)':>9} {'names/s':>10} {'Peak MB':>8}"
+            )
+            print("-" * 66)
+            script_results = []
+            for workers in args.workers:
+                seconds, peak = run_script(
+                    ["scripts.process", f"{stem}.csv", "-o", stem, "-w", str(workers)],
+                    data_dir,
+                )
+                script_results.append(
+                    suite_result("process.py", rows, rows, seconds, workers, peak)
+                )
+            seconds, peak = run_script(
+                ["scripts.generate", f"{stem}.csv", "-o", seed_path], data_dir
+            )
+            script_results.append(
+                suite_result("generate.py", rows, len(kept), seconds, None, peak)
+            )
+
+            for entry in script_results:
+                print(
+                    f"{entry['benchmark']:<28} {entry['workers'] or '':>7} "
+                    f"{entry['seconds']:>9.2f} {entry['names_per_second']:>10,.0f} "
+                    f"{(entry['peak_rss_kb'] or 0) / 1024:>8.0f}"
+                )
+            print("-" * 66 + "\n")
+            results.extend(script_results)
+
+    report = {
+        "revision": git_revision(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "seed": args.seed,
+        "results": results,
+    }
+    output_path = args.output or os.path.join(
+        RESULTS_DIR, f"{report['revision'] or 'results'}.json"
+    )
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Saved results to {output_path}")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            compare_results(json.load(f), report)
+
+
+def parse_counts(value: str) -> List[int]:
+    """
+    Parse a comma-separated list of positive integers from the command line.
+
+    Args:
+        value (str): The argument value, e.g. "1,2,4".
+
+    Returns:
+        List[int]: The parsed integers.
+    """
+    counts = [int(item) for item in value.split(",") if item.strip()]
+    if not counts or min(counts) < 1:
+        raise argparse.ArgumentTypeError(f"invalid list of counts: '{value}'")
+    return counts
+
+
+def default_worker_counts() -> List[int]:
+    """
+    Get the worker counts the suite scales across by default.
+
+    Returns:
+        List[int]: Powers of two below the number of CPUs, then the number of CPUs.
+    """
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 < cpus:
+        counts.append(counts[-1] * 2)
+    if cpus > 1:
+        counts.append(cpus)
+    return counts
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse command-line arguments for the benchmark script.
+
+    Returns:
+        argparse.Namespace: Parsed command-line arguments.
+
+    Arguments:
+    - benchmark: Name of the benchmark to run
+    - rows: Number of synthetic names to benchmark with
+    - seed: Seed for the synthetic data generator
+    - sizes: Numbers of rows the suite runs at
+    - workers: Worker counts the suite runs process.py with
+    - output: Path of the suite's JSON results
+    - compare: Earlier suite results to compare with
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the data_utils pipeline.")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    culinary = subparsers.add_parser(
+        "culinary", help="Culinary term lookup in is_valid_recipe_name"
+    )
+    culinary.set_defaults(func=benchmark_culinary)
+
+    chunk = subparsers.add_parser(
+        "chunk", help="Per-name processing against batched process_chunk"
+    )
+    chunk.set_defaults(func=benchmark_chunk)
+
+    lexicon = subparsers.add_parser(
+        "lexicon", help="Python set against the memory-mapped Lexicon"
+    )
+    lexicon.set_defaults(func=benchmark_lexicon)
+
+    seed = subparsers.add_parser(
+        "seed", help="Single-row against batched INSERT statements in the seed file"
+    )
+    seed.set_defaults(func=benchmark_seed)
+
+    near_duplicates = subparsers.add_parser(
+        "near-duplicates", help="MinHash signing and LSH near duplicate detection"
+    )
+    near_duplicates.set_defaults(func=benchmark_near_duplicates)
+
+    formats = subparsers.add_parser(
+        "formats", help="CSV, JSON, Parquet and Arrow output read by generate.py"
+    )
+    formats.set_defaults(func=benchmark_formats)
+
+    dispatch = subparsers.add_parser(
+        "dispatch", help="Pickled chunks against shared memory ranges sent to the pool"
+    )
+    dispatch.set_defaults(func=benchmark_dispatch)
+
+    profanity = subparsers.add_parser(
+        "profanity", help="Per-name against batched profanity classifier calls"
+    )
+    profanity.set_defaults(func=benchmark_profanity)
+
+    suite = subparsers.add_parser(
+        "suite",
+        help="Functions and command-line scripts at several sizes and worker counts, saved as JSON",
+    )
+    suite.add_argument(
+        "--sizes",
+        type=parse_counts,
+        default=SUITE_SIZES,
+        help=f"Comma-separated numbers of rows to run at (default: {','.join(map(str, SUITE_SIZES))})",
+    )
+    suite.add_argument(
+        "--workers",
+        "-w",
+        type=parse_counts,
+        default=default_worker_counts(),
+        help="Comma-separated worker counts to run process.py with (default: powers of two up to the number of CPUs)",
+    )
+    suite.add_argument(
+        "--output",
+        "-o",
+        help="Path of the JSON results (default: data/benchmarks/<git revision>.json)",
+    )
+    suite.add_argument(
+        "--compare",
+        metavar="RESULTS",
+        help="JSON results of an earlier run to compare throughput with",
+    )
+    suite.set_defaults(func=benchmark_suite)
+
+    for name, subparser in subparsers.choices.items():
+        if name != "suite":
+            subparser.add_argument(
+                "--rows",
+                "-n",
+                type=int,
+                default=100_000,
+                help="Number of synthetic names to benchmark with (default: 100000)",
+            )
+        subparser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Seed for the synthetic data generator (default: 0)",
+        )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    args.func(args)
@@ -1,46 +1,202 @@
 import os
 import json
 import csv
+import re
+import glob
+import hashlib
+import itertools
+import sqlite3
 import argparse
-from typing import List
+import tempfile
+from collections import Counter
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from lib.autocomplete import sorted_counts, top_suggestions
+from lib.columnar import is_columnar, iter_names
+from lib.delta import ADDED, CHANGED, REMOVED, diff_sorted
+from lib.languages import LANGUAGES
+from lib.spill import SpillCounter
 
 # Define fixed directories relative to the project root
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-INPUT_DIR = os.path.join(PROJECT_ROOT, "data", "sanitized")
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, "data")
+
+# Environment variable overriding the data directory, as in process.py
+DATA_DIR_VARIABLE = "DATA_UTILS_DATA_DIR"
+INPUT_DIR = os.path.join(
+    os.environ.get(DATA_DIR_VARIABLE) or os.path.join(PROJECT_ROOT, "data"),
+    "sanitized",
+)
+OUTPUT_DIR = os.environ.get(DATA_DIR_VARIABLE) or os.path.join(PROJECT_ROOT, "data")
+MIGRATIONS_DIR = os.path.join(
+    os.path.dirname(PROJECT_ROOT), "packages", "api", "migrations"
+)
 
 COLUMN_NAME = "name"
+COUNT_COLUMN = "count"
+
+# Default table and columns of the autocomplete prefix table, created by
+# packages/api/migrations; suggestions are a JSON array of names
+AUTOCOMPLETE_TABLE = "english_autocomplete"
+AUTOCOMPLETE_COLUMNS = ("prefix", "suggestions")
+MAX_PREFIX_LENGTH = 10
+SUGGESTION_LIMIT = 5
+
+# Number of characters read at a time from JSON input, and bytes buffered per output file
+BLOCK_SIZE = 1024 * 1024
+WHITESPACE_REGEX = re.compile(r"\s*")
+
+# D1 rejects SQL statements longer than 100 KB
+MAX_STATEMENT_BYTES = 100_000
+
+# Name of the manifest written alongside sharded seed files
+MANIFEST_FILE = "manifest.json"
+
+# Number of rows inserted per transaction when building a SQLite database
+SQLITE_BATCH_SIZE = 100_000
+
+# Separator between statements in the Drizzle migration files
+STATEMENT_BREAKPOINT = "--> statement-breakpoint"
+
+# Extensions of SQLite databases accepted as the previous snapshot of a table
+SQLITE_EXTENSIONS = (".sqlite", ".sqlite3", ".db")
+
+
+def iter_json_array(f: IO[str], block_size: int = BLOCK_SIZE) -> Iterator:
+    """
+    Incrementally parse a JSON array, yielding its elements one at a time.
+
+    The file is read one block at a time. All the complete elements in the
+    buffer, up to its last comma, are decoded in one call; if that comma turns
+    out to be inside a string or nested value, the slice is not valid JSON and
+    the next block is read first. Memory use is bounded by the block size and
+    the largest element, however large the array is.
+
+    Args:
+        f (IO[str]): JSON file opened in text mode.
+        block_size (int, optional): Number of characters read at a time.
+            Defaults to BLOCK_SIZE.
+
+    Yields:
+        Any: The next element of the array.
+
+    Raises:
+        ValueError: If the file is not a valid JSON array.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    eof = False
+    while not eof and not buffer.strip():
+        buffer = f.read(block_size)
+        eof = not buffer
+    buffer = buffer.lstrip()
+    if not buffer.startswith("["):
+        raise ValueError("Expected a JSON array")
+    buffer = buffer[1:]
+
+    after_comma = False
+    while True:
+        cut = buffer.rfind(",")
+        if cut != -1:
+            try:
+                values = decoder.decode(f"[{buffer[:cut]}]")
+            except json.JSONDecodeError:
+                values = None
+            if values == []:
+                raise ValueError("Invalid JSON array: missing element")
+            if values is not None:
+                yield from values
+                buffer = buffer[cut + 1 :]
+                after_comma = True
+        if eof:
+            break
+        block = f.read(block_size)
+        eof = not block
+        buffer += block
+
+    # The rest of the buffer is the last element and the closing bracket
+    values = decoder.decode(f"[{buffer}")
+    if after_comma and not values:
+        raise ValueError("Invalid JSON array: trailing comma")
+    yield from values
+
+
+def iter_json_names(file_path: str) -> Iterator[Tuple[str, int]]:
+    """
+    Stream recipe names and occurrence counts from a JSON array file.
+
+    Elements are either {"name": ..., "count": ...} objects or plain strings,
+    which are counted once.
+
+    Args:
+        file_path (str): Path of the JSON file.
+
+    Yields:
+        Tuple[str, int]: The next recipe name and its occurrence count.
+    """
+    with open(file_path, "r") as f:
+        for entry in iter_json_array(f):
+            if isinstance(entry, str):
+                yield entry, 1
+            else:
+                yield entry[COLUMN_NAME], entry[COUNT_COLUMN]
+
+
+def iter_csv_names(file_path: str) -> Iterator[Tuple[str, int]]:
+    """
+    Stream recipe names and occurrence counts from a CSV file.
 
+    Names are in the first column and counts in the second; files without a
+    count column count each name once.
 
-def read_input_file(file_name: str) -> List[str]:
+    Args:
+        file_path (str): Path of the CSV file.
+
+    Yields:
+        Tuple[str, int]: The next recipe name and its occurrence count.
+    """
+    with open(file_path, "r") as f:
+        reader = csv.reader(f)
+        next(reader, None)  # Skip header row
+        for row in reader:
+            yield row[0], int(row[1]) if len(row) > 1 else 1
+
+
+def read_input_file(file_name: str) -> Iterator[Tuple[str, int]]:
     """
-    Read recipe names from either a JSON or CSV file.
+    Stream recipe names and occurrence counts from a JSON, CSV, Parquet or
+    Arrow IPC file.
+
+    The file is checked up front, but only read as the names are consumed.
+    Parquet and Arrow files are read through memory-mapped record batches,
+    a column at a time, instead of being parsed name by name.
 
     Args:
         file_name (str): Name of the input file in the sanitized data directory.
 
     Returns:
-        List[str]: A list of recipe names.
+        Iterator[Tuple[str, int]]: The recipe names and their occurrence
+            counts, in file order.
 
     Raises:
-        ValueError: If the file format is not supported (not JSON or CSV).
+        ValueError: If the file format is not supported (not JSON, CSV,
+            Parquet or Arrow).
         FileNotFoundError: If the input file is not found in the specified directory.
     """
     file_path = os.path.join(INPUT_DIR, file_name)
     _, file_extension = os.path.splitext(file_name)
 
     if file_extension.lower() == ".json":
-        with open(file_path, "r") as f:
-            return json.load(f)
+        reader = iter_json_names
     elif file_extension.lower() == ".csv":
-        with open(file_path, "r") as f:
-            reader = csv.reader(f)
-            next(reader)  # Skip header row
-            return [row[0] for row in reader]
+        reader = iter_csv_names
+    elif is_columnar(file_name):
+        reader = iter_names
     else:
         raise ValueError(
-            f"Unsupported file format: {file_extension}. Please use JSON or CSV."
+            f"Unsupported file format: {file_extension}. Please use JSON, CSV, Parquet or Arrow."
         )
+    if not os.path.isfile(file_path):
+        raise FileNotFoundError(f"Input file not found: {file_path}")
+    return reader(file_path)
 
 
 def escape_name(name: str) -> str:
@@ -56,26 +212,764 @@ def escape_name(name: str) -> str:
     return name.replace("'", "''")
 
 
-def generate_sql_file(recipe_names: List[str], output_file: str, table_name: str):
+def format_row(row: Union[str, Sequence]) -> str:
+    """
+    Format a row as an SQL values tuple.
+
+    Args:
+        row (Union[str, Sequence]): A single string, or a sequence of strings
+            and integers, one per column.
+
+    Returns:
+        str: The parenthesized, comma-separated SQL literals.
+    """
+    if isinstance(row, str):
+        return f"('{escape_name(row)}')"
+    return (
+        "("
+        + ",".join(
+            str(value) if isinstance(value, int) else f"'{escape_name(value)}'"
+            for value in row
+        )
+        + ")"
+    )
+
+
+def iter_insert_statements(
+    recipe_names: Iterable[Union[str, Sequence]],
+    table_name: str,
+    batch_size: int = 1,
+    max_statement_bytes: int = MAX_STATEMENT_BYTES,
+    ignore_duplicates: bool = False,
+    columns: Sequence[str] = (COLUMN_NAME,),
+) -> Iterator[Tuple[str, int]]:
     """
-    Generate an SQL file with individual INSERT statements for each recipe name.
+    Generate INSERT statements that each insert up to `batch_size` rows.
 
     Args:
-        recipe_names (List[str]): List of recipe names to insert.
+        recipe_names (Iterable[Union[str, Sequence]]): Recipe names to insert,
+            or rows with one value per column; see `format_row()`.
+        table_name (str): Name of the table to insert the recipe names into.
+        batch_size (int, optional): Maximum rows per statement. Defaults to 1.
+        max_statement_bytes (int, optional): Maximum size of a statement in
+            bytes; a single row is never split, even if it is larger.
+            Defaults to MAX_STATEMENT_BYTES.
+        ignore_duplicates (bool, optional): Use INSERT OR IGNORE, so names that
+            are already in the table are skipped. Defaults to False.
+        columns (Sequence[str], optional): Columns the rows are inserted into.
+            Defaults to the name column.
+
+    Yields:
+        Tuple[str, int]: The next INSERT statement, including the trailing
+            semicolon, and the number of rows it inserts.
+    """
+    verb = "INSERT OR IGNORE" if ignore_duplicates else "INSERT"
+    prefix = f"{verb} INTO {table_name} ({', '.join(columns)}) VALUES "
+    return iter_batched_statements(
+        map(format_row, recipe_names), prefix, ";", batch_size, max_statement_bytes
+    )
+
+
+def iter_delete_statements(
+    recipe_names: Iterable[str],
+    table_name: str,
+    batch_size: int = 1,
+    max_statement_bytes: int = MAX_STATEMENT_BYTES,
+) -> Iterator[Tuple[str, int]]:
+    """
+    Generate DELETE statements that each delete up to `batch_size` names.
+
+    Args:
+        recipe_names (Iterable[str]): Recipe names to delete.
+        table_name (str): Name of the table to delete the recipe names from.
+        batch_size (int, optional): Maximum names per statement. Defaults to 1.
+        max_statement_bytes (int, optional): Maximum size of a statement in
+            bytes. Defaults to MAX_STATEMENT_BYTES.
+
+    Yields:
+        Tuple[str, int]: The next `DELETE ... WHERE name IN (...)` statement,
+            including the trailing semicolon, and the number of names it
+            deletes.
+    """
+    prefix = f"DELETE FROM {table_name} WHERE {COLUMN_NAME} IN ("
+    values = (f"'{escape_name(name)}'" for name in recipe_names)
+    return iter_batched_statements(
+        values, prefix, ");", batch_size, max_statement_bytes
+    )
+
+
+def iter_batched_statements(
+    values: Iterable[str],
+    prefix: str,
+    suffix: str,
+    batch_size: int = 1,
+    max_statement_bytes: int = MAX_STATEMENT_BYTES,
+) -> Iterator[Tuple[str, int]]:
+    """
+    Join SQL values into statements of up to `batch_size` comma-separated values.
+
+    Args:
+        values (Iterable[str]): SQL literals or values tuples.
+        prefix (str): Text of each statement before the values.
+        suffix (str): Text of each statement after the values, ending with the
+            semicolon.
+        batch_size (int, optional): Maximum values per statement. Defaults to 1.
+        max_statement_bytes (int, optional): Maximum size of a statement in
+            bytes; a single value is never split, even if it is larger.
+            Defaults to MAX_STATEMENT_BYTES.
+
+    Yields:
+        Tuple[str, int]: The next statement and the number of values in it.
+    """
+    empty_size = len(prefix.encode("utf-8")) + len(suffix.encode("utf-8"))
+
+    batch = []
+    size = empty_size
+    for value in values:
+        value_size = len(value.encode("utf-8")) + (1 if batch else 0)
+        if batch and (
+            len(batch) >= batch_size or size + value_size > max_statement_bytes
+        ):
+            yield f"{prefix}{','.join(batch)}{suffix}", len(batch)
+            batch = []
+            size = empty_size
+            value_size -= 1
+        batch.append(value)
+        size += value_size
+    if batch:
+        yield f"{prefix}{','.join(batch)}{suffix}", len(batch)
+
+
+def iter_seed_blocks(
+    recipe_names: Iterable[Union[str, Sequence]],
+    table_name: str,
+    batch_size: int = 1,
+    max_statement_bytes: int = MAX_STATEMENT_BYTES,
+    ignore_duplicates: bool = False,
+    transaction_size: int = 0,
+    columns: Sequence[str] = (COLUMN_NAME,),
+    create_table: Optional[str] = None,
+) -> Iterator[Tuple[str, int, int]]:
+    """
+    Generate the blocks of SQL text a seed file is made of.
+
+    A block is a single INSERT statement, or a whole explicit transaction if
+    `transaction_size` is set, so seed files can be split between any two
+    blocks without breaking a statement or a transaction.
+
+    Args:
+        recipe_names (Iterable[Union[str, Sequence]]): Recipe names (or rows)
+            to insert.
+        table_name (str): Name of the table to insert the recipe names into.
+        batch_size (int, optional): Maximum rows per INSERT statement.
+            Defaults to 1.
+        max_statement_bytes (int, optional): Maximum size of an INSERT
+            statement in bytes. Defaults to MAX_STATEMENT_BYTES.
+        ignore_duplicates (bool, optional): Emit INSERT OR IGNORE statements.
+            Defaults to False.
+        transaction_size (int, optional): Number of statements to wrap in each
+            explicit transaction, or 0 for none. Defaults to 0.
+        columns (Sequence[str], optional): Columns the rows are inserted into.
+            Defaults to the name column.
+        create_table (Optional[str], optional): Statement creating the table,
+            emitted as the first block. Defaults to None.
+
+    Yields:
+        Tuple[str, int, int]: The block's text (ending with a newline), and the
+            number of rows and INSERT statements in it.
+    """
+    if create_table is not None:
+        yield f"{create_table}\n", 0, 0
+
+    statements = iter_insert_statements(
+        recipe_names,
+        table_name,
+        batch_size,
+        max_statement_bytes,
+        ignore_duplicates,
+        columns,
+    )
+    yield from iter_blocks(statements, transaction_size)
+
+
+def iter_blocks(
+    statements: Iterable[Tuple[str, int]], transaction_size: int = 0
+) -> Iterator[Tuple[str, int, int]]:
+    """
+    Group statements into the blocks of SQL text a seed file is made of.
+
+    Args:
+        statements (Iterable[Tuple[str, int]]): Statements and the number of
+            rows each one affects.
+        transaction_size (int, optional): Number of statements to wrap in each
+            explicit transaction, or 0 for none. Defaults to 0.
+
+    Yields:
+        Tuple[str, int, int]: The block's text (ending with a newline), and the
+            number of rows and statements in it.
+    """
+    if not transaction_size:
+        for statement, rows in statements:
+            yield f"{statement}\n", rows, 1
+        return
+
+    block = []
+    block_rows = 0
+    for statement, rows in statements:
+        block.append(statement)
+        block_rows += rows
+        if len(block) == transaction_size:
+            yield transaction(block), block_rows, len(block)
+            block = []
+            block_rows = 0
+    if block:
+        yield transaction(block), block_rows, len(block)
+
+
+def transaction(statements: List[str]) -> str:
+    """
+    Wrap statements in an explicit transaction.
+
+    Args:
+        statements (List[str]): SQL statements, each with its semicolon.
+
+    Returns:
+        str: The transaction's SQL text, ending with a newline.
+    """
+    return "BEGIN TRANSACTION;\n" + "\n".join(statements) + "\nCOMMIT;\n"
+
+
+def generate_sql_file(
+    recipe_names: Iterable[Union[str, Sequence]],
+    output_file: str,
+    table_name: str,
+    batch_size: int = 1,
+    max_statement_bytes: int = MAX_STATEMENT_BYTES,
+    ignore_duplicates: bool = False,
+    transaction_size: int = 0,
+    columns: Sequence[str] = (COLUMN_NAME,),
+    create_table: Optional[str] = None,
+) -> Tuple[int, int]:
+    """
+    Generate an SQL file with INSERT statements for the recipe names.
+
+    The names are consumed and written one statement at a time, so any
+    iterable (e.g. from `read_input_file()`) is streamed in constant memory.
+
+    Args:
+        recipe_names (Iterable[Union[str, Sequence]]): Recipe names (or rows)
+            to insert.
         output_file (str): Name of the output SQL file to be created.
         table_name (str): Name of the table to insert the recipe names into.
+        batch_size (int, optional): Maximum rows per INSERT statement.
+            Defaults to 1 (one statement per recipe name).
+        max_statement_bytes (int, optional): Maximum size of an INSERT
+            statement in bytes. Defaults to MAX_STATEMENT_BYTES.
+        ignore_duplicates (bool, optional): Emit INSERT OR IGNORE statements.
+            Defaults to False.
+        transaction_size (int, optional): Number of statements to wrap in each
+            explicit transaction, or 0 for none. Defaults to 0.
+        columns (Sequence[str], optional): Columns the rows are inserted into.
+            Defaults to the name column.
+        create_table (Optional[str], optional): Statement creating the table,
+            written before the INSERT statements. Defaults to None.
+
+    Returns:
+        Tuple[int, int]: Number of INSERT statements and rows written.
     """
     output_path = os.path.join(OUTPUT_DIR, output_file)
-    with open(output_path, "w") as f:
+    blocks = iter_seed_blocks(
+        recipe_names,
+        table_name,
+        batch_size,
+        max_statement_bytes,
+        ignore_duplicates,
+        transaction_size,
+        columns,
+        create_table,
+    )
+    statement_count = 0
+    row_count = 0
+    with open(output_path, "w", buffering=BLOCK_SIZE) as f:
         f.write(f"-- Seed data for {table_name} table\n\n")
 
-        # Generate individual INSERT statements for each recipe name
-        for name in recipe_names:
-            f.write(
-                f"INSERT INTO {table_name} ({COLUMN_NAME}) VALUES ('{escape_name(name)}');\n"
+        for text, rows, statements in blocks:
+            f.write(text)
+            statement_count += statements
+            row_count += rows
+
+    print(f"Generated SQL file: {output_path}")
+    return statement_count, row_count
+
+
+def generate_sql_shards(
+    recipe_names: Iterable[Union[str, Sequence]],
+    output_file: str,
+    table_name: str,
+    max_shard_bytes: Optional[int] = None,
+    max_shard_statements: Optional[int] = None,
+    batch_size: int = 1,
+    max_statement_bytes: int = MAX_STATEMENT_BYTES,
+    ignore_duplicates: bool = False,
+    transaction_size: int = 0,
+    columns: Sequence[str] = (COLUMN_NAME,),
+    create_table: Optional[str] = None,
+) -> Dict:
+    """
+    Generate a set of numbered SQL files with INSERT statements, and a manifest.
+
+    The shards are written to a directory named after `output_file` without
+    its extension (e.g. data/seed/seed_0001.sql for seed.sql). A new shard is
+    started whenever the next statement (or transaction) would take the current
+    one over either limit; a single statement larger than the byte limit gets a
+    shard of its own. The manifest lists every shard with its row count,
+    statement count, size and SHA-256 checksum, and is written last, so a
+    complete manifest means a complete set of shards.
+
+    Args:
+        recipe_names (Iterable[Union[str, Sequence]]): Recipe names (or rows)
+            to insert.
+        output_file (str): Name of the output SQL file the shards replace.
+        table_name (str): Name of the table to insert the recipe names into.
+        max_shard_bytes (Optional[int], optional): Maximum size of a shard in
+            bytes. Defaults to None (no limit).
+        max_shard_statements (Optional[int], optional): Maximum number of
+            INSERT statements per shard. Defaults to None (no limit).
+        batch_size (int, optional): Maximum rows per INSERT statement.
+            Defaults to 1 (one statement per recipe name).
+        max_statement_bytes (int, optional): Maximum size of an INSERT
+            statement in bytes. Defaults to MAX_STATEMENT_BYTES.
+        ignore_duplicates (bool, optional): Emit INSERT OR IGNORE statements.
+            Defaults to False.
+        transaction_size (int, optional): Number of statements to wrap in each
+            explicit transaction, or 0 for none. Defaults to 0.
+        columns (Sequence[str], optional): Columns the rows are inserted into.
+            Defaults to the name column.
+        create_table (Optional[str], optional): Statement creating the table,
+            written before the INSERT statements. Defaults to None.
+
+    Returns:
+        Dict: The manifest.
+    """
+    stem = os.path.splitext(output_file)[0]
+    shard_dir = os.path.join(OUTPUT_DIR, stem)
+    os.makedirs(shard_dir, exist_ok=True)
+    manifest_path = os.path.join(shard_dir, MANIFEST_FILE)
+
+    # Remove the shards and manifest of a previous run
+    for path in glob.glob(os.path.join(shard_dir, f"{stem}_*.sql")):
+        os.remove(path)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    blocks = iter_seed_blocks(
+        recipe_names,
+        table_name,
+        batch_size,
+        max_statement_bytes,
+        ignore_duplicates,
+        transaction_size,
+        columns,
+        create_table,
+    )
+    shards = []
+    shard = None
+    f = None
+    try:
+        for text, rows, statements in blocks:
+            data = text.encode("utf-8")
+            if shard is not None and (
+                (
+                    max_shard_bytes is not None
+                    and shard["bytes"] + len(data) > max_shard_bytes
+                )
+                or (
+                    max_shard_statements is not None
+                    and shard["statements"] + statements > max_shard_statements
+                )
+            ):
+                f.close()
+                shard["sha256"] = shard.pop("digest").hexdigest()
+                shard = None
+            if shard is None:
+                shard = {
+                    "file": f"{stem}_{len(shards) + 1:04d}.sql",
+                    "rows": 0,
+                    "statements": 0,
+                    "bytes": 0,
+                    "digest": hashlib.sha256(),
+                }
+                shards.append(shard)
+                f = open(
+                    os.path.join(shard_dir, shard["file"]), "wb", buffering=BLOCK_SIZE
+                )
+                header = f"-- Seed data for {table_name} table, shard {len(shards)}\n\n"
+                data = header.encode("utf-8") + data
+            f.write(data)
+            shard["digest"].update(data)
+            shard["bytes"] += len(data)
+            shard["rows"] += rows
+            shard["statements"] += statements
+        if shard is not None:
+            shard["sha256"] = shard.pop("digest").hexdigest()
+    finally:
+        if f is not None:
+            f.close()
+
+    manifest = {
+        "table": table_name,
+        "rows": sum(shard["rows"] for shard in shards),
+        "statements": sum(shard["statements"] for shard in shards),
+        "shards": shards,
+    }
+    temp_path = f"{manifest_path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_path, manifest_path)
+
+    print(f"Generated {len(shards)} SQL files in: {shard_dir}")
+    return manifest
+
+
+def read_snapshot(snapshot: str, table_name: str) -> Iterator[Tuple[str, int]]:
+    """
+    Stream the names and counts of a previous snapshot of a table.
+
+    The snapshot is either an earlier output of `process.py` in the sanitized
+    data directory, or a SQLite copy of the table, e.g. built with `--sqlite`
+    or a local D1 database, relative to the data directory.
+
+    Args:
+        snapshot (str): Name of the snapshot file; a `.sqlite`, `.sqlite3` or
+            `.db` file is read as a SQLite database.
+        table_name (str): Table to read from a SQLite snapshot.
+
+    Returns:
+        Iterator[Tuple[str, int]]: The names and their occurrence counts, in
+            no particular order; names of a table without a count column are
+            counted once.
+
+    Raises:
+        FileNotFoundError: If the snapshot does not exist.
+        ValueError: If a SQLite snapshot has no such table.
+    """
+    if not snapshot.lower().endswith(SQLITE_EXTENSIONS):
+        return read_input_file(snapshot)
+
+    database_path = os.path.join(OUTPUT_DIR, snapshot)
+    if not os.path.isfile(database_path):
+        raise FileNotFoundError(f"Snapshot database not found: {database_path}")
+    connection = sqlite3.connect(f"file:{database_path}?mode=ro", uri=True)
+    columns = [row[1] for row in connection.execute(f"PRAGMA table_info({table_name})")]
+    if not columns:
+        connection.close()
+        raise ValueError(f"Table '{table_name}' not found in {database_path}")
+    count = COUNT_COLUMN if COUNT_COLUMN in columns else "1"
+
+    def rows() -> Iterator[Tuple[str, int]]:
+        try:
+            yield from connection.execute(
+                f"SELECT {COLUMN_NAME}, {count} FROM {table_name}"
             )
+        finally:
+            connection.close()
+
+    return rows()
+
+
+def generate_delta_sql(
+    recipe_names: Iterable[Tuple[str, int]],
+    previous_names: Iterable[Tuple[str, int]],
+    output_file: str,
+    table_name: str,
+    batch_size: int = 1,
+    max_statement_bytes: int = MAX_STATEMENT_BYTES,
+    transaction_size: int = 0,
+    counts: bool = True,
+) -> Dict[str, int]:
+    """
+    Generate an SQL file that turns a previous snapshot of a table into the new one.
+
+    Both snapshots are sorted in bounded memory and compared with a single
+    sorted merge (see `lib/delta.py`), and only the differences are written:
+    batched `DELETE ... WHERE name IN (...)` statements for removed names,
+    `INSERT OR IGNORE` statements for added names, and, with counts, upserts
+    for names whose count changed. Applying the file therefore takes time in
+    proportion to the size of the change rather than the size of the table.
+    Each kind of change is spilled to its own sorted runs in a temporary
+    directory as the merge finds it, so memory use stays bounded however
+    large the change is.
+
+    Args:
+        recipe_names (Iterable[Tuple[str, int]]): Names and occurrence counts
+            of the new snapshot.
+        previous_names (Iterable[Tuple[str, int]]): Names and occurrence counts
+            the table currently holds, e.g. from `read_snapshot()`.
+        output_file (str): Name of the output SQL file to be created.
+        table_name (str): Name of the table to update.
+        batch_size (int, optional): Maximum rows per statement. Defaults to 1.
+        max_statement_bytes (int, optional): Maximum size of a statement in
+            bytes. Defaults to MAX_STATEMENT_BYTES.
+        transaction_size (int, optional): Number of statements to wrap in each
+            explicit transaction, or 0 for none. Defaults to 0.
+        counts (bool, optional): Insert and compare occurrence counts, rather
+            than only names. Defaults to True.
+
+    Returns:
+        Dict[str, int]: Number of names added, removed and changed, and of
+            statements written.
+    """
+    if not counts:
+        recipe_names = ((name, 1) for name, _ in recipe_names)
+        previous_names = ((name, 1) for name, _ in previous_names)
+    columns = (COLUMN_NAME, COUNT_COLUMN) if counts else (COLUMN_NAME,)
+    upsert_prefix = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES "
+    upsert_suffix = f" ON CONFLICT({COLUMN_NAME}) DO UPDATE SET {COUNT_COLUMN} = excluded.{COUNT_COLUMN};"
+    output_path = os.path.join(OUTPUT_DIR, output_file)
+    tallies = Counter()
+    statement_count = 0
+    with tempfile.TemporaryDirectory(prefix="generate_delta_") as directory:
+        changes = {
+            change: SpillCounter(directory, change)
+            for change in (ADDED, REMOVED, CHANGED)
+        }
+        for change, name, count in diff_sorted(
+            sorted_counts(previous_names), sorted_counts(recipe_names)
+        ):
+            changes[change].update(((name, count),))
+            tallies[change] += 1
+
+        added = changes[ADDED].sorted_counts()
+        if not counts:
+            added = (name for name, _ in added)
+        statements = itertools.chain(
+            iter_delete_statements(
+                (name for name, _ in changes[REMOVED].sorted_counts()),
+                table_name,
+                batch_size,
+                max_statement_bytes,
+            ),
+            iter_insert_statements(
+                added, table_name, batch_size, max_statement_bytes, True, columns
+            ),
+            iter_batched_statements(
+                map(format_row, changes[CHANGED].sorted_counts()),
+                upsert_prefix,
+                upsert_suffix,
+                batch_size,
+                max_statement_bytes,
+            ),
+        )
+
+        with open(output_path, "w", buffering=BLOCK_SIZE) as f:
+            f.write(f"-- Delta seed data for {table_name} table\n\n")
+            for text, _, block_statements in iter_blocks(statements, transaction_size):
+                f.write(text)
+                statement_count += block_statements
 
     print(f"Generated SQL file: {output_path}")
+    return {
+        ADDED: tallies[ADDED],
+        REMOVED: tallies[REMOVED],
+        CHANGED: tallies[CHANGED],
+        "statements": statement_count,
+    }
+
+
+def iter_autocomplete_rows(
+    recipe_names: Iterable[Tuple[str, int]],
+    max_prefix_length: int = MAX_PREFIX_LENGTH,
+    limit: int = SUGGESTION_LIMIT,
+) -> Iterator[Tuple[str, str]]:
+    """
+    Build the rows of the autocomplete prefix table, in bounded memory.
+
+    Every lowercase prefix of up to `max_prefix_length` characters is mapped
+    to its `limit` best completions, ranked by occurrence count and then by
+    length. See `lib.autocomplete`.
+
+    Args:
+        recipe_names (Iterable[Tuple[str, int]]): Recipe names and their
+            occurrence counts; repeated names have their counts added up.
+        max_prefix_length (int, optional): Length of the longest prefix
+            indexed. Defaults to MAX_PREFIX_LENGTH.
+        limit (int, optional): Maximum number of suggestions per prefix.
+            Defaults to SUGGESTION_LIMIT.
+
+    Yields:
+        Tuple[str, str]: A prefix and its suggestions as a JSON array.
+    """
+    counts = sorted_counts(recipe_names)
+    for prefix, suggestions in top_suggestions(counts, max_prefix_length, limit):
+        yield prefix, json.dumps(suggestions, ensure_ascii=False, separators=(",", ":"))
+
+
+def generate_autocomplete_json(
+    rows: Iterable[Tuple[str, str]], output_file: str
+) -> int:
+    """
+    Write the autocomplete prefix table as a JSON object of prefix to names.
+
+    Args:
+        rows (Iterable[Tuple[str, str]]): Rows from `iter_autocomplete_rows()`.
+        output_file (str): Name of the output JSON file to be created.
+
+    Returns:
+        int: Number of prefixes written.
+    """
+    output_path = os.path.join(OUTPUT_DIR, output_file)
+    count = 0
+    with open(output_path, "w", encoding="utf-8", buffering=BLOCK_SIZE) as f:
+        f.write("{")
+        for prefix, suggestions in rows:
+            if count:
+                f.write(",\n")
+            f.write(f"{json.dumps(prefix, ensure_ascii=False)}:{suggestions}")
+            count += 1
+        f.write("}\n")
+
+    print(f"Generated JSON file: {output_path}")
+    return count
+
+
+def read_migrations(migrations_dir: str = MIGRATIONS_DIR) -> List[Tuple[str, str]]:
+    """
+    Read the statements of the Drizzle migrations of the API package.
+
+    Args:
+        migrations_dir (str, optional): Directory of the migration files.
+            Defaults to MIGRATIONS_DIR.
+
+    Returns:
+        List[Tuple[str, str]]: (migration file name, SQL statement) tuples, in
+            the order the migrations apply them.
+
+    Raises:
+        FileNotFoundError: If the directory contains no migration files.
+    """
+    paths = sorted(glob.glob(os.path.join(migrations_dir, "*.sql")))
+    if not paths:
+        raise FileNotFoundError(f"No migrations found in {migrations_dir}")
+
+    statements = []
+    for path in paths:
+        with open(path, "r") as f:
+            for statement in f.read().split(STATEMENT_BREAKPOINT):
+                if statement.strip():
+                    statements.append((os.path.basename(path), statement.strip()))
+    return statements
+
+
+def build_sqlite_database(
+    recipe_names: Iterable[Union[str, Sequence]],
+    output_file: str,
+    table_name: str,
+    ignore_duplicates: bool = False,
+    batch_size: int = SQLITE_BATCH_SIZE,
+    columns: Sequence[str] = (COLUMN_NAME,),
+) -> int:
+    """
+    Build a SQLite database with the API schema and the recipe names loaded.
+
+    The schema comes from the API package's migrations, which are recorded as
+    applied the way wrangler records them, so the file can be used as a local
+    D1 database as is. Index statements are deferred until after the names are
+    loaded, and the load runs without a journal or syncing; the database is
+    built under a temporary name and only replaces `output_file` when complete.
+
+    Args:
+        recipe_names (Iterable[Union[str, Sequence]]): Recipe names to insert,
+            or rows with one value per column.
+        output_file (str): Name of the SQLite database file to be created.
+        table_name (str): Name of the table to insert the recipe names into;
+            must be one of the tables created by the migrations.
+        ignore_duplicates (bool, optional): Skip names already in the table
+            instead of failing. Defaults to False.
+        batch_size (int, optional): Number of rows inserted per transaction.
+            Defaults to SQLITE_BATCH_SIZE.
+        columns (Sequence[str], optional): Columns the rows are inserted into.
+            Defaults to the name column.
+
+    Returns:
+        int: Number of rows inserted.
+
+    Raises:
+        ValueError: If the table is not created by the migrations.
+    """
+    output_path = os.path.join(OUTPUT_DIR, output_file)
+    temp_path = f"{output_path}.tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+    migrations = read_migrations()
+    index_statements = [
+        statement
+        for _, statement in migrations
+        if statement.upper().startswith(
+            ("CREATE INDEX", "CREATE UNIQUE INDEX", "DROP INDEX")
+        )
+    ]
+
+    connection = sqlite3.connect(temp_path, isolation_level=None)
+    try:
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        for _, statement in migrations:
+            if statement not in index_statements:
+                connection.executescript(statement)
+        tables = {
+            row[0]
+            for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        if table_name not in tables:
+            raise ValueError(
+                f"Table '{table_name}' is not in the schema. Available tables: {', '.join(sorted(tables))}"
+            )
+
+        verb = "INSERT OR IGNORE" if ignore_duplicates else "INSERT"
+        placeholders = ", ".join("?" * len(columns))
+        insert = (
+            f"{verb} INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+        )
+        count = 0
+        batch = []
+        for row in recipe_names:
+            batch.append((row,) if isinstance(row, str) else row)
+            if len(batch) == batch_size:
+                connection.execute("BEGIN")
+                count += connection.executemany(insert, batch).rowcount
+                connection.execute("COMMIT")
+                batch = []
+        if batch:
+            connection.execute("BEGIN")
+            count += connection.executemany(insert, batch).rowcount
+            connection.execute("COMMIT")
+
+        for statement in index_statements:
+            connection.executescript(statement)
+
+        # Record the migrations as applied, as `wrangler d1 migrations apply` does
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS d1_migrations("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE, "
+            "applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL)"
+        )
+        connection.executemany(
+            "INSERT INTO d1_migrations (name) VALUES (?)",
+            [(name,) for name in dict.fromkeys(name for name, _ in migrations)],
+        )
+        connection.execute("PRAGMA journal_mode = DELETE")
+    except Exception:
+        connection.close()
+        os.remove(temp_path)
+        raise
+    connection.close()
+    os.replace(temp_path, output_path)
+
+    print(f"Generated SQLite database: {output_path}")
+    return count
 
 
 def parse_arguments():
@@ -84,16 +978,30 @@ def parse_arguments():
 
     Returns:
         argparse.Namespace: Parsed command-line arguments containing:
-            - input: Name of the input file (JSON or CSV) in the data/sanitized directory
+            - input: Name of the input file (JSON, CSV, Parquet or Arrow) in the data/sanitized directory
             - output: Name of the output SQL file (default: seed.sql)
-            - table: Name of the table to insert into (default: recipes)
+            - table: Name of the table to insert into (default: recipes, or the
+              autocomplete table with --autocomplete)
+            - batch_size: Maximum rows per INSERT statement (default: 1)
+            - max_statement_bytes: Maximum size of an INSERT statement in bytes
+            - ignore_duplicates: Emit INSERT OR IGNORE statements
+            - transaction_size: Statements per explicit transaction (default: 0)
+            - shard_bytes: Maximum size of a seed shard in bytes
+            - shard_statements: Maximum number of INSERT statements per seed shard
+            - sqlite: Name of a SQLite database to build instead of SQL files
+            - autocomplete: Write the autocomplete prefix table instead of the names
+            - prefix_length: Length of the longest autocomplete prefix
+            - suggestions: Number of suggestions per autocomplete prefix
+            - no_counts: Only write the names, without their occurrence counts
+            - languages: Seed the table of each language from its own input
+            - previous: Previous snapshot to write a delta seed against
     """
     parser = argparse.ArgumentParser(
         description="Generate SQL insert statements from processed recipe names."
     )
     parser.add_argument(
         "input",
-        help="Name of the input file (JSON or CSV) in the data/sanitized directory",
+        help="Name of the input file (JSON, CSV, Parquet or Arrow) in the data/sanitized directory",
     )
     parser.add_argument(
         "--output",
@@ -104,21 +1012,224 @@ def parse_arguments():
     parser.add_argument(
         "--table",
         "-t",
-        default="recipes",
-        help="Name of the table to insert into (default: recipes)",
+        default=None,
+        help=f"Name of the table to insert into (default: recipes, or {AUTOCOMPLETE_TABLE} with --autocomplete)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        "-b",
+        type=int,
+        default=1,
+        help="Maximum number of rows per INSERT statement (default: 1)",
+    )
+    parser.add_argument(
+        "--max-statement-bytes",
+        type=int,
+        default=MAX_STATEMENT_BYTES,
+        help=f"Maximum size of an INSERT statement in bytes (default: {MAX_STATEMENT_BYTES}, the D1 limit)",
+    )
+    parser.add_argument(
+        "--ignore-duplicates",
+        action="store_true",
+        help="Emit INSERT OR IGNORE statements, so names already in the table are skipped",
+    )
+    parser.add_argument(
+        "--transaction-size",
+        type=int,
+        default=0,
+        help="Wrap every N statements in an explicit transaction (default: 0, no transactions; D1 does not accept them)",
+    )
+    parser.add_argument(
+        "--shard-bytes",
+        type=int,
+        help="Split the output into numbered files of at most this many bytes, with a manifest",
+    )
+    parser.add_argument(
+        "--shard-statements",
+        type=int,
+        help="Split the output into numbered files of at most this many INSERT statements, with a manifest",
+    )
+    parser.add_argument(
+        "--sqlite",
+        metavar="DATABASE",
+        help="Build a SQLite database with the API schema and the names loaded, instead of SQL files",
+    )
+    parser.add_argument(
+        "--autocomplete",
+        action="store_true",
+        help="Write the autocomplete prefix table instead of the names (as JSON if the output ends in .json)",
+    )
+    parser.add_argument(
+        "--prefix-length",
+        type=int,
+        default=MAX_PREFIX_LENGTH,
+        help=f"Length of the longest autocomplete prefix (default: {MAX_PREFIX_LENGTH})",
+    )
+    parser.add_argument(
+        "--suggestions",
+        type=int,
+        default=SUGGESTION_LIMIT,
+        help=f"Number of suggestions per autocomplete prefix (default: {SUGGESTION_LIMIT})",
+    )
+    parser.add_argument(
+        "--no-counts",
+        action="store_true",
+        help="Only write the names, without their occurrence counts (for tables without a count column)",
+    )
+    parser.add_argument(
+        "--previous",
+        metavar="SNAPSHOT",
+        help="Write a delta seed that only deletes, inserts or updates the names that differ from a previous snapshot: an earlier process.py output in data/sanitized, or a SQLite copy of the table in data (.sqlite, .sqlite3 or .db)",
+    )
+    parser.add_argument(
+        "--languages",
+        "-l",
+        help="Comma-separated list of languages written by process.py --languages; reads <input>_<language> and writes <output>_<language> for each language's table, ignoring --table",
     )
     return parser.parse_args()
 
 
+def language_seeds(
+    input_file: str, output_file: str, languages: str
+) -> List[Tuple[str, str, str]]:
+    """
+    List the input file, output file and table of each language to seed.
+
+    Args:
+        input_file (str): Name of the input file, without the language suffix.
+        output_file (str): Name of the output file, without the language suffix.
+        languages (str): Comma-separated list of language names.
+
+    Returns:
+        List[Tuple[str, str, str]]: (input file, output file, table) of each
+            language, with `_<language>` added before the file extensions.
+
+    Raises:
+        ValueError: If a language is unknown.
+    """
+    input_stem, input_extension = os.path.splitext(input_file)
+    output_stem, output_extension = os.path.splitext(output_file)
+    seeds = []
+    for language in dict.fromkeys(
+        name.strip().lower() for name in languages.split(",")
+    ):
+        if language not in LANGUAGES:
+            raise ValueError(
+                f"Unknown language '{language}'. Available languages: {', '.join(LANGUAGES)}."
+            )
+        seeds.append(
+            (
+                f"{input_stem}_{language}{input_extension}",
+                f"{output_stem}_{language}{output_extension}",
+                LANGUAGES[language].table,
+            )
+        )
+    return seeds
+
+
 if __name__ == "__main__":
     args = parse_arguments()
 
     try:
-        recipe_names = read_input_file(args.input)
-        generate_sql_file(recipe_names, args.output, args.table)
-        print(
-            f"Successfully generated SQL file containing {len(recipe_names)} INSERT statements for table '{args.table}'."
-        )
+        table = args.table or (AUTOCOMPLETE_TABLE if args.autocomplete else "recipes")
+        seeds = [(args.input, args.output, table)]
+        if args.languages:
+            if args.sqlite or args.autocomplete:
+                raise ValueError(
+                    "--languages cannot be combined with --sqlite or --autocomplete"
+                )
+            seeds = language_seeds(args.input, args.output, args.languages)
+        if args.previous and (
+            args.autocomplete
+            or args.sqlite
+            or args.languages
+            or args.shard_bytes is not None
+            or args.shard_statements is not None
+        ):
+            raise ValueError(
+                "--previous cannot be combined with --autocomplete, --sqlite, --languages or sharding"
+            )
+        for input_file, output_file, table in seeds:
+            recipe_names = read_input_file(input_file)
+            columns = (COLUMN_NAME, COUNT_COLUMN)
+            create_table = None
+            if args.no_counts and not (args.autocomplete or args.previous):
+                recipe_names = (name for name, _ in recipe_names)
+                columns = (COLUMN_NAME,)
+            if args.autocomplete:
+                if args.sqlite:
+                    raise ValueError("--autocomplete cannot be combined with --sqlite")
+                recipe_names = iter_autocomplete_rows(
+                    recipe_names, args.prefix_length, args.suggestions
+                )
+                columns = AUTOCOMPLETE_COLUMNS
+                create_table = (
+                    f"CREATE TABLE IF NOT EXISTS {table} "
+                    "(prefix text PRIMARY KEY NOT NULL, suggestions text NOT NULL);"
+                )
+
+            if args.previous:
+                delta = generate_delta_sql(
+                    recipe_names,
+                    read_snapshot(args.previous, table),
+                    output_file,
+                    table,
+                    args.batch_size,
+                    args.max_statement_bytes,
+                    args.transaction_size,
+                    not args.no_counts,
+                )
+                print(
+                    f"Successfully generated delta SQL file containing {delta['statements']} statements for table '{table}': {delta[ADDED]} names added, {delta[REMOVED]} removed, {delta[CHANGED]} with a new count."
+                )
+            elif args.autocomplete and output_file.lower().endswith(".json"):
+                prefix_count = generate_autocomplete_json(recipe_names, output_file)
+                print(
+                    f"Successfully generated autocomplete index containing {prefix_count} prefixes."
+                )
+            elif args.sqlite:
+                row_count = build_sqlite_database(
+                    recipe_names,
+                    args.sqlite,
+                    table,
+                    args.ignore_duplicates,
+                    columns=columns,
+                )
+                print(
+                    f"Successfully built SQLite database containing {row_count} rows in table '{table}'."
+                )
+            elif args.shard_bytes is not None or args.shard_statements is not None:
+                manifest = generate_sql_shards(
+                    recipe_names,
+                    output_file,
+                    table,
+                    args.shard_bytes,
+                    args.shard_statements,
+                    args.batch_size,
+                    args.max_statement_bytes,
+                    args.ignore_duplicates,
+                    args.transaction_size,
+                    columns,
+                    create_table,
+                )
+                print(
+                    f"Successfully generated {len(manifest['shards'])} SQL files containing {manifest['statements']} INSERT statements ({manifest['rows']} rows) for table '{table}'."
+                )
+            else:
+                statement_count, row_count = generate_sql_file(
+                    recipe_names,
+                    output_file,
+                    table,
+                    args.batch_size,
+                    args.max_statement_bytes,
+                    args.ignore_duplicates,
+                    args.transaction_size,
+                    columns,
+                    create_table,
+                )
+                print(
+                    f"Successfully generated SQL file containing {statement_count} INSERT statements ({row_count} rows) for table '{table}'."
+                )
     except Exception as e:
         print(f"Error: {str(e)}")
         exit(1)
@@ -1,61 +1,930 @@
 import pandas as pd
 import os
 import argparse
+import csv
+import io
 import json
-from typing import List, Tuple, Set
+import hashlib
+import itertools
+import queue
+import re
+import resource
+import sys
+import tempfile
+import time
+import unicodedata
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Set
+import numpy as np
 import nltk
+import profanity_check
 from nltk.corpus import words
-from nltk.tag import pos_tag
+from nltk.tag.perceptron import PerceptronTagger
 from nltk.tokenize import word_tokenize
 from collections import Counter
 import multiprocessing
-from lib.constants import (
-    FILTER_WORDS,
-    CULINARY_TERMS,
-    CLEAN_REGEX,
-    SPACE_REGEX,
+import multiprocessing.pool
+from multiprocessing.util import Finalize
+from lib.constants import CLEAN_REGEX, SPACE_REGEX, UNICODE_CLEAN_REGEX
+from lib.cache import ResultCache
+from lib.columnar import COLUMNAR_EXTENSIONS, is_columnar, iter_names, write_names
+from lib.dispatch import (
+    BLOCK_ROWS,
+    TARGET_TASK_SECONDS,
+    BlockReader,
+    SharedBlock,
+    TaskSizer,
+    share_resource_tracker,
 )
+from lib.lexicon import Lexicon
+from lib.near_duplicates import find_canonicals, minhash_signatures
+from lib.languages import DEFAULT_LANGUAGE, LANGUAGES
+from lib.incremental import (
+    FileSlice,
+    can_resume_at,
+    complete_size,
+    hash_prefixes,
+    load_manifest,
+    save_manifest,
+)
+from lib.profiling import (
+    StageStats,
+    save_report,
+    start_process_profile,
+    timed,
+    timed_iter,
+)
+from lib.spill import SpillCounter, merge_runs
+from lib.term_index import TermIndex
+from lib.validation import Rule, RulePipeline, RuleStats
 from tqdm import tqdm
 
 # Define fixed directories relative to the project root
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-INPUT_DIR = os.path.join(PROJECT_ROOT, "data", "raw")
-OUTPUT_DIR = os.path.join(PROJECT_ROOT, "data", "sanitized")
 
-# Allowable single characters in recipe names
-ALLOWED_SINGLE_CHARS: Set[str] = {"a", "&", "n", "o"}
+# Environment variable overriding the directory holding the raw and sanitized
+# data, the result cache and the lexicons, e.g. so the benchmark suite can run
+# the scripts in a temporary directory
+DATA_DIR_VARIABLE = "DATA_UTILS_DATA_DIR"
+DATA_DIR = os.environ.get(DATA_DIR_VARIABLE) or os.path.join(PROJECT_ROOT, "data")
+INPUT_DIR = os.path.join(DATA_DIR, "raw")
+OUTPUT_DIR = os.path.join(DATA_DIR, "sanitized")
+CACHE_PATH = os.path.join(DATA_DIR, "process_cache.sqlite")
+CONSTANTS_PATH = os.path.join(PROJECT_ROOT, "lib", "constants.py")
+LEXICON_DIR = os.path.join(DATA_DIR, "lexicon")
+
+# Part-of-speech tags for possessive pronouns and proper nouns
+REJECTED_POS_TAGS: Set[str] = {"PRP$", "NNP", "NNPS"}
+
+# Minimum number of tokens in a valid recipe name
+MIN_WORDS = 2
+
+# Default maximum length of a processed recipe name
+MAX_NAME_LENGTH = 50
+
+# Minimum probability of profanity, according to the profanity classifier, at
+# which a name is rejected; set by --profanity-threshold. The classifier scores
+# some food names (e.g. with "low-fat") above 0.8, so the rule is opt-in and
+# None leaves it out
+PROFANITY_THRESHOLD: Optional[float] = None
+
+# Number of rows sent to a worker at a time, until chunks are sized by their
+# measured cost (see lib/dispatch.py)
+CHUNK_SIZE = 1000
+
+# Maximum number of cleaned names whose validation result a worker remembers
+MEMO_SIZE = 200_000
+
+# Default minimum estimated Jaccard similarity of the character shingles of
+# two names for them to be near duplicates, and names signed per worker task
+NEAR_DUPLICATE_THRESHOLD = 0.7
+MINHASH_CHUNK_SIZE = 1000
+
+# Required NLTK resources and their paths in the NLTK data directory
+NLTK_RESOURCES: Dict[str, str] = {
+    "words": "corpora/words",
+    "averaged_perceptron_tagger_eng": "taggers/averaged_perceptron_tagger_eng",
+    "punkt_tab": "tokenizers/punkt_tab",
+}
+
+# Languages names are validated in and routed to; overridden by --languages
+ACTIVE_LANGUAGES: List[str] = [DEFAULT_LANGUAGE]
+
+# Memory-mapped word and filter word lexicons and culinary term tries of each
+# language, filled in by load_language(), and the part-of-speech tagger,
+# loaded by load_resources()
+WORD_LEXICONS: Dict[str, Lexicon] = {}
+FILTER_LEXICONS: Dict[str, Lexicon] = {}
+CULINARY_INDEXES: Dict[str, TermIndex] = {}
+TAGGER: Optional[PerceptronTagger] = None
+
+# Result cache of the current worker process, opened by init_worker()
+worker_cache: Optional[ResultCache] = None
+
+# Seconds the current worker process spent in init_worker()
+worker_startup = 0.0
+
+# Rule that rejected each (language, cleaned name) pair the current worker
+# validated, or None if the name is valid
+worker_memo: Dict[Tuple[str, str], Optional[Rule]] = {}
+
+# Whether the current worker times its stages, set by init_worker(), and the
+# stage stats of the chunk it is processing (None when not profiling)
+worker_profiling = False
+worker_stages: Optional[StageStats] = None
+
+# Kept names of the current worker in each language, spilled to sorted runs on
+# disk instead of being returned with each chunk, set by init_worker() when
+# running out of core
+worker_spills: Dict[str, SpillCounter] = {}
+
+# Shared blocks of input names the current worker reads its ranges from
+worker_blocks = BlockReader()
+
+
+@dataclass
+class ChunkResult:
+    """
+    Names kept and statistics gathered while processing recipe names.
+
+    Workers return one per chunk, and they are merged with `update()`. Kept
+    names are counted rather than listed; counters keep their keys in the
+    order they were first seen, so merging results in chunk order preserves
+    the order names first appear in the input.
+    """
+
+    name_counts: Counter = field(default_factory=Counter)
+    removal_reasons: Counter = field(default_factory=Counter)
+    total_names: int = 0
+    rule_stats: RuleStats = field(default_factory=RuleStats)
+    cache_hits: int = 0
+    repeats: int = 0
+    seconds: float = 0.0
+    workers: Dict[int, Tuple[float, int]] = field(default_factory=dict)
+    stages: StageStats = field(default_factory=StageStats)
+
+    def update(self, other: "ChunkResult") -> None:
+        """
+        Add the names and statistics of another result to this one.
+
+        Args:
+            other (ChunkResult): Result to merge in.
+        """
+        self.name_counts.update(other.name_counts)
+        self.removal_reasons.update(other.removal_reasons)
+        self.total_names += other.total_names
+        self.rule_stats.update(other.rule_stats)
+        self.cache_hits += other.cache_hits
+        self.repeats += other.repeats
+        self.seconds += other.seconds
+        self.workers.update(other.workers)
+        self.stages.update(other.stages)
+
+
+def rules_fingerprint(max_length: int = MAX_NAME_LENGTH) -> str:
+    """
+    Fingerprint everything the result of `process_name()` depends on.
+
+    Covers `lib/constants.py`, the rule settings in this module (including
+    the profanity threshold), the active languages and the sources of their
+    word lexicons (the NLTK words corpus for English), and the NLTK and
+    profanity classifier versions, so cached results are dropped whenever any
+    of them changes.
+
+    Args:
+        max_length (int, optional): Maximum length of a processed name.
+            Defaults to MAX_NAME_LENGTH.
+
+    Returns:
+        str: Hex digest identifying the current rules.
+    """
+    digest = hashlib.sha256()
+    with open(CONSTANTS_PATH, "rb") as f:
+        digest.update(f.read())
+    for language in ACTIVE_LANGUAGES:
+        if language == DEFAULT_LANGUAGE or os.path.exists(word_list_path(language)):
+            digest.update(word_source_fingerprint(language).encode())
+    settings = (
+        [
+            (language, sorted(LANGUAGES[language].allowed_single_chars))
+            for language in ACTIVE_LANGUAGES
+        ],
+        sorted(REJECTED_POS_TAGS),
+        MIN_WORDS,
+        max_length,
+        PROFANITY_THRESHOLD,
+        nltk.__version__,
+        profanity_check.__version__,
+    )
+    digest.update(repr(settings).encode())
+    return digest.hexdigest()
+
+
+def ensure_nltk_resources(offline: bool = False) -> None:
+    """
+    Make sure the required NLTK resources are installed.
+
+    Missing resources are downloaded, unless running offline.
+
+    Args:
+        offline (bool, optional): Only check for the resources. Defaults to False.
+
+    Raises:
+        SystemExit: If a resource is missing in offline mode or fails to download.
+    """
+    for name, resource_path in NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(resource_path)
+            continue
+        except LookupError:
+            pass
+        try:
+            nltk.data.find(f"{resource_path}.zip")
+            continue
+        except LookupError:
+            pass
+        if offline:
+            print(f"Error: NLTK resource '{name}' is not installed.")
+            exit(1)
+        if not nltk.download(name, quiet=True):
+            print(f"Error: Failed to download NLTK resource '{name}'.")
+            exit(1)
+
+
+def lexicon_path(language: str, kind: str) -> str:
+    """
+    Get the path of one of the lexicon files of a language.
+
+    Args:
+        language (str): Name of the language.
+        kind (str): "words", "filter_words" or "culinary_terms".
+
+    Returns:
+        str: Path of the `.npy` lexicon file.
+    """
+    return os.path.join(LEXICON_DIR, f"{language}_{kind}.npy")
+
+
+def word_list_path(language: str) -> str:
+    """
+    Get the path of the word list a language's word lexicon is built from.
+
+    English words come from the NLTK words corpus instead. For the other
+    languages, the word list is a UTF-8 text file with one word per line,
+    e.g. exported from a hunspell dictionary.
+
+    Args:
+        language (str): Name of the language.
+
+    Returns:
+        str: Path of the `.txt` word list.
+    """
+    return os.path.join(LEXICON_DIR, f"{language}_words.txt")
+
+
+def word_source_fingerprint(language: str) -> str:
+    """
+    Fingerprint the source a language's word lexicon is built from.
+
+    Args:
+        language (str): Name of the language.
+
+    Returns:
+        str: SHA-256 hex digest of the NLTK words corpus for English, and of
+            the word list for the other languages.
+
+    Raises:
+        FileNotFoundError: If the word list of the language does not exist.
+    """
+    if language == DEFAULT_LANGUAGE:
+        return hashlib.sha256(words.raw().encode()).hexdigest()
+    with open(word_list_path(language), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def build_word_lexicon(language: str) -> None:
+    """
+    Build the word lexicon of a language if it is missing or out of date.
+
+    English words come from the NLTK words corpus, and the other languages'
+    from their word list. The fingerprint of the source is saved next to the
+    lexicon, in `<language>_words.npy.sha256`, and the lexicon is rebuilt
+    whenever the source no longer matches it.
+
+    Args:
+        language (str): Name of the language.
+
+    Raises:
+        FileNotFoundError: If the word list of the language does not exist.
+    """
+    path = lexicon_path(language, "words")
+    fingerprint_path = f"{path}.sha256"
+    fingerprint = word_source_fingerprint(language)
+    if os.path.exists(path) and os.path.exists(fingerprint_path):
+        with open(fingerprint_path, "r") as f:
+            if f.read() == fingerprint:
+                return
+
+    if language == DEFAULT_LANGUAGE:
+        Lexicon.build(words.words(), path)
+    else:
+        with open(word_list_path(language), "r", encoding="utf-8") as f:
+            Lexicon.build((line.strip().lower() for line in f if line.strip()), path)
+    with open(fingerprint_path, "w") as f:
+        f.write(fingerprint)
+
+
+def build_lexicons(languages: Iterable[str] = (DEFAULT_LANGUAGE,)) -> None:
+    """
+    Write the lexicon files used by the workers.
+
+    The filter word and culinary term lexicons are rebuilt from
+    `lib/constants.py` on every run, which is cheap, so they never go stale.
+
+    Args:
+        languages (Iterable[str], optional): Languages to build the lexicons
+            of. Defaults to English only.
+    """
+    for language in languages:
+        settings = LANGUAGES[language]
+        build_word_lexicon(language)
+        Lexicon.build(settings.filter_words, lexicon_path(language, "filter_words"))
+        Lexicon.build(settings.culinary_terms, lexicon_path(language, "culinary_terms"))
+
+
+def open_lexicon(path: str, entries: Set[str]) -> Lexicon:
+    """
+    Open the lexicon of a set from `lib/constants.py`, rebuilding it if stale.
 
-# Download required NLTK resources
-nltk.download("words", quiet=True)
-nltk.download("averaged_perceptron_tagger_eng", quiet=True)
-nltk.download("punkt_tab", quiet=True)
+    Args:
+        path (str): Path of the lexicon file.
+        entries (Set[str]): The set the lexicon must contain.
+
+    Returns:
+        Lexicon: The memory-mapped lexicon.
+    """
+    if os.path.exists(path):
+        lexicon = Lexicon(path)
+        if len(lexicon) == len(entries) and set(lexicon) == entries:
+            return lexicon
+    Lexicon.build(entries, path)
+    return Lexicon(path)
+
+
+def load_language(language: str) -> None:
+    """
+    Load the lexicons of a language once.
+
+    The lexicons are memory-mapped, so all workers share one copy of them.
+    Does nothing if they are already loaded, e.g. in a forked worker.
+
+    Args:
+        language (str): Name of the language.
+    """
+    if language in WORD_LEXICONS:
+        return
+    settings = LANGUAGES[language]
+    build_word_lexicon(language)
+    WORD_LEXICONS[language] = Lexicon(lexicon_path(language, "words"))
+    FILTER_LEXICONS[language] = open_lexicon(
+        lexicon_path(language, "filter_words"), settings.filter_words
+    )
+    CULINARY_INDEXES[language] = TermIndex(
+        open_lexicon(lexicon_path(language, "culinary_terms"), settings.culinary_terms)
+    )
+
+
+def load_resources() -> None:
+    """
+    Load the lexicons of the active languages and the part-of-speech tagger once.
+
+    Does nothing if they are already loaded, e.g. in a forked worker.
+    """
+    global TAGGER
+    for language in ACTIVE_LANGUAGES:
+        load_language(language)
+    if TAGGER is None:
+        TAGGER = PerceptronTagger()
 
-# Convert words corpus to a set for faster lookups
-ENGLISH_WORDS: Set[str] = set(words.words())
 
+def known_words(lexicon: Lexicon, names_words: Iterable[List[str]]) -> Set[str]:
+    """
+    Find which words of a batch of names are in a lexicon with one lookup.
+
+    Args:
+        lexicon (Lexicon): Lexicon to look the words up in.
+        names_words (Iterable[List[str]]): The words of each name.
 
-def process_chunk(chunk: List[str]) -> Tuple[List[str], Counter, int]:
+    Returns:
+        Set[str]: The distinct words that are in the lexicon.
+    """
+    vocabulary = list({word for name_words in names_words for word in name_words})
+    found = lexicon.contains_many(vocabulary)
+    return {word for word, is_known in zip(vocabulary, found) if is_known}
+
+
+def peak_rss_kb() -> int:
+    """
+    Get the peak resident set size of the current process.
+
+    Returns:
+        int: Peak RSS in kilobytes.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def init_worker(
+    cache_path: Optional[str],
+    profanity_threshold: Optional[float],
+    profiling: bool = False,
+    cprofile_dir: Optional[str] = None,
+    languages: Optional[List[str]] = None,
+    spill_dir: Optional[str] = None,
+) -> None:
+    """
+    Initialize a worker process of the pool.
+
+    Loads the lexicons and the tagger once, so chunks can be processed without
+    any per-chunk setup.
+
+    Args:
+        cache_path (Optional[str]): Path of the result cache, or None to
+            process every name without caching.
+        profanity_threshold (Optional[float]): Probability of profanity at
+            which a name is rejected, or None to skip the profanity rule.
+        profiling (bool, optional): Time the stages of every chunk. Defaults
+            to False.
+        cprofile_dir (Optional[str], optional): Directory to write a cProfile
+            dump of the worker to when it exits. Defaults to None.
+        languages (Optional[List[str]], optional): Languages to validate names
+            in. Defaults to None (ACTIVE_LANGUAGES).
+        spill_dir (Optional[str], optional): Directory to spill the kept names
+            of each language to as sorted runs, in a `<language>`
+            subdirectory, instead of returning them with each chunk. The last
+            run is written when the worker exits after the pool is closed.
+            Defaults to None (names are returned).
+    """
+    global worker_cache, worker_startup, worker_profiling, PROFANITY_THRESHOLD
+    global ACTIVE_LANGUAGES
+    if cprofile_dir:
+        start_process_profile(cprofile_dir)
+    start = time.perf_counter()
+    PROFANITY_THRESHOLD = profanity_threshold
+    ACTIVE_LANGUAGES = languages or ACTIVE_LANGUAGES
+    worker_profiling = profiling
+    load_resources()
+    if cache_path:
+        worker_cache = ResultCache(cache_path, rules_fingerprint())
+    if spill_dir:
+        for language in ACTIVE_LANGUAGES:
+            worker_spills[language] = SpillCounter(
+                os.path.join(spill_dir, language), str(os.getpid())
+            )
+        Finalize(None, spill_worker_names, exitpriority=10)
+    worker_startup = time.perf_counter() - start
+
+
+def spill_worker_names() -> None:
+    """Write the names the current worker still holds in memory to sorted runs."""
+    for counter in worker_spills.values():
+        counter.spill()
+
+
+def create_pool(
+    cache_path: Optional[str] = None,
+    profanity_threshold: Optional[float] = PROFANITY_THRESHOLD,
+    profiling: bool = False,
+    cprofile_dir: Optional[str] = None,
+    processes: Optional[int] = None,
+    languages: Optional[List[str]] = None,
+    spill_dir: Optional[str] = None,
+) -> multiprocessing.pool.Pool:
+    """
+    Create the worker pool used for the whole run.
+
+    Args:
+        cache_path (Optional[str], optional): Path of the result cache shared
+            by the workers. Defaults to None (no caching).
+        profanity_threshold (Optional[float], optional): Probability of
+            profanity at which a name is rejected, or None to skip the
+            profanity rule. Defaults to PROFANITY_THRESHOLD.
+        profiling (bool, optional): Have the workers time their stages.
+            Defaults to False.
+        cprofile_dir (Optional[str], optional): Directory the workers write
+            cProfile dumps to once the pool is closed. Defaults to None.
+        processes (Optional[int], optional): Number of workers. Defaults to
+            None (one worker per CPU).
+        languages (Optional[List[str]], optional): Languages the workers
+            validate names in. Defaults to None (ACTIVE_LANGUAGES).
+        spill_dir (Optional[str], optional): Directory the workers spill kept
+            names to as sorted runs. Defaults to None (names are returned
+            with each chunk).
+
+    Returns:
+        multiprocessing.pool.Pool: The worker pool.
+    """
+    share_resource_tracker()
+    return multiprocessing.Pool(
+        processes=processes or multiprocessing.cpu_count(),
+        initializer=init_worker,
+        initargs=(
+            cache_path,
+            profanity_threshold,
+            profiling,
+            cprofile_dir,
+            languages or ACTIVE_LANGUAGES,
+            spill_dir,
+        ),
+    )
+
+
+def process_chunk(chunk: List[str]) -> Dict[str, ChunkResult]:
     """
     Process a chunk of recipe names in parallel.
 
+    The whole chunk goes through the validation pipeline together, so the
+    names that survive the cheaper rules are part-of-speech tagged in a single
+    batch. The result is the same as calling `process_name()` on each name.
+    If the worker has a result cache, names found in it skip validation and
+    the results of the others are added to it. Names that are the same after
+    cleaning are only validated once per worker, since the result only
+    depends on the cleaned name.
+
+    Names are cleaned once and then validated in each of the worker's
+    languages, so routing names to several languages reads and cleans the
+    input a single time. The statistics that do not depend on the language
+    (stages, workers, cache hits and seconds) are only recorded in the result
+    of the first language. When running out of core, kept names go to the
+    worker's sorted runs instead, and the results hold no names.
+
     Args:
         chunk (List[str]): A subset of recipe names to process.
 
     Returns:
-        Tuple[List[str], Counter, int]:
-            - List of processed names
-            - Counter of removal reasons
-            - Number of names in the chunk
-    """
-    processed_names = []
-    removal_reasons = Counter()
-    for name in chunk:
-        processed, reason = process_name(name)
-        if processed:
-            processed_names.append(processed)
+        Dict[str, ChunkResult]: Processed name counts, removal reasons and
+            statistics of each language, in the order of ACTIVE_LANGUAGES.
+    """
+    global worker_stages
+    start = time.perf_counter()
+    load_resources()
+    results = {
+        language: ChunkResult(total_names=len(chunk)) for language in ACTIVE_LANGUAGES
+    }
+    result = results[ACTIVE_LANGUAGES[0]]
+    worker_stages = result.stages if worker_profiling else None
+    shared_outcomes: List[Optional[Tuple[str, str]]] = [None] * len(chunk)
+
+    cached = {}
+    if worker_cache:
+        names = [name for name in chunk if not pd.isna(name)]
+        with timed(worker_stages, "cache_lookup", len(names)):
+            cached = worker_cache.get_many(names)
+
+    misses = []
+    for i, name in enumerate(chunk):
+        if pd.isna(name):
+            shared_outcomes[i] = ("", "Empty or NaN")
+        elif name in cached:
+            shared_outcomes[i] = cached[name]
+            result.cache_hits += 1
         else:
-            removal_reasons[reason] += 1
-    return processed_names, removal_reasons, len(chunk)
+            misses.append(i)
+
+    # Cheap checks run on the whole column, the rest only on their survivors.
+    # Names are cleaned once for the languages that keep letters outside
+    # ASCII and once for those that do not
+    with timed(worker_stages, "prefilter", len(misses)):
+        raw_names = [chunk[i] for i in misses]
+        cleaned = {}
+        prefiltered = {}
+        for language, language_result in results.items():
+            unicode_letters = LANGUAGES[language].unicode_letters
+            if unicode_letters not in cleaned:
+                cleaned[unicode_letters] = clean_names(raw_names, language)
+            prefiltered[language] = prefilter_texts(
+                cleaned[unicode_letters], language_result.rule_stats, language=language
+            )
+    cleaned = {key: texts.tolist() for key, texts in cleaned.items()}
+
+    for language, language_result in results.items():
+        texts = cleaned[LANGUAGES[language].unicode_letters]
+        reasons = prefiltered[language]
+        survivors = [j for j, reason in enumerate(reasons) if not reason]
+        with timed(worker_stages, "validate", len(survivors)):
+            survivor_reasons, language_result.repeats = validate_texts(
+                [texts[j] for j in survivors], language_result.rule_stats, language
+            )
+        for j, reason in zip(survivors, survivor_reasons):
+            reasons[j] = reason
+        outcomes = list(shared_outcomes)
+        for i, text, reason in zip(misses, texts, reasons):
+            outcomes[i] = ("", reason) if reason else (text, "")
+
+        if worker_cache and misses:
+            with timed(worker_stages, "cache_store", len(misses)):
+                worker_cache.put_many((chunk[i], *outcomes[i]) for i in misses)
+
+        for processed, reason in outcomes:
+            if processed:
+                language_result.name_counts[processed] += 1
+            else:
+                language_result.removal_reasons[reason] += 1
+
+        if worker_spills:
+            with timed(worker_stages, "spill", len(language_result.name_counts)):
+                worker_spills[language].update(language_result.name_counts.items())
+            language_result.name_counts = Counter()
+
+    result.seconds = time.perf_counter() - start
+    if worker_stages is not None:
+        worker_stages.add("chunk", result.seconds, len(chunk))
+    worker_stages = None
+    result.workers[os.getpid()] = (worker_startup, peak_rss_kb())
+    return results
+
+
+def process_range(block: str, start: int, end: int) -> Dict[str, ChunkResult]:
+    """
+    Process a range of the recipe names in a shared block.
+
+    Tasks only carry the block's name and the range, so the names themselves
+    are never pickled; they are read straight from shared memory.
+
+    Args:
+        block (str): Name of the shared block, from `SharedBlock`.
+        start (int): Index of the first name in the block.
+        end (int): Index after the last name.
+
+    Returns:
+        Dict[str, ChunkResult]: The results of `process_chunk()` on the names.
+    """
+    return process_chunk(worker_blocks.read(block, start, end))
+
+
+class RecipeName:
+    """
+    A cleaned recipe name and the data derived from it by validation rules.
+
+    Tokens and part-of-speech tags are computed on first use and cached, so a
+    name rejected by a cheap rule never reaches the tokenizer or the tagger.
+    """
+
+    __slots__ = ("text", "words", "_tokens", "_pos_tags", "_filtered", "_profanity")
+
+    def __init__(self, text: str):
+        """
+        Args:
+            text (str): The cleaned, lowercase name with single spaces.
+        """
+        self.text = text
+        self.words = text.split()
+        self._tokens: Optional[List[str]] = None
+        self._pos_tags: Optional[List[Tuple[str, str]]] = None
+        self._filtered: Optional[bool] = None
+        self._profanity: Optional[float] = None
+
+    @property
+    def tokens(self) -> List[str]:
+        """List[str]: Tokens of the name according to `word_tokenize`."""
+        if self._tokens is None:
+            self._tokens = word_tokenize(self.text)
+        return self._tokens
+
+    @property
+    def pos_tags(self) -> List[Tuple[str, str]]:
+        """List[Tuple[str, str]]: (token, tag) pairs according to the tagger."""
+        if self._pos_tags is None:
+            self._pos_tags = TAGGER.tag(self.tokens)
+        return self._pos_tags
+
+    @property
+    def profanity(self) -> float:
+        """float: Probability of profanity according to the profanity classifier."""
+        if self._profanity is None:
+            self._profanity = float(profanity_check.predict_prob([self.text])[0])
+        return self._profanity
+
+
+def has_no_digits(name: RecipeName) -> bool:
+    """Check that the name does not include a number."""
+    return not any("0" <= char <= "9" for char in name.text)
+
+
+def has_no_single_chars(name: RecipeName, language: str = DEFAULT_LANGUAGE) -> bool:
+    """Check that the only single-character words are allowed in the language."""
+    allowed = LANGUAGES[language].allowed_single_chars
+    return all(len(word) > 1 or word in allowed for word in name.words)
+
+
+def has_at_most_five_words(name: RecipeName) -> bool:
+    """Check that the name has at most five words."""
+    return len(name.words) <= 5
+
+
+def has_only_known_words(name: RecipeName, language: str = DEFAULT_LANGUAGE) -> bool:
+    """Check that every word is in the language's lexicon or an allowed single char."""
+    lexicon = WORD_LEXICONS[language]
+    allowed = LANGUAGES[language].allowed_single_chars
+    return all(word in lexicon or word in allowed for word in name.words)
+
+
+def is_long_enough(name: RecipeName) -> bool:
+    """Check that the name is longer than three characters."""
+    return len(name.text) > 3
+
+
+def tokenize_names(names: List[RecipeName]) -> None:
+    """Tokenize the names of a batch that have not been tokenized yet."""
+    pending = [name for name in names if name._tokens is None]
+    with timed(worker_stages, "tokenize", len(pending)):
+        for name in pending:
+            name._tokens = word_tokenize(name.text)
+
+
+def tag_names(names: List[RecipeName]) -> None:
+    """
+    Part-of-speech tag a batch of names with one call of the preloaded tagger.
+
+    NLTK's perceptron tagger still tags the names one at a time, so the batch
+    only saves the tagger lookup and the call per name.
+    """
+    tokenize_names(names)
+    pending = [name for name in names if name._pos_tags is None]
+    with timed(worker_stages, "pos_tag", len(pending)):
+        tagged = TAGGER.tag_sents([name._tokens for name in pending])
+    for name, pos_tags in zip(pending, tagged):
+        name._pos_tags = pos_tags
+
+
+def has_no_proper_nouns(name: RecipeName) -> bool:
+    """Check that the name has no personal pronouns or proper nouns."""
+    return not any(pos in REJECTED_POS_TAGS for _, pos in name.pos_tags)
+
+
+def find_filtered_names(
+    names: List[RecipeName], language: str = DEFAULT_LANGUAGE
+) -> None:
+    """Check the tokens of a batch of names against the filter lexicon at once."""
+    tokenize_names(names)
+    known = known_words(FILTER_LEXICONS[language], (name.tokens for name in names))
+    for name in names:
+        name._filtered = any(token in known for token in name.tokens)
+
+
+def has_no_filter_words(name: RecipeName, language: str = DEFAULT_LANGUAGE) -> bool:
+    """Check that the name has no word from the language's filter words."""
+    if name._filtered is None:
+        lexicon = FILTER_LEXICONS[language]
+        name._filtered = any(token in lexicon for token in name.tokens)
+    return not name._filtered
+
+
+def has_culinary_term(name: RecipeName, language: str = DEFAULT_LANGUAGE) -> bool:
+    """Check that the name contains at least one of the language's culinary terms."""
+    return CULINARY_INDEXES[language].contains_any(name.tokens)
+
+
+def has_min_words(name: RecipeName) -> bool:
+    """Check that the name has at least MIN_WORDS tokens."""
+    return len(name.tokens) >= MIN_WORDS
+
+
+def score_profanity(names: List[RecipeName]) -> None:
+    """Score a batch of names with one vectorized call of the profanity classifier."""
+    pending = [name for name in names if name._profanity is None]
+    if pending:
+        scores = profanity_check.predict_prob([name.text for name in pending])
+        for name, score in zip(pending, scores.tolist()):
+            name._profanity = score
+
+
+def has_no_profanity(name: RecipeName) -> bool:
+    """Check that the profanity classifier scores the name below the threshold."""
+    return name.profanity < PROFANITY_THRESHOLD
+
+
+def recipe_name_rules(language: str) -> List[Rule]:
+    """
+    Build the rules of `is_valid_recipe_name()` for a language.
+
+    The rules share a removal reason, so the pipeline is free to run them
+    cheapest first and only tag names that pass the others. Proper nouns are
+    only checked in languages the tagger supports.
+
+    Args:
+        language (str): Name of the language.
+
+    Returns:
+        List[Rule]: The recipe name rules.
+    """
+    rules = [
+        Rule(
+            "filter_words",
+            "Invalid recipe name",
+            20.0,
+            partial(has_no_filter_words, language=language),
+            partial(find_filtered_names, language=language),
+        ),
+        Rule(
+            "culinary_terms",
+            "Invalid recipe name",
+            21.0,
+            partial(has_culinary_term, language=language),
+        ),
+        Rule("min_words", "Invalid recipe name", 20.0, has_min_words),
+    ]
+    if LANGUAGES[language].tag_proper_nouns:
+        rules.insert(
+            0,
+            Rule(
+                "proper_nouns",
+                "Invalid recipe name",
+                200.0,
+                has_no_proper_nouns,
+                tag_names,
+            ),
+        )
+    return rules
+
+
+RECIPE_NAME_RULES: List[Rule] = recipe_name_rules(DEFAULT_LANGUAGE)
+
+RECIPE_NAME_PIPELINE = RulePipeline(RECIPE_NAME_RULES)
+
+# The profanity classifier costs several milliseconds per call, so it comes
+# last: it only scores names that passed every other rule, a chunk at a time.
+PROFANITY_RULE = Rule("profanity", "Profanity", 10.0, has_no_profanity, score_profanity)
+
+
+@lru_cache(maxsize=None)
+def survivor_pipeline(language: str) -> RulePipeline:
+    """
+    Build the pipeline `validate_texts()` runs on names that passed
+    `prefilter_names()`.
+
+    Args:
+        language (str): Name of the language.
+
+    Returns:
+        RulePipeline: The recipe name rules, and the profanity rule if a
+            profanity threshold is set and the profanity classifier supports
+            the language.
+    """
+    rules = recipe_name_rules(language)
+    if PROFANITY_THRESHOLD is not None and LANGUAGES[language].check_profanity:
+        rules.append(PROFANITY_RULE)
+    return RulePipeline(rules)
+
+
+@lru_cache(maxsize=None)
+def build_pipeline(max_length: int, language: str = DEFAULT_LANGUAGE) -> RulePipeline:
+    """
+    Build the validation pipeline used by `process_name()`.
+
+    Rules are listed in order of removal reason precedence, which matches the
+    order the checks historically ran in, so reason counts stay the same.
+
+    Args:
+        max_length (int): Maximum length of a processed name.
+        language (str, optional): Name of the language. Defaults to English.
+
+    Returns:
+        RulePipeline: The pipeline of all validation rules.
+    """
+
+    def is_short_enough(name: RecipeName) -> bool:
+        return len(name.text) <= max_length
+
+    label = LANGUAGES[language].label
+    return RulePipeline(
+        [
+            Rule("digits", "Includes number", 1.0, has_no_digits),
+            Rule(
+                "single_chars",
+                "Invalid single char",
+                1.0,
+                partial(has_no_single_chars, language=language),
+            ),
+            Rule("word_count", "More than 5 words", 0.1, has_at_most_five_words),
+            Rule(
+                f"{language}_words",
+                f"Non-{label} words",
+                1.0,
+                partial(has_only_known_words, language=language),
+            ),
+            Rule("min_length", "Too short", 0.1, is_long_enough),
+            Rule(
+                "max_length",
+                f"Too long (>{max_length} chars)",
+                0.1,
+                is_short_enough,
+            ),
+            *survivor_pipeline(language).rules,
+        ]
+    )
 
 
 def is_valid_recipe_name(name: str) -> bool:
@@ -74,47 +943,26 @@ def is_valid_recipe_name(name: str) -> bool:
     - Contains at least one culinary term
     - Has at least two words
     """
-    # Tokenize and get part-of-speech tags
-    tokens = word_tokenize(name)
-    pos_tags = pos_tag(tokens)
-
-    # Check for personal pronouns and proper nouns
-    if any(pos in ["PRP$", "NNP", "NNPS"] for _, pos in pos_tags):
-        return False
-
-    # Check for filler words
-    if set(tokens).intersection(FILTER_WORDS):
-        return False
-
-    # Check if any culinary terms are present
-    has_culinary_term = any(
-        " ".join(tokens[i:j]).lower() in CULINARY_TERMS
-        for i in range(len(tokens))
-        for j in range(i + 1, len(tokens) + 1)
-    )
+    load_resources()
+    return not RECIPE_NAME_PIPELINE.validate(RecipeName(name))
 
-    # Minimum word requirement
-    min_words = 2
 
-    return len(tokens) >= min_words and has_culinary_term
-
-
-def read_csv(file_name: str) -> pd.DataFrame:
+def read_csv_columns(file_name: str) -> List[str]:
     """
-    Read a CSV file from the input directory.
+    Read the header of a CSV file from the input directory.
 
     Args:
         file_name (str): Name of the CSV file to read.
 
     Returns:
-        pd.DataFrame: DataFrame containing the CSV data.
+        List[str]: Column names of the CSV file.
 
     Raises:
         SystemExit: If the file is not found, empty, or encounters other errors.
     """
     file_path = os.path.join(INPUT_DIR, file_name)
     try:
-        return pd.read_csv(file_path)
+        return list(pd.read_csv(file_path, nrows=0).columns)
     except FileNotFoundError:
         print(f"Error: File '{file_path}' not found.")
         exit(1)
@@ -126,13 +974,377 @@ def read_csv(file_name: str) -> pd.DataFrame:
         exit(1)
 
 
-def process_name(name: str, max_length: int = 50) -> Tuple[str, str]:
+def read_csv_chunks(
+    file_name: str,
+    column_name: str,
+    chunk_size: int = CHUNK_SIZE,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[List[str]]:
+    """
+    Stream a single column of a CSV file from the input directory in chunks.
+
+    Only the requested column is parsed and at most `chunk_size` rows are held
+    in memory at once, so memory use does not grow with the size of the file.
+
+    Args:
+        file_name (str): Name of the CSV file to read.
+        column_name (str): Name of the column containing recipe names.
+        chunk_size (int, optional): Number of rows per chunk. Defaults to CHUNK_SIZE.
+        start (int, optional): Byte offset of the first row to read; must be at
+            the start of a row. Defaults to 0 (the header).
+        end (Optional[int], optional): Byte offset at which reading stops.
+            Defaults to None (the end of the file).
+
+    Yields:
+        List[str]: The values of the column for the next `chunk_size` rows.
+
+    Raises:
+        SystemExit: If the file is not valid CSV.
+    """
+    file_path = os.path.join(INPUT_DIR, file_name)
+    try:
+        if start == 0 and end is None:
+            reader = pd.read_csv(
+                file_path,
+                usecols=[column_name],
+                dtype={column_name: str},
+                chunksize=chunk_size,
+            )
+            with reader:
+                for df in reader:
+                    yield df[column_name].tolist()
+            return
+
+        # Past the header, the column names have to be supplied
+        header = (
+            {} if start == 0 else {"header": None, "names": read_csv_columns(file_name)}
+        )
+        with open(file_path, "rb") as f:
+            if end is None:
+                end = f.seek(0, os.SEEK_END)
+            if start >= end:
+                return
+            f.seek(start)
+            reader = pd.read_csv(
+                io.BufferedReader(FileSlice(f, end)),
+                usecols=[column_name],
+                dtype={column_name: str},
+                chunksize=chunk_size,
+                **header,
+            )
+            with reader:
+                for df in reader:
+                    yield df[column_name].tolist()
+    except pd.errors.ParserError as e:
+        print(f"Error parsing CSV file '{file_path}': {str(e)}")
+        exit(1)
+
+
+def plan_incremental(
+    input_files: List[Tuple[str, str]], manifest: Dict, output_file_name: str
+) -> Tuple[Dict[str, Dict], bool]:
+    """
+    Work out which part of each input file an incremental run has to process.
+
+    A file can resume where the previous run stopped if its column is the same
+    and the bytes processed last time are unchanged, which is checked against
+    the prefix hash in the manifest. If any file cannot resume, a previously
+    processed file is no longer an input, the rules changed or the output is
+    missing, every file is processed from the start instead.
+
+    Args:
+        input_files (List[Tuple[str, str]]): (file name, column name) pairs.
+        manifest (Dict): Manifest of the previous run (see `load_manifest()`).
+        output_file_name (str): Name of the output file of the run.
+
+    Returns:
+        Tuple[Dict[str, Dict], bool]:
+            - Manifest entry for each file, with the byte offset to start at
+            - Whether the run resumes from the existing output
+    """
+    previous = manifest.get("files", {})
+    resumable = (
+        manifest.get("rules") == rules_fingerprint()
+        and os.path.exists(os.path.join(OUTPUT_DIR, output_file_name))
+        and set(previous) <= {file_name for file_name, _ in input_files}
+    )
+
+    plans = {}
+    for file_name, column_name in input_files:
+        file_path = os.path.join(INPUT_DIR, file_name)
+        entry = previous.get(file_name)
+        start = 0
+        if (
+            entry
+            and entry["column"] == column_name
+            and can_resume_at(file_path, entry["offset"])
+        ):
+            start = entry["offset"]
+        # Only the rows past the previous run are scanned for the end of the
+        # last complete record, unless the processed bytes changed
+        end = complete_size(file_path, start)
+        old_digest, new_digest = hash_prefixes(file_path, start, end)
+        if start and old_digest != entry["sha256"]:
+            start = 0
+            end = complete_size(file_path)
+            _, new_digest = hash_prefixes(file_path, 0, end)
+        if entry and start == 0:
+            print(f"'{file_name}' changed since the last run, reprocessing all files.")
+            resumable = False
+        plans[file_name] = {
+            "column": column_name,
+            "start": start,
+            "offset": end,
+            "sha256": new_digest,
+            "rows": entry["rows"] if entry and start else 0,
+        }
+
+    if not resumable:
+        for plan in plans.values():
+            plan["start"] = 0
+            plan["rows"] = 0
+    return plans, resumable
+
+
+def validate_texts(
+    texts: List[str],
+    stats: Optional[RuleStats] = None,
+    language: str = DEFAULT_LANGUAGE,
+) -> Tuple[List[str], int]:
+    """
+    Run the recipe name and profanity rules once per distinct cleaned name.
+
+    Results are memoized in `worker_memo`, so names repeated within a chunk or
+    seen in an earlier chunk of the same worker are not validated again. Once
+    the memo holds MEMO_SIZE names, the oldest are forgotten first. Repeats
+    still count in the rule stats, so they add up with the removal reasons.
+
+    Args:
+        texts (List[str]): Cleaned names that passed `prefilter_names()`.
+        stats (Optional[RuleStats], optional): Stats to record per-rule calls,
+            rejections and timings in. Defaults to None.
+        language (str, optional): Name of the language to validate the names
+            in. Defaults to English.
+
+    Returns:
+        Tuple[List[str], int]:
+            - The removal reason for each name, or "" if it is valid
+            - Number of names that did not need to be validated
+    """
+    keys = [(language, text) for text in texts]
+    pending = list(dict.fromkeys(key for key in keys if key not in worker_memo))
+    candidates = [RecipeName(text) for _, text in pending]
+    pipeline = survivor_pipeline(language)
+    results = dict(zip(pending, pipeline.reject_batch(candidates, stats)))
+    rejected_by = [results[key] if key in results else worker_memo[key] for key in keys]
+    reasons = [rule.reason if rule else "" for rule in rejected_by]
+
+    if stats is not None:
+        validated = set(results)
+        repeats = Counter()
+        for key, rule in zip(keys, rejected_by):
+            if key in validated:
+                validated.discard(key)
+            else:
+                repeats[rule] += 1
+        for rule, count in repeats.items():
+            pipeline.record_repeats(rule, stats, count)
+
+    worker_memo.update(results)
+    overflow = len(worker_memo) - MEMO_SIZE
+    for key in list(itertools.islice(worker_memo, max(overflow, 0))):
+        del worker_memo[key]
+    return reasons, len(texts) - len(pending)
+
+
+def clean_name(name: str, language: str = DEFAULT_LANGUAGE) -> str:
+    """
+    Lowercase a raw recipe name and reduce it to allowed characters.
+
+    Args:
+        name (str): The raw recipe name, which must not be NaN.
+        language (str, optional): Name of the language to clean the name
+            for. Defaults to English.
+
+    Returns:
+        str: The cleaned name, with words separated by single spaces.
+    """
+    name = str(name)
+    clean_regex = CLEAN_REGEX
+    if LANGUAGES[language].unicode_letters:
+        name = unicodedata.normalize("NFC", name)
+        clean_regex = UNICODE_CLEAN_REGEX
+    name = name.strip().lower()
+    name = clean_regex.sub(" ", name)  # Replace non-allowed characters with a space
+    name = SPACE_REGEX.sub(" ", name)  # Replace multiple spaces with a single space
+    return " ".join(name.split())
+
+
+def clean_names(names: List[str], language: str = DEFAULT_LANGUAGE) -> pd.Series:
+    """
+    Clean a batch of raw recipe names with column operations.
+
+    Does what `clean_name()` does, with pandas string operations over the
+    whole batch instead of a Python loop per name.
+
+    Args:
+        names (List[str]): Raw recipe names, none of which may be NaN.
+        language (str, optional): Name of the language to clean the names
+            for. Defaults to English.
+
+    Returns:
+        pd.Series: The cleaned names, as an object column.
+    """
+    with timed(worker_stages, "clean", len(names)):
+        column = pd.Series([str(name) for name in names], dtype=object)
+        clean_regex = CLEAN_REGEX
+        if LANGUAGES[language].unicode_letters:
+            column = column.str.normalize("NFC")
+            clean_regex = UNICODE_CLEAN_REGEX
+        return (
+            column.str.strip()
+            .str.lower()
+            .str.replace(clean_regex, " ", regex=True)
+            .str.split()
+            .str.join(" ")
+        )
+
+
+@lru_cache(maxsize=None)
+def single_char_regex(allowed: FrozenSet[str]) -> re.Pattern:
+    """
+    Build a regex matching a single-character word that is not allowed.
+
+    Args:
+        allowed (FrozenSet[str]): Single-character words allowed.
+
+    Returns:
+        re.Pattern: The compiled regex.
+    """
+    return re.compile(rf"(?:^| )[^ {re.escape(''.join(sorted(allowed)))}](?= |$)")
+
+
+def prefilter_texts(
+    texts: pd.Series,
+    stats: Optional[RuleStats] = None,
+    max_length: int = MAX_NAME_LENGTH,
+    language: str = DEFAULT_LANGUAGE,
+) -> List[str]:
+    """
+    Apply the cheap checks to a batch of cleaned names as column operations.
+
+    Does what the rules of `build_pipeline()` up to the length checks do, with
+    pandas string operations over the whole batch instead of a Python loop
+    per name. Names are kept in an object column, so the operations use
+    Python's string and regex semantics and give exactly the same results.
+    Each check only runs on the names that passed the ones before it, and
+    rejections are recorded in the same order of precedence as in
+    `process_name()`.
+
+    Args:
+        texts (pd.Series): Cleaned names from `clean_names()`.
+        stats (Optional[RuleStats], optional): Stats to record per-rule calls,
+            rejections and timings in. Defaults to None.
+        max_length (int, optional): Maximum length of a processed name.
+            Defaults to MAX_NAME_LENGTH.
+        language (str, optional): Name of the language to check the names
+            in. Defaults to English.
+
+    Returns:
+        List[str]: The removal reason for each name, or "" if it passed the
+            checks.
+    """
+    settings = LANGUAGES[language]
+    reasons = np.full(len(texts), "", dtype=object)
+
+    def word_counts(column: pd.Series) -> np.ndarray:
+        counts = column.str.count(" ").to_numpy() + 1
+        return np.where(column.to_numpy() == "", 0, counts)
+
+    def known_names(column: pd.Series) -> np.ndarray:
+        word_lists = column.str.split()
+        known = known_words(WORD_LEXICONS[language], word_lists)
+        known |= settings.allowed_single_chars
+        return word_lists.map(known.issuperset).to_numpy(dtype=bool)
+
+    invalid_single_char = single_char_regex(settings.allowed_single_chars)
+    checks = [
+        ("digits", "Includes number", lambda c: ~c.str.contains("[0-9]").to_numpy()),
+        (
+            "single_chars",
+            "Invalid single char",
+            lambda c: ~c.str.contains(invalid_single_char).to_numpy(),
+        ),
+        ("word_count", "More than 5 words", lambda c: word_counts(c) <= 5),
+        (f"{language}_words", f"Non-{settings.label} words", known_names),
+        ("min_length", "Too short", lambda c: c.str.len().to_numpy() > 3),
+        (
+            "max_length",
+            f"Too long (>{max_length} chars)",
+            lambda c: c.str.len().to_numpy() <= max_length,
+        ),
+    ]
+
+    remaining = texts
+    for rule_name, reason, check in checks:
+        if remaining.empty:
+            break
+        start = time.perf_counter()
+        passed = check(remaining)
+        reasons[remaining.index[~passed]] = reason
+        if stats is not None:
+            stats.seconds[rule_name] += time.perf_counter() - start
+            stats.calls[rule_name] += len(remaining)
+            stats.rejections[rule_name] += int((~passed).sum())
+        remaining = remaining[passed]
+
+    return reasons.tolist()
+
+
+def prefilter_names(
+    names: List[str],
+    stats: Optional[RuleStats] = None,
+    max_length: int = MAX_NAME_LENGTH,
+    language: str = DEFAULT_LANGUAGE,
+) -> Tuple[List[str], List[str]]:
+    """
+    Clean raw recipe names and apply the cheap checks as column operations.
+
+    Args:
+        names (List[str]): Raw recipe names, none of which may be NaN.
+        stats (Optional[RuleStats], optional): Stats to record per-rule calls,
+            rejections and timings in. Defaults to None.
+        max_length (int, optional): Maximum length of a processed name.
+            Defaults to MAX_NAME_LENGTH.
+        language (str, optional): Name of the language to check the names
+            in. Defaults to English.
+
+    Returns:
+        Tuple[List[str], List[str]]:
+            - The cleaned name for each input
+            - The removal reason for each input, or "" if it passed the checks
+    """
+    texts = clean_names(names, language)
+    return texts.tolist(), prefilter_texts(texts, stats, max_length, language)
+
+
+def process_name(
+    name: str,
+    max_length: int = MAX_NAME_LENGTH,
+    stats: Optional[RuleStats] = None,
+    language: str = DEFAULT_LANGUAGE,
+) -> Tuple[str, str]:
     """
     Process a recipe name by cleaning, validating, and formatting.
 
     Args:
         name (str): The recipe name to process.
         max_length (int, optional): Maximum length of the processed name. Defaults to 50.
+        stats (Optional[RuleStats], optional): Stats to record per-rule calls,
+            rejections and timings in. Defaults to None.
+        language (str, optional): Name of the language to validate the name
+            in. Defaults to English.
 
     Returns:
         Tuple[str, str]: The processed recipe name and a reason if invalid.
@@ -140,111 +1352,351 @@ def process_name(name: str, max_length: int = 50) -> Tuple[str, str]:
     Processing steps:
     1. Remove leading/trailing whitespace and convert to lowercase
     2. Replace non-allowed characters with spaces
-    3. Check for profanity
-    4. Remove single-character words (except allowed ones)
-    5. Validate word count, length, and recipe name validity
+    3. Reject single-character words (except those allowed in the language)
+    4. Validate word count, length, and recipe name validity, running the
+       part-of-speech tagger only on names that passed every other check
+    5. Check for profanity with the profanity classifier, last since it is
+       the most expensive check (English only, if a threshold is set)
     """
     if pd.isna(name):
         return "", "Empty or NaN"
 
-    name = str(name).strip().lower()
-    name = CLEAN_REGEX.sub(" ", name)  # Replace non-allowed characters with a space
-    name = SPACE_REGEX.sub(" ", name)  # Replace multiple spaces with a single space
+    load_resources()
+    load_language(language)
+    candidate = RecipeName(clean_name(name, language))
+    reason = build_pipeline(max_length, language).validate(candidate, stats)
+    if reason:
+        return "", reason
+
+    return candidate.text, ""  # Return the processed name and an empty reason
+
+
+def iter_ranges(
+    blocks: Iterable[List[str]],
+    sizer: TaskSizer,
+    stages: Optional[StageStats] = None,
+) -> Iterator[Tuple[SharedBlock, int, int]]:
+    """
+    Copy blocks of recipe names to shared memory and split them into ranges.
+
+    Each range is sized when it is dispatched, so sizes follow the latest
+    cost per name measured by the sizer.
 
-    words = name.split()
+    Args:
+        blocks (Iterable[List[str]]): Blocks of recipe names, as read.
+        sizer (TaskSizer): Sizer of the ranges.
+        stages (Optional[StageStats], optional): Stats to record the time
+            spent copying the blocks to shared memory in ("share"). Defaults
+            to None.
+
+    Yields:
+        Tuple[SharedBlock, int, int]: The block, and the start and end of the
+            next range of it.
+    """
+    for names in blocks:
+        if not names:
+            continue
+        with timed(stages, "share", len(names)):
+            block = SharedBlock(names)
+        start = 0
+        while start < block.rows:
+            end = min(start + sizer.size, block.rows)
+            yield block, start, end
+            start = end
 
-    # Check if name includes a number
-    if any(char.isdigit() for char in name):
-        return "", "Includes number"
 
-    # Remove single-character words except those in ALLOWED_SINGLE_CHARS
-    words = [word for word in words if len(word) > 1 or word in ALLOWED_SINGLE_CHARS]
-    if len(words) != len(name.split()):
-        return "", "Invalid single char"
+def process_recipe_names(
+    blocks: Iterable[List[str]],
+    pool: multiprocessing.pool.Pool,
+    pbar: tqdm,
+    stages: Optional[StageStats] = None,
+    chunk_size: int = CHUNK_SIZE,
+    chunk_seconds: float = TARGET_TASK_SECONDS,
+    processes: Optional[int] = None,
+) -> Dict[str, ChunkResult]:
+    """
+    Process blocks of recipe names using parallel processing.
+
+    Each block is copied to shared memory once, and workers are only sent
+    (start, end) ranges of it, so dispatching a chunk costs the same however
+    many names it holds. Chunks start at `chunk_size` names and are then
+    sized so each takes about `chunk_seconds` of a worker's time, which keeps
+    the per-chunk overhead negligible. Blocks are dispatched as they are
+    read, so processing starts before the input has been fully read, and
+    only a few chunks per worker are in flight, which bounds the blocks held
+    in memory.
+
+    Results are collected in whatever order the workers finish them, so a
+    slow chunk does not hold up the others, but merged in input order, so the
+    output is the same as processing the chunks one after another.
+
+    When profiling, records the time spent reading blocks ("read"), copying
+    them to shared memory ("share"), waiting for results ("wait") and merging
+    them ("merge"), and the time chunks spent queued or in transit to and
+    from the workers rather than being processed ("dispatch").
 
-    if len(words) > 5:
-        return "", "More than 5 words"
+    Args:
+        blocks (Iterable[List[str]]): Blocks of recipe names to process.
+        pool (multiprocessing.pool.Pool): Worker pool from `create_pool()`.
+        pbar (tqdm): Progress bar object to update.
+        stages (Optional[StageStats], optional): Stats to record the stages
+            of the main process in. Defaults to None.
+        chunk_size (int, optional): Number of names per chunk until their
+            cost is measured, and always if `chunk_seconds` is 0. Defaults to
+            CHUNK_SIZE.
+        chunk_seconds (float, optional): Seconds of worker time per chunk.
+            Defaults to TARGET_TASK_SECONDS.
+        processes (Optional[int], optional): Number of workers in the pool.
+            Defaults to None (one per CPU).
 
-    if not all(word in ENGLISH_WORDS or word in ALLOWED_SINGLE_CHARS for word in words):
-        return "", "Non-English words"
+    Returns:
+        Dict[str, ChunkResult]: Processed names, removal reasons and
+            statistics of each language the workers validate names in.
+    """
+    results = {language: ChunkResult() for language in ACTIVE_LANGUAGES}
+    sizer = TaskSizer(chunk_size, chunk_seconds)
+    tasks = iter_ranges(timed_iter(blocks, stages, "read"), sizer, stages)
+    max_in_flight = (processes or multiprocessing.cpu_count()) * 4
+    finished = queue.SimpleQueue()
+
+    def collect(i: int, chunk_results: Dict[str, ChunkResult]) -> None:
+        finished.put((i, chunk_results))
+
+    # Results waiting for the chunks before them, and when each chunk was sent
+    pending: Dict[int, Dict[str, ChunkResult]] = {}
+    sent: Dict[int, float] = {}
+    # Blocks still in use, with the number of the last chunk dispatched of each
+    live: deque = deque()
+    dispatched = merged = 0
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and dispatched - merged < max_in_flight:
+                task = next(tasks, None)
+                if task is None:
+                    exhausted = True
+                    break
+                block, start, end = task
+                if live and live[-1][0] is block:
+                    live[-1][1] = dispatched
+                else:
+                    live.append([block, dispatched])
+                sent[dispatched] = time.perf_counter()
+                pool.apply_async(
+                    process_range,
+                    (block.name, start, end),
+                    callback=partial(collect, dispatched),
+                    error_callback=finished.put,
+                )
+                dispatched += 1
+            if merged == dispatched:
+                break
+
+            with timed(stages, "wait"):
+                finished_chunk = finished.get()
+            if isinstance(finished_chunk, BaseException):
+                raise finished_chunk
+            i, chunk_results = finished_chunk
+            first = next(iter(chunk_results.values()))
+            sizer.record(first.total_names, first.seconds)
+            latency = time.perf_counter() - sent.pop(i)
+            if stages is not None:
+                stages.add("dispatch", latency - first.seconds)
+            pbar.update(first.total_names)
+
+            pending[i] = chunk_results
+            with timed(stages, "merge"):
+                while merged in pending:
+                    for language, chunk_result in pending.pop(merged).items():
+                        results[language].update(chunk_result)
+                    merged += 1
+            # A block can be freed once its last chunk is merged, unless more
+            # of it may still be dispatched
+            while live and live[0][1] < merged and (len(live) > 1 or exhausted):
+                live.popleft()[0].release()
+    finally:
+        for block, _ in live:
+            block.release()
+
+    return results
+
+
+def collapse_near_duplicates(
+    name_counts: Counter, pool: multiprocessing.pool.Pool, threshold: float
+) -> Tuple[Counter, int]:
+    """
+    Merge near duplicate names into one canonical form per cluster.
 
-    name = " ".join(words).strip()
+    The MinHash signatures of the names are computed across the worker pool,
+    and candidates are found with LSH banding (see `lib/near_duplicates.py`),
+    so the names are never compared pairwise. The most frequent name of a
+    cluster (then the shortest) is its canonical form and receives the
+    occurrence counts of the others.
 
-    if len(name) <= 3:
-        return "", "Too short"
+    Args:
+        name_counts (Counter): Occurrence count of each distinct name.
+        pool (multiprocessing.pool.Pool): Worker pool from `create_pool()`.
+        threshold (float): Minimum estimated Jaccard similarity of two names'
+            character shingles for them to be near duplicates.
 
-    if len(name) > max_length:
-        return "", f"Too long (>{max_length} chars)"
+    Returns:
+        Tuple[Counter, int]: The collapsed counts, in the original order, and
+            the number of names merged into another.
+    """
+    names = list(name_counts)
+    if len(names) < 2:
+        return name_counts, 0
 
-    if not is_valid_recipe_name(name):
-        return "", "Invalid recipe name"
+    chunks = (
+        names[i : i + MINHASH_CHUNK_SIZE]
+        for i in range(0, len(names), MINHASH_CHUNK_SIZE)
+    )
+    signatures = np.concatenate(list(pool.imap(minhash_signatures, chunks)))
+    preference = sorted(
+        range(len(names)),
+        key=lambda i: (-name_counts[names[i]], len(names[i]), names[i]),
+    )
+    ranks = np.empty(len(names), dtype=np.int64)
+    ranks[preference] = np.arange(len(names))
+    canonicals = find_canonicals(signatures, ranks, threshold)
 
-    return name, ""  # Return the processed name and an empty string for the reason
+    collapsed = name_counts.copy()
+    merged = np.flatnonzero(canonicals != np.arange(len(names)))
+    for i in merged:
+        collapsed[names[canonicals[i]]] += collapsed.pop(names[i])
+    return collapsed, len(merged)
 
 
-def process_recipe_names(
-    df: pd.DataFrame, column_name: str, pbar: tqdm
-) -> Tuple[List[str], Counter, int]:
+def language_output_name(file_name: str, language: str) -> str:
     """
-    Process recipe names from a DataFrame using parallel processing.
+    Get the name of the output file of a language.
+
+    When names are validated in a single language, the output file name is
+    used as is, so runs without --languages write the same file as before.
 
     Args:
-        df (pd.DataFrame): DataFrame containing recipe names.
-        column_name (str): Name of the column containing recipe names.
-        pbar (tqdm): Progress bar object to update.
+        file_name (str): Name of the output file, with its extension.
+        language (str): Name of the language.
 
     Returns:
-        Tuple[List[str], Counter, int]:
-            - List of processed names
-            - Counter of removal reasons
-            - Total number of names processed
+        str: `<name>_<language>.<extension>` when several languages are
+            active, otherwise the file name unchanged.
     """
-    total_names = len(df[column_name])
-
-    chunk_size = 1000
-    chunks = [
-        df[column_name][i : i + chunk_size] for i in range(0, total_names, chunk_size)
-    ]
+    if len(ACTIVE_LANGUAGES) == 1:
+        return file_name
+    stem, extension = os.path.splitext(file_name)
+    return f"{stem}_{language}{extension}"
 
-    processed_names = []
-    removal_reasons = Counter()
 
-    with multiprocessing.Pool(processes=multiprocessing.cpu_count()) as pool:
-        results = pool.imap(process_chunk, chunks)
-        for chunk_names, chunk_reasons, size in results:
-            processed_names.extend(chunk_names)
-            removal_reasons.update(chunk_reasons)
-            pbar.update(size)
+def read_output(file_name: str) -> Counter:
+    """
+    Read the processed recipe names of a previous run from the output directory.
 
-    return processed_names, removal_reasons, total_names
+    Outputs written before occurrence counts were recorded count each name once.
 
+    Args:
+        file_name (str): Name of the CSV, JSON, Parquet or Arrow output file.
 
-def save_to_csv(names: List[str], file_name: str) -> None:
+    Returns:
+        Counter: Occurrence count of each processed recipe name, in file order.
     """
-    Save processed recipe names to a CSV file.
+    file_path = os.path.join(OUTPUT_DIR, file_name)
+    counts = Counter()
+    if is_columnar(file_name):
+        for name, count in iter_names(file_path):
+            counts[name] += count
+        return counts
+    with open(file_path, "r", newline="") as f:
+        if file_name.endswith(".json"):
+            for entry in json.load(f):
+                if isinstance(entry, str):
+                    counts[entry] += 1
+                else:
+                    counts[entry["name"]] += entry["count"]
+            return counts
+        reader = csv.reader(f)
+        next(reader)  # Skip header row
+        for row in reader:
+            counts[row[0]] += int(row[1]) if len(row) > 1 else 1
+    return counts
+
+
+def save_to_csv(names: Iterable[Tuple[str, int]], file_name: str) -> int:
+    """
+    Save processed recipe names and their occurrence counts to a CSV file.
+
+    Rows are written as the names are consumed, so the names can be streamed.
 
     Args:
-        names (List[str]): List of processed recipe names.
+        names (Iterable[Tuple[str, int]]): Each processed recipe name and its
+            occurrence count.
         file_name (str): Name of the output CSV file.
+
+    Returns:
+        int: Number of names saved.
     """
     file_path = os.path.join(OUTPUT_DIR, file_name)
-    df = pd.DataFrame(names, columns=["recipe_name"])
-    df.to_csv(file_path, index=False)
-    print(f"Saved {len(names)} unique recipe names to {file_path}")
-
-
-def save_to_json(names: List[str], file_name: str) -> None:
+    saved = 0
+    with open(file_path, "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["recipe_name", "count"])
+        for row in names:
+            writer.writerow(row)
+            saved += 1
+    print(f"Saved {saved} unique recipe names to {file_path}")
+    return saved
+
+
+def save_to_json(names: Iterable[Tuple[str, int]], file_name: str) -> int:
     """
-    Save processed recipe names to a JSON file.
+    Save processed recipe names and their occurrence counts to a JSON file.
+
+    Entries are written as the names are consumed, so the names can be
+    streamed; the file is formatted like `json.dump(..., indent=2)`.
 
     Args:
-        names (List[str]): List of processed recipe names.
+        names (Iterable[Tuple[str, int]]): Each processed recipe name and its
+            occurrence count.
         file_name (str): Name of the output JSON file.
+
+    Returns:
+        int: Number of names saved.
     """
     file_path = os.path.join(OUTPUT_DIR, file_name)
+    saved = 0
     with open(file_path, "w") as f:
-        json.dump(names, f, indent=2)
-    print(f"Saved {len(names)} unique recipe names to {file_path}")
+        f.write("[")
+        for name, count in names:
+            f.write(
+                f'{"," if saved else ""}\n  {{\n    "name": {json.dumps(name)},'
+                f'\n    "count": {count}\n  }}'
+            )
+            saved += 1
+        f.write("\n]" if saved else "]")
+    print(f"Saved {saved} unique recipe names to {file_path}")
+    return saved
+
+
+def save_to_columnar(names: Iterable[Tuple[str, int]], file_name: str) -> int:
+    """
+    Save processed recipe names and their occurrence counts to a Parquet or
+    Arrow IPC file, depending on its extension.
+
+    Names are written in record batches as they are consumed, with `name` and
+    `count` columns (see `lib/columnar.py`).
+
+    Args:
+        names (Iterable[Tuple[str, int]]): Each processed recipe name and its
+            occurrence count.
+        file_name (str): Name of the output `.parquet` or `.arrow` file.
+
+    Returns:
+        int: Number of names saved.
+    """
+    file_path = os.path.join(OUTPUT_DIR, file_name)
+    saved = write_names(names, file_path)
+    print(f"Saved {saved} unique recipe names to {file_path}")
+    return saved
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -257,8 +1709,20 @@ def parse_arguments() -> argparse.Namespace:
     Arguments:
     - input: Comma-separated list of input CSV files with optional column names
     - output: Name of the output file (without extension)
-    - format: Output file format (csv or json)
+    - format: Output file format (csv, json, parquet or arrow)
     - default-column: Default column name to use if not specified for a file
+    - chunk-size: Number of rows per chunk sent to a worker, until chunks are sized by cost
+    - chunk-seconds: Seconds of worker time per chunk, or 0 for fixed-size chunks
+    - workers: Number of worker processes
+    - cache: Reuse results of earlier runs from a persistent cache
+    - incremental: Only process rows appended since the previous run
+    - offline: Never download NLTK resources, only check they are installed
+    - near-duplicates: Merge near duplicate names, with an optional threshold
+    - profanity-threshold: Probability of profanity at which a name is rejected
+    - profile: Time each stage and write a JSON report, with an optional path
+    - cprofile: Write a cProfile dump of each worker to a directory
+    - languages: Comma-separated list of languages to validate names in
+    - out-of-core: Spill kept names to sorted runs on disk and write sorted output
     """
     parser = argparse.ArgumentParser(description="Process recipe names from CSV files.")
     parser.add_argument(
@@ -273,9 +1737,9 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--format",
         "-f",
-        choices=["csv", "json"],
+        choices=["csv", "json", *COLUMNAR_EXTENSIONS],
         default="csv",
-        help="Output file format (default: csv)",
+        help="Output file format; parquet and arrow (Arrow IPC) are columnar, much smaller and faster for generate.py to read (default: csv)",
     )
     parser.add_argument(
         "--default-column",
@@ -283,10 +1747,92 @@ def parse_arguments() -> argparse.Namespace:
         default="name",
         help="Default column name to use if not specified for a file (default: name)",
     )
+    parser.add_argument(
+        "--chunk-size",
+        "-c",
+        type=int,
+        default=CHUNK_SIZE,
+        help=f"Number of rows per chunk sent to a worker, until chunks are sized by --chunk-seconds (default: {CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--chunk-seconds",
+        type=float,
+        default=TARGET_TASK_SECONDS,
+        help=f"Size chunks so each takes about this many seconds of a worker's time, from the measured cost per name, or 0 to keep --chunk-size fixed (default: {TARGET_TASK_SECONDS})",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help="Number of worker processes (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=CACHE_PATH,
+        default=None,
+        help="Reuse results of earlier runs from a SQLite cache, invalidated when the rules change (default path: data/process_cache.sqlite)",
+    )
+    parser.add_argument(
+        "--incremental",
+        "-i",
+        action="store_true",
+        help="Only process rows appended to the input files since the previous incremental run and merge them into the existing output",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never download NLTK resources, only check that they are installed",
+    )
+    parser.add_argument(
+        "--near-duplicates",
+        nargs="?",
+        type=float,
+        const=NEAR_DUPLICATE_THRESHOLD,
+        default=None,
+        metavar="THRESHOLD",
+        help=f"Merge near duplicate names into the most frequent one, using MinHash/LSH over character shingles (default similarity threshold: {NEAR_DUPLICATE_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--profanity-threshold",
+        type=float,
+        default=PROFANITY_THRESHOLD,
+        metavar="THRESHOLD",
+        help="Reject names the profanity classifier gives at least this probability of profanity (default: no profanity check)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PATH",
+        help="Time each stage in the main process and the workers, print a summary and write a JSON report (default path: <output>.profile.json in data/sanitized)",
+    )
+    parser.add_argument(
+        "--cprofile",
+        metavar="DIR",
+        help="Write a cProfile dump of each worker to DIR/<pid>.prof",
+    )
+    parser.add_argument(
+        "--languages",
+        "-l",
+        default=DEFAULT_LANGUAGE,
+        help=f"Comma-separated list of languages to validate names in, each written to its own output file (available: {', '.join(LANGUAGES)}; default: {DEFAULT_LANGUAGE})",
+    )
+    parser.add_argument(
+        "--out-of-core",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="DIR",
+        help="Keep memory flat for inputs larger than RAM: workers spill kept names to sorted runs in a temporary directory under DIR (default: the system temporary directory), which are merged into a sorted output",
+    )
     return parser.parse_args()
 
 
 if __name__ == "__main__":
+    start_time = time.perf_counter()
+
     # Parse command-line arguments
     args = parse_arguments()
 
@@ -318,67 +1864,302 @@ if __name__ == "__main__":
     else:
         output_file_name = f"processed_recipes.{output_format}"
 
+    # The threshold and languages are part of the rules, so they are set before
+    # fingerprinting them
+    PROFANITY_THRESHOLD = args.profanity_threshold
+    ACTIVE_LANGUAGES = list(
+        dict.fromkeys(
+            language.strip().lower() for language in args.languages.split(",")
+        )
+    )
+    for language in ACTIVE_LANGUAGES:
+        if language not in LANGUAGES:
+            print(
+                f"Error: Unknown language '{language}'. Available languages: {', '.join(LANGUAGES)}."
+            )
+            exit(1)
+        if language != DEFAULT_LANGUAGE and not os.path.exists(
+            word_list_path(language)
+        ):
+            print(
+                f"Error: Word list for '{language}' not found. Save one word per line to '{word_list_path(language)}'."
+            )
+            exit(1)
+    if len(ACTIVE_LANGUAGES) > 1 and (args.cache or args.incremental):
+        print("Error: --cache and --incremental only support a single language.")
+        exit(1)
+    if args.out_of_core is not None and (
+        args.incremental or args.near_duplicates is not None
+    ):
+        print(
+            "Error: --out-of-core cannot be combined with --incremental or --near-duplicates."
+        )
+        exit(1)
+
     # Ensure output directory exists
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    print(f"Reading CSV file{len(input_files) > 1 and 's' or ''}...")
-    dataframes = []
-    total_rows = 0
+    # Check every input up front so a bad file fails before any processing starts
     for file_name, column_name in input_files:
-        df = read_csv(file_name)
-        if column_name not in df.columns:
+        if column_name not in read_csv_columns(file_name):
             print(f"Error: '{column_name}' column not found in the file '{file_name}'.")
             exit(1)
-        total_rows += len(df[column_name])
-        dataframes.append((df, column_name))
-
-    all_processed_names = []
-    all_removal_reasons = Counter()
-    all_total_names = 0
-
-    with tqdm(
-        total=total_rows,
-        desc="Processing recipes",
-        unit="recipe",
-        position=0,
-        leave=True,
-    ) as pbar:
-        for df, column_name in dataframes:
-            processed_names, removal_reasons, total_names = process_recipe_names(
-                df, column_name, pbar
+
+    # Install missing NLTK resources and build the lexicons before any worker starts
+    ensure_nltk_resources(args.offline)
+    build_lexicons(ACTIVE_LANGUAGES)
+
+    # Open the cache once up front, dropping results computed under old rules
+    if args.cache:
+        ResultCache(args.cache, rules_fingerprint()).close()
+
+    # Byte range of each input file to process, and names already in the output
+    plans = {file_name: {"start": 0, "offset": None} for file_name, _ in input_files}
+    existing_names = Counter()
+    if args.incremental:
+        manifest_path = os.path.join(OUTPUT_DIR, f"{output_file_name}.manifest.json")
+        plans, resumed = plan_incremental(
+            input_files, load_manifest(manifest_path), output_file_name
+        )
+        if resumed:
+            existing_names = read_output(output_file_name)
+
+    # Stages of the main process, only timed when profiling
+    stages = StageStats() if args.profile is not None else None
+
+    # Directory the workers spill sorted runs of kept names to, when out of core
+    spill = None
+    if args.out_of_core is not None:
+        spill = tempfile.TemporaryDirectory(
+            prefix="process_spill_", dir=args.out_of_core or None
+        )
+
+    pool = create_pool(
+        args.cache,
+        args.profanity_threshold,
+        stages is not None,
+        args.cprofile,
+        args.workers,
+        ACTIVE_LANGUAGES,
+        spill.name if spill else None,
+    )
+    startup_time = time.perf_counter() - start_time
+
+    save = {"csv": save_to_csv, "json": save_to_json}.get(
+        output_format, save_to_columnar
+    )
+    results = {language: ChunkResult() for language in ACTIVE_LANGUAGES}
+
+    # Names left to save (None once saved) and number of names kept per language
+    outputs: Dict[str, Tuple[Optional[Counter], int]] = {}
+    near_duplicates_time = 0.0
+    with pool:
+        with tqdm(
+            desc="Processing recipes",
+            unit="recipe",
+            position=0,
+            leave=True,
+        ) as pbar:
+            for file_name, column_name in input_files:
+                plan = plans[file_name]
+                blocks = read_csv_chunks(
+                    file_name,
+                    column_name,
+                    BLOCK_ROWS,
+                    plan["start"],
+                    plan["offset"],
+                )
+                file_results = process_recipe_names(
+                    blocks,
+                    pool,
+                    pbar,
+                    stages,
+                    args.chunk_size,
+                    args.chunk_seconds,
+                    args.workers,
+                )
+                for language, file_result in file_results.items():
+                    results[language].update(file_result)
+                plan["rows"] = (
+                    plan.get("rows", 0) + file_results[ACTIVE_LANGUAGES[0]].total_names
+                )
+
+        # Out of core, names are deduplicated while the workers' runs are merged
+        for language, result in results.items() if spill is None else ():
+            # Every occurrence after a name's first, including names already in
+            # the output, is a duplicate; the occurrences are added to the count
+            with timed(stages, "dedup", len(result.name_counts)):
+                new_names = [
+                    name for name in result.name_counts if name not in existing_names
+                ]
+                result.removal_reasons["Duplicates"] = sum(
+                    result.name_counts.values()
+                ) - len(new_names)
+                all_processed_names = existing_names.copy()
+                all_processed_names.update(result.name_counts)
+
+            # Merge near duplicates, with the worker pool computing the signatures
+            if args.near_duplicates is not None:
+                near_duplicates_start = time.perf_counter()
+                all_processed_names, merged = collapse_near_duplicates(
+                    all_processed_names, pool, args.near_duplicates
+                )
+                result.removal_reasons["Near duplicates"] = merged
+                new_names = [name for name in new_names if name in all_processed_names]
+                elapsed = time.perf_counter() - near_duplicates_start
+                near_duplicates_time += elapsed
+                if stages is not None:
+                    stages.add(
+                        "near_duplicates", elapsed, len(all_processed_names) + merged
+                    )
+            outputs[language] = (all_processed_names, len(new_names))
+
+        # Closing rather than terminating the pool lets workers write their profiles
+        pool.close()
+        pool.join()
+
+    # The workers wrote their last runs on exit; a k-way merge of the sorted runs
+    # drops duplicates and streams the names, sorted, straight into the output
+    if spill:
+        for language, result in results.items():
+            write_start = time.perf_counter()
+            language_dir = os.path.join(spill.name, language)
+            runs = sorted(
+                os.path.join(language_dir, run)
+                for run in (
+                    os.listdir(language_dir) if os.path.isdir(language_dir) else []
+                )
             )
-            all_processed_names.extend(processed_names)
-            all_removal_reasons.update(removal_reasons)
-            all_total_names += total_names
-
-    # Perform duplicate checking
-    unique_names = set()
-    all_removal_reasons["Duplicates"] = 0
-    for name in all_processed_names:
-        if name in unique_names:
-            all_removal_reasons["Duplicates"] += 1
-        else:
-            unique_names.add(name)
+            saved = save(
+                merge_runs(runs), language_output_name(output_file_name, language)
+            )
+            kept = result.total_names - sum(result.removal_reasons.values())
+            result.removal_reasons["Duplicates"] = kept - saved
+            outputs[language] = (None, saved)
+            if stages is not None:
+                stages.add("write", time.perf_counter() - write_start, saved)
+        spill.cleanup()
 
-    all_names_removed = all_total_names - len(unique_names)
+    # Statistics that do not depend on the language are in the first result
+    shared = results[ACTIVE_LANGUAGES[0]]
+    all_total_names = shared.total_names
 
     print("\n" + "=" * 30)
     print("Processing Summary")
     print("=" * 30)
     print(f"Total names processed: {all_total_names}")
-    print(f"Total names removed: {all_names_removed}")
-    print(f"Names kept: {len(unique_names)}")
-    print("\nRemoval reasons:")
-    print("-" * 30)
-    for reason, count in all_removal_reasons.most_common():
-        print(f"{reason:<20} - {count:>7}")
-    print("-" * 30 + "\n")
-
-    # Convert set back to list
-    all_processed_names = list(unique_names)
-
-    # Save processed names to file in the specified format
-    if output_format == "csv":
-        save_to_csv(all_processed_names, output_file_name)
-    else:
-        save_to_json(all_processed_names, output_file_name)
+    if args.cache:
+        lookups = all_total_names - shared.removal_reasons["Empty or NaN"]
+        hit_rate = shared.cache_hits / lookups if lookups else 0.0
+        print(f"Cache hits: {shared.cache_hits} of {lookups} ({hit_rate:.1%})")
+    print(f"Startup time: {startup_time:.2f}s")
+    if args.near_duplicates is not None:
+        print(f"Near duplicate merging time: {near_duplicates_time:.2f}s")
+    if shared.workers:
+        startups = [startup for startup, _ in shared.workers.values()]
+        peaks = [peak / 1024 for _, peak in shared.workers.values()]
+        print(
+            f"Workers: {len(shared.workers)}, "
+            f"startup {sum(startups) / len(startups):.2f}s avg, "
+            f"peak RSS {sum(peaks) / len(peaks):.0f} MB avg / {max(peaks):.0f} MB max"
+        )
+
+    for language, result in results.items():
+        all_processed_names, names_kept = outputs[language]
+        if len(ACTIVE_LANGUAGES) > 1:
+            print("\n" + "=" * 30)
+            print(f"{LANGUAGES[language].label} ({LANGUAGES[language].table})")
+            print("=" * 30)
+        print(f"Total names removed: {all_total_names - names_kept}")
+        print(f"Names kept: {names_kept}")
+        if existing_names:
+            print(f"Names already in output: {len(existing_names)}")
+        print(f"Validations skipped for repeated names: {result.repeats}")
+        print("\nRemoval reasons:")
+        print("-" * 30)
+        for reason, count in result.removal_reasons.most_common():
+            print(f"{reason:<20} - {count:>7}")
+        print("-" * 30)
+        print("\nValidation rules (in evaluation order):")
+        print("-" * 60)
+        print(
+            f"{'Rule':<16} {'Calls':>10} {'Rejected':>10} {'Time (s)':>10} {'us/call':>9}"
+        )
+        for rule, calls, rejected, seconds in result.rule_stats.rows(
+            build_pipeline(MAX_NAME_LENGTH, language).rules
+        ):
+            per_call = seconds / calls * 1e6 if calls else 0.0
+            print(
+                f"{rule:<16} {calls:>10} {rejected:>10} {seconds:>10.2f} {per_call:>9.1f}"
+            )
+        print("-" * 60 + "\n")
+
+        # Save processed names to file in the specified format, unless they
+        # were already streamed out of core
+        if all_processed_names is not None:
+            with timed(stages, "write", len(all_processed_names)):
+                save(
+                    all_processed_names.items(),
+                    language_output_name(output_file_name, language),
+                )
+
+    # Record how far each input file was processed, only once the output is saved
+    if args.incremental:
+        for plan in plans.values():
+            del plan["start"]
+        save_manifest(manifest_path, {"rules": rules_fingerprint(), "files": plans})
+
+    if stages is not None:
+        total_time = time.perf_counter() - start_time
+        print(
+            "\nStages (main process wall time, then worker time summed over workers):"
+        )
+        print("-" * 60)
+        print(f"{'Stage':<16} {'Calls':>10} {'Time (s)':>10} {'us/call':>9}")
+        for stage_stats in (stages, shared.stages):
+            for stage, calls, seconds in stage_stats.rows():
+                per_call = seconds / calls * 1e6 if calls else 0.0
+                print(f"{stage:<16} {calls:>10} {seconds:>10.2f} {per_call:>9.1f}")
+            print("-" * 60)
+        print(
+            f"Total time: {total_time:.2f}s, main peak RSS {peak_rss_kb() / 1024:.0f} MB"
+        )
+
+        def language_report(language: str) -> Dict:
+            result = results[language]
+            return {
+                "names_kept": outputs[language][1],
+                "rules": {
+                    rule: {"calls": calls, "rejections": rejected, "seconds": seconds}
+                    for rule, calls, rejected, seconds in result.rule_stats.rows(
+                        build_pipeline(MAX_NAME_LENGTH, language).rules
+                    )
+                },
+                "removal_reasons": dict(result.removal_reasons),
+            }
+
+        profile_path = args.profile or os.path.join(
+            OUTPUT_DIR, f"{output_file_name}.profile.json"
+        )
+        save_report(
+            profile_path,
+            {
+                "total_seconds": total_time,
+                "startup_seconds": startup_time,
+                "total_names": all_total_names,
+                **language_report(ACTIVE_LANGUAGES[0]),
+                "main": {"peak_rss_kb": peak_rss_kb(), "stages": stages.to_dict()},
+                "workers": {
+                    "stages": shared.stages.to_dict(),
+                    "processes": {
+                        str(pid): {"startup_seconds": startup, "peak_rss_kb": peak}
+                        for pid, (startup, peak) in shared.workers.items()
+                    },
+                },
+                "languages": {
+                    language: language_report(language) for language in ACTIVE_LANGUAGES
+                },
+                "cprofile_dir": args.cprofile,
+            },
+        )
+        print(f"Saved profiling report to {profile_path}")
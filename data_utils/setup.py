@@ -10,5 +10,6 @@ setup(
         "numpy",
         "tqdm",
         "alt-profanity-check",
+        "pyarrow",
     ],
 )
@@ -0,0 +1,39 @@
+from scripts.process import (
+    RecipeName,
+    clean_name,
+    clean_names,
+    has_at_most_five_words,
+    has_no_single_chars,
+)
+
+# Raw names with characters outside ASCII, and how English cleaned them before
+# other languages were supported
+ENGLISH_NAMES = {
+    "½ apple pie": "apple pie",
+    "Crème Brûlée Tart": "cr me br l e tart",
+    "Jalapeño Poppers": "jalape o poppers",
+    "Cafe\u0301 au lait": "cafe au lait",
+    "Mom's ３-bean chili": "mom's -bean chili",
+    "Fish & Chips!": "fish & chips",
+}
+
+
+def test_english_cleaning_is_ascii() -> None:
+    """English names are cleaned exactly as before, keeping only ASCII."""
+    names = list(ENGLISH_NAMES)
+    assert [clean_name(name) for name in names] == list(ENGLISH_NAMES.values())
+    assert clean_names(names).tolist() == list(ENGLISH_NAMES.values())
+
+
+def test_english_rules_see_ascii_names() -> None:
+    """Fractions are dropped rather than kept as single characters."""
+    assert has_no_single_chars(RecipeName(clean_name("½ apple pie")))
+    assert not has_at_most_five_words(RecipeName(clean_name("Crème Brûlée Tart")))
+
+
+def test_other_languages_keep_accented_letters() -> None:
+    """Other languages keep letters outside ASCII, after NFC normalization."""
+    names = ["Crème Brûlée Tart", "Cafe\u0301 au lait"]
+    expected = ["crème brûlée tart", "caf\u00e9 au lait"]
+    assert [clean_name(name, "french") for name in names] == expected
+    assert clean_names(names, "french").tolist() == expected
@@ -0,0 +1,83 @@
+from typing import List
+import pytest
+from lib.incremental import can_resume_at, complete_size
+from scripts import process
+
+HEADER = b"id,recipe_name\n"
+
+
+@pytest.fixture
+def input_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(process, "INPUT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def read_rows(file_name: str, start: int, end: int) -> List[str]:
+    """Read the names of an incremental run over a byte range of a file."""
+    return [
+        name
+        for chunk in process.read_csv_chunks(file_name, "recipe_name", 2, start, end)
+        for name in chunk
+    ]
+
+
+def test_appended_rows_are_read_once(input_dir):
+    path = input_dir / "names.csv"
+    path.write_bytes(HEADER + b"1,apple pie\n2,beef stew\n")
+    first = complete_size(str(path))
+    assert first == path.stat().st_size
+    assert read_rows("names.csv", 0, first) == ["apple pie", "beef stew"]
+
+    with open(path, "ab") as f:
+        f.write(b"3,carrot cake\n4,duck soup\n")
+    assert can_resume_at(str(path), first)
+    second = complete_size(str(path), first)
+    assert second == path.stat().st_size
+    assert read_rows("names.csv", first, second) == ["carrot cake", "duck soup"]
+
+
+def test_cut_inside_quoted_field_waits_for_the_record(input_dir):
+    path = input_dir / "names.csv"
+    complete = HEADER + b'1,"apple\npie"\n'
+    path.write_bytes(complete + b'2,"beef\nst')
+    first = complete_size(str(path))
+    assert first == len(complete)
+    assert read_rows("names.csv", 0, first) == ["apple\npie"]
+
+    with open(path, "ab") as f:
+        f.write(b'ew ""hot""\n"\n')
+    second = complete_size(str(path), first)
+    assert second == path.stat().st_size
+    assert read_rows("names.csv", first, second) == ['beef\nstew "hot"\n']
+
+
+def test_last_row_without_newline_is_read(input_dir):
+    path = input_dir / "names.csv"
+    path.write_bytes(HEADER + b"1,apple pie\n2,beef stew")
+    first = complete_size(str(path))
+    assert first == path.stat().st_size
+    assert read_rows("names.csv", 0, first) == ["apple pie", "beef stew"]
+
+    with open(path, "ab") as f:
+        f.write(b"\n3,carrot cake\n")
+    assert can_resume_at(str(path), first)
+    second = complete_size(str(path), first)
+    assert read_rows("names.csv", first, second) == ["carrot cake"]
+
+
+def test_continued_last_row_cannot_resume(input_dir):
+    path = input_dir / "names.csv"
+    path.write_bytes(HEADER + b"1,apple pie\n2,beef")
+    first = complete_size(str(path))
+    with open(path, "ab") as f:
+        f.write(b" stew\n")
+    assert not can_resume_at(str(path), first)
+    assert not can_resume_at(str(path), path.stat().st_size + 1)
+
+
+def test_invalid_csv_exits_cleanly(input_dir, capsys):
+    path = input_dir / "names.csv"
+    path.write_bytes(HEADER + b'1,"apple pie\n')
+    with pytest.raises(SystemExit):
+        read_rows("names.csv", 0, None)
+    assert "Error parsing CSV file" in capsys.readouterr().out
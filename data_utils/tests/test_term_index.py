@@ -0,0 +1,54 @@
+from typing import List
+from lib.term_index import TermIndex
+from scripts.benchmark import find_mismatches, sample_recipe_names, span_has_term
+
+# Number of synthetic recipe names the equivalence check runs on, and their seed
+SAMPLE_SIZE = 20_000
+SAMPLE_SEED = 0
+
+
+def sample_corpus(count: int = SAMPLE_SIZE, seed: int = SAMPLE_SEED) -> List[List[str]]:
+    """
+    Tokenize a reproducible corpus of synthetic raw recipe names.
+
+    The names come from the benchmark's `sample_recipe_names()`, so they mix
+    case, punctuation, possessives and multi-word culinary terms.
+
+    Args:
+        count (int, optional): Number of rows to generate. Defaults to
+            SAMPLE_SIZE.
+        seed (int, optional): Seed for the generator. Defaults to SAMPLE_SEED.
+
+    Returns:
+        List[List[str]]: Tokens of each name, skipping missing names.
+    """
+    return [name.split() for name in sample_recipe_names(count, seed) if name]
+
+
+def test_term_index_matches_span_lookup() -> None:
+    """TermIndex finds a culinary term in exactly the names the span lookup does."""
+    corpus = sample_corpus()
+    assert any(span_has_term(tokens) for tokens in corpus)
+    assert not any(span_has_term(tokens) for tokens in (["xyzzy"], []))
+    mismatches = find_mismatches(corpus)
+    assert not mismatches, f"{len(mismatches)} names differ, e.g. {mismatches[0]}"
+
+
+def test_term_index_multi_word_terms() -> None:
+    """Multi-word terms only match as whole, contiguous token spans."""
+    terms = {"soy sauce", "pie"}
+    corpus = [
+        ["Soy", "Sauce", "Chicken"],
+        ["soy", "chicken", "sauce"],
+        ["soysauce"],
+        ["Apple", "PIE"],
+        ["pies"],
+    ]
+    assert not find_mismatches(corpus, terms)
+    assert [TermIndex(terms).contains_any(tokens) for tokens in corpus] == [
+        True,
+        False,
+        False,
+        True,
+        False,
+    ]
@@ -0,0 +1,35 @@
+import os
+import pytest
+from lib.lexicon import Lexicon
+from scripts import process
+
+
+@pytest.fixture
+def lexicon_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(process, "LEXICON_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_word_lexicon_follows_its_source(lexicon_dir):
+    source = lexicon_dir / "french_words.txt"
+    source.write_text("Tarte\npomme\n\n", encoding="utf-8")
+    process.build_word_lexicon("french")
+    path = process.lexicon_path("french", "words")
+    assert set(Lexicon(path)) == {"tarte", "pomme"}
+
+    # An unchanged source keeps the lexicon, whatever the modification times
+    built = os.path.getmtime(path)
+    os.utime(source, (built + 10, built + 10))
+    process.build_word_lexicon("french")
+    assert os.path.getmtime(path) == built
+
+    # A changed source rebuilds it, even if it looks older than the lexicon
+    source.write_text("tarte\npoire\n", encoding="utf-8")
+    os.utime(source, (built - 10, built - 10))
+    process.build_word_lexicon("french")
+    assert set(Lexicon(path)) == {"tarte", "poire"}
+
+
+def test_missing_word_list_raises(lexicon_dir):
+    with pytest.raises(FileNotFoundError):
+        process.build_word_lexicon("german")
@@ -0,0 +1,5 @@
+ALTER TABLE `english_recipes` ADD `count` integer DEFAULT 1 NOT NULL;--> statement-breakpoint
+ALTER TABLE `french_recipes` ADD `count` integer DEFAULT 1 NOT NULL;--> statement-breakpoint
+ALTER TABLE `german_recipes` ADD `count` integer DEFAULT 1 NOT NULL;--> statement-breakpoint
+ALTER TABLE `italian_recipes` ADD `count` integer DEFAULT 1 NOT NULL;--> statement-breakpoint
+ALTER TABLE `spanish_recipes` ADD `count` integer DEFAULT 1 NOT NULL;
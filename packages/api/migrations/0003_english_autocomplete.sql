@@ -0,0 +1,4 @@
+CREATE TABLE `english_autocomplete` (
+	`prefix` text PRIMARY KEY NOT NULL,
+	`suggestions` text NOT NULL
+);
@@ -1,4 +1,5 @@
 const { execSync } = require("node:child_process");
+const crypto = require("node:crypto");
 const fs = require("node:fs");
 const path = require("node:path");
 
@@ -6,6 +7,59 @@ const path = require("node:path");
 const seedFile = path.join(__dirname, "/seed/seed.sql");
 const chunkSize = 5 * 1024 * 1024; // 5MB in bytes
 
+// Sharded seed sets written by `generate.py --shard-bytes/--shard-statements`
+const manifestFile = path.join(__dirname, "/seed/manifest.json");
+
+interface Shard {
+  file: string;
+  rows: number;
+  statements: number;
+  bytes: number;
+  sha256: string;
+}
+
+/**
+ * Execute a seed file against the local database using wrangler
+ * @param {string} filePath - Path to the SQL file
+ */
+function executeFile(filePath: string): void {
+  execSync(`wrangler d1 execute dishify_preview --local --file=${filePath}`, {
+    stdio: "inherit",
+  });
+}
+
+/**
+ * Load every shard listed in the manifest, in order, verifying its checksum first.
+ * Pass `--start=<n>` to resume from shard n after a failure.
+ */
+function seedFromManifest(): void {
+  const manifest: { rows: number; shards: Shard[] } = JSON.parse(fs.readFileSync(manifestFile, "utf8"));
+  const startArg = process.argv.find((arg) => arg.startsWith("--start="));
+  const start = startArg ? Number(startArg.slice("--start=".length)) : 1;
+
+  for (const [index, shard] of manifest.shards.entries()) {
+    const shardNumber = index + 1;
+    if (shardNumber < start) continue;
+
+    const shardFile = path.join(__dirname, "/seed/", shard.file);
+    const checksum = crypto.createHash("sha256").update(fs.readFileSync(shardFile)).digest("hex");
+    if (checksum !== shard.sha256) {
+      console.error(`Checksum mismatch in ${shard.file}, regenerate the seed files`);
+      process.exit(1);
+    }
+
+    console.log(`Seeding shard ${shardNumber} of ${manifest.shards.length} (${shard.rows} rows)`);
+    try {
+      executeFile(shardFile);
+    } catch (error) {
+      console.error(`Error seeding shard ${shardNumber}, resume with --start=${shardNumber}:`, error);
+      process.exit(1);
+    }
+  }
+
+  console.log(`Seeding complete (${manifest.rows} rows)`);
+}
+
 /**
  * Generator function to read the seed file in chunks, ensuring SQL statements are not split
  * @param {string} filePath - Path to the seed file
@@ -46,29 +100,55 @@ function* chunkedReadAtStatementBoundary(filePath: string, chunkSize: number): G
   }
 }
 
-// Process and execute seed data in chunks
-let chunkIndex = 0;
-for (const chunk of chunkedReadAtStatementBoundary(seedFile, chunkSize)) {
-  if (chunk.trim()) {
-    chunkIndex++;
-    console.log(`Seeding chunk ${chunkIndex}`);
+/**
+ * Split the single seed file at statement boundaries and execute it chunk by chunk
+ */
+function seedFromFile(): void {
+  let chunkIndex = 0;
+  for (const chunk of chunkedReadAtStatementBoundary(seedFile, chunkSize)) {
+    if (chunk.trim()) {
+      chunkIndex++;
+      console.log(`Seeding chunk ${chunkIndex}`);
 
-    // Write the chunk to a temporary file
-    const tempFile = path.join(__dirname, `/seed/temp_seed_${chunkIndex}.sql`);
-    fs.writeFileSync(tempFile, chunk);
+      // Write the chunk to a temporary file
+      const tempFile = path.join(__dirname, `/seed/temp_seed_${chunkIndex}.sql`);
+      fs.writeFileSync(tempFile, chunk);
 
-    try {
-      // Execute the SQL statements using wrangler
-      execSync(`wrangler d1 execute dishify_preview --local --file=${tempFile}`, {
-        stdio: "inherit",
-      });
-    } catch (error) {
-      console.error(`Error seeding chunk ${chunkIndex}:`, error);
-    } finally {
-      // Clean up the temporary file
-      fs.unlinkSync(tempFile);
+      try {
+        // Execute the SQL statements using wrangler
+        executeFile(tempFile);
+      } catch (error) {
+        console.error(`Error seeding chunk ${chunkIndex}:`, error);
+      } finally {
+        // Clean up the temporary file
+        fs.unlinkSync(tempFile);
+      }
     }
   }
+
+  console.log("Seeding complete");
 }
 
-console.log("Seeding complete");
+/**
+ * Get the modification time of a seed file
+ * @param {string} filePath - Path to the seed file or manifest
+ * @returns {number} Modification time in milliseconds, or -1 if the file does not exist
+ */
+function modifiedTime(filePath: string): number {
+  return fs.existsSync(filePath) ? fs.statSync(filePath).mtimeMs : -1;
+}
+
+// Load whichever seed set was generated last, so a manifest left over from an
+// earlier sharded run does not shadow a newer seed.sql, or the other way round
+const manifestTime = modifiedTime(manifestFile);
+const seedTime = modifiedTime(seedFile);
+if (manifestTime < 0 && seedTime < 0) {
+  console.error(`No seed files found, expected ${seedFile} or ${manifestFile}`);
+  process.exit(1);
+} else if (manifestTime >= seedTime) {
+  console.log(`Using the sharded seed set in ${manifestFile}${seedTime < 0 ? "" : ", which is newer than seed.sql"}`);
+  seedFromManifest();
+} else {
+  console.log(`Using ${seedFile}${manifestTime < 0 ? "" : ", which is newer than manifest.json"}`);
+  seedFromFile();
+}
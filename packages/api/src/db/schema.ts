@@ -1,5 +1,5 @@
 import type { InferInsertModel, InferSelectModel } from "drizzle-orm";
-import { sqliteTable, text, uniqueIndex } from "drizzle-orm/sqlite-core";
+import { integer, sqliteTable, text, uniqueIndex } from "drizzle-orm/sqlite-core";
 import { createInsertSchema, createSelectSchema } from "drizzle-valibot";
 
 // User
@@ -18,6 +18,8 @@ export const EnglishRecipeNameTable = sqliteTable(
   "english_recipes",
   {
     name: text("name").primaryKey().notNull(),
+    // Number of times the name occurs in the source datasets
+    count: integer("count").notNull().default(1),
   },
   (table) => ({
     nameIdx: uniqueIndex("name_idx").on(table.name),
@@ -28,9 +30,21 @@ export type InsertEnglishRecipeName = InferInsertModel<typeof EnglishRecipeNameT
 export const insertEnglishRecipeNameSchema = createInsertSchema(EnglishRecipeNameTable);
 export const selectEnglishRecipeNameSchema = createSelectSchema(EnglishRecipeNameTable);
 
+// English autocomplete prefix table, seeded by data_utils/scripts/generate.py --autocomplete
+export const EnglishAutocompleteTable = sqliteTable("english_autocomplete", {
+  prefix: text("prefix").primaryKey().notNull(),
+  // JSON array of the best completions of the prefix
+  suggestions: text("suggestions").notNull(),
+});
+export type EnglishAutocomplete = InferSelectModel<typeof EnglishAutocompleteTable>;
+export type InsertEnglishAutocomplete = InferInsertModel<typeof EnglishAutocompleteTable>;
+export const insertEnglishAutocompleteSchema = createInsertSchema(EnglishAutocompleteTable);
+export const selectEnglishAutocompleteSchema = createSelectSchema(EnglishAutocompleteTable);
+
 // Spanish recipe name table
 export const SpanishRecipeNameTable = sqliteTable("spanish_recipes", {
   name: text("name").primaryKey(),
+  count: integer("count").notNull().default(1),
 });
 export type SpanishRecipeName = InferSelectModel<typeof SpanishRecipeNameTable>;
 export type InsertSpanishRecipeName = InferInsertModel<typeof SpanishRecipeNameTable>;
@@ -40,6 +54,7 @@ export const selectSpanishRecipeNameSchema = createSelectSchema(SpanishRecipeNam
 // German recipe name table
 export const GermanRecipeNameTable = sqliteTable("german_recipes", {
   name: text("name").primaryKey(),
+  count: integer("count").notNull().default(1),
 });
 export type GermanRecipeName = InferSelectModel<typeof GermanRecipeNameTable>;
 export type InsertGermanRecipeName = InferInsertModel<typeof GermanRecipeNameTable>;
@@ -49,6 +64,7 @@ export const selectGermanRecipeNameSchema = createSelectSchema(GermanRecipeNameT
 // French recipe name table
 export const FrenchRecipeNameTable = sqliteTable("french_recipes", {
   name: text("name").primaryKey(),
+  count: integer("count").notNull().default(1),
 });
 export type FrenchRecipeName = InferSelectModel<typeof FrenchRecipeNameTable>;
 export type InsertFrenchRecipeName = InferInsertModel<typeof FrenchRecipeNameTable>;
@@ -58,6 +74,7 @@ export const selectFrenchRecipeNameSchema = createSelectSchema(FrenchRecipeNameT
 // Italian recipe name table
 export const ItalianRecipeNameTable = sqliteTable("italian_recipes", {
   name: text("name").primaryKey(),
+  count: integer("count").notNull().default(1),
 });
 export type ItalianRecipeName = InferSelectModel<typeof ItalianRecipeNameTable>;
 export type InsertItalianRecipeName = InferInsertModel<typeof ItalianRecipeNameTable>;